@@ -1,12 +1,38 @@
 import logging
+from typing import Any, Iterable
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.helpers.typing import ConfigType
 import voluptuous as vol
-from homeassistant.const import CONF_NAME
+from homeassistant.const import CONF_NAME, EVENT_HOMEASSISTANT_STOP
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 
-from .const import DOMAIN
+from .const import (
+    ATTR_ZONES,
+    CONF_GATEWAY_BURST,
+    CONF_GATEWAY_RATE,
+    CONF_GLOBAL_BURST,
+    CONF_GLOBAL_RATE,
+    CONF_HUB,
+    CONF_MAX_COMPRESSORS,
+    CONF_RATE_LIMIT,
+    CONF_STAGGER,
+    DEF_MAX_COMPRESSORS,
+    DEF_RATE_GATEWAY,
+    DEF_RATE_GATEWAY_BURST,
+    DEF_RATE_GLOBAL,
+    DEF_RATE_GLOBAL_BURST,
+    DEF_STAGGER_SEC,
+    DOMAIN,
+    SERVICE_DUMP_DECISIONS,
+    SERVICE_PROVISION_HELPERS,
+    SERVICE_SET_PARAMS,
+)
+from .coordinator import ThermoAdaptCoordinator, _load_params_from_helpers
+from .helpers import ensure_helpers_bulk, state_float
+from .pacing import PacingConfig, async_get_rate_limiter, async_setup_pacing
+from .params import INT_PARAMS, PARAMS, param_entity_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,11 +42,33 @@ _LOGGER = logging.getLogger(__name__)
 # Users who still prefer configuration.yaml can supply entities manually.
 # In a typical setup the UI Config-Flow will be used instead, but we keep
 # this schema for backward-compatibility.
+#
+# The reserved `rate_limit` key holds the domain-wide pacing settings (zone
+# stagger window and outbound command rate limits) – see pacing.py.  The
+# reserved `hub` key switches to whole-house evaluation – see hub.py.
 # -----------------------------------------------------------------------------
+RATE_LIMIT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_GLOBAL_RATE,   default=DEF_RATE_GLOBAL):        vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_GLOBAL_BURST,  default=DEF_RATE_GLOBAL_BURST):  vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_GATEWAY_RATE,  default=DEF_RATE_GATEWAY):       vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_GATEWAY_BURST, default=DEF_RATE_GATEWAY_BURST): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_STAGGER,       default=DEF_STAGGER_SEC):        vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+
+HUB_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_MAX_COMPRESSORS, default=DEF_MAX_COMPRESSORS): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.Schema(
             {
+                vol.Optional(CONF_RATE_LIMIT): RATE_LIMIT_SCHEMA,
+                vol.Optional(CONF_HUB): vol.Any(None, HUB_SCHEMA),
                 cv.string: vol.Schema(
                     {
                         # ─── entidades obrigatórias ──────────────────────────
@@ -33,11 +81,12 @@ CONFIG_SCHEMA = vol.Schema(
                         vol.Optional("trv_entity"):cv.entity_id,        # válvula TRV (aquecimento)
 
                         # ─── parâmetros de conforto (opcionais; se ausentes,
-                        #      defaults de const.py serão aplicados) ─────────
+                        #      defaults de params.py serão aplicados) ─────────
                         vol.Optional("temp_min"):   vol.Coerce(float),
                         vol.Optional("temp_max"):   vol.Coerce(float),
                         vol.Optional("setpoint"):   vol.Coerce(float),
                         vol.Optional("deadband"):   vol.Coerce(float),
+                        vol.Optional("deadband_heat"): vol.Coerce(float),
                         vol.Optional("humid_max"):  vol.Coerce(int),
                         vol.Optional("heat_base"):  vol.Coerce(float),
                         vol.Optional("k_heat"):     vol.Coerce(float),
@@ -52,12 +101,123 @@ CONFIG_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
+PROVISION_HELPERS_SCHEMA = vol.Schema(
+    {vol.Required(ATTR_ZONES): vol.All(cv.ensure_list, [cv.slug])}
+)
+
+# Partial parameter set of one zone – every value checked against its slider range
+PARAMS_UPDATE_SCHEMA = vol.All(
+    vol.Schema({
+        vol.Optional(slug): vol.All(
+            vol.Coerce(int if slug in INT_PARAMS else float),
+            vol.Range(min=spec.min, max=spec.max),
+        )
+        for slug, spec in PARAMS.items()
+    }),
+    vol.Length(min=1),
+)
+
+SET_PARAMS_SCHEMA = vol.Schema(
+    {vol.Required(ATTR_ZONES): vol.All({cv.slug: PARAMS_UPDATE_SCHEMA}, vol.Length(min=1))}
+)
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
-    """Legacy YAML setup. Simply bootstrap the integration namespace."""
+    """Legacy YAML setup. Bootstrap the integration namespace and services."""
     hass.data.setdefault(DOMAIN, {})
+
+    rl = config.get(DOMAIN, {}).get(CONF_RATE_LIMIT) or RATE_LIMIT_SCHEMA({})
+    async_setup_pacing(
+        hass,
+        PacingConfig(
+            global_rate=rl[CONF_GLOBAL_RATE],
+            global_burst=rl[CONF_GLOBAL_BURST],
+            gateway_rate=rl[CONF_GATEWAY_RATE],
+            gateway_burst=rl[CONF_GATEWAY_BURST],
+            stagger=rl[CONF_STAGGER],
+        ),
+    )
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_STOP, lambda _event: async_get_rate_limiter(hass).async_shutdown()
+    )
+
+    if CONF_HUB in config.get(DOMAIN, {}):  # `hub:` alone enables it without a cap
+        from .hub import async_get_hub, async_setup_hub  # whole-house mode only
+
+        hub_cfg = config[DOMAIN][CONF_HUB] or HUB_SCHEMA({})
+        async_setup_hub(hass, hub_cfg[CONF_MAX_COMPRESSORS])
+
+        async def _async_stop_hub(_event) -> None:
+            if (hub := async_get_hub(hass)) is not None:
+                await hub.async_shutdown()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_hub)
+
+    async def _async_provision_helpers(call: ServiceCall) -> None:
+        """Create the missing helpers of every listed zone in one pass."""
+        zones = call.data[ATTR_ZONES]
+        created = await ensure_helpers_bulk(hass, zones)
+        _LOGGER.info("Provisioned %d helper(s) for %d zone(s)", created, len(zones))
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROVISION_HELPERS, _async_provision_helpers,
+        schema=PROVISION_HELPERS_SCHEMA,
+    )
+
+    async def _async_set_params(call: ServiceCall) -> None:
+        """Retune many zones at once: all or nothing, one recompute per zone.
+
+        Ranges are checked by the schema; here every zone must be loaded
+        before any slider is touched.
+        """
+        updates: dict[str, dict[str, float]] = call.data[ATTR_ZONES]
+        zones = _zones_loaded(hass, updates, "numbers")
+        changed = [
+            zone for zone, values in updates.items()
+            if zones[zone]["coordinator"].async_set_params(values)
+        ]
+        _LOGGER.info(
+            "Updated parameters of %d zone(s), %d changed", len(updates), len(changed)
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_PARAMS, _async_set_params, schema=SET_PARAMS_SCHEMA
+    )
+
+    async def _async_dump_decisions(call: ServiceCall) -> ServiceResponse:
+        """Write each zone's decision log to <config>/thermoadapt_decisions_<zone>.csv."""
+        zones = _zones_loaded(hass, call.data[ATTR_ZONES], "coordinator")
+        dumped: dict[str, Any] = {}
+        for zone in call.data[ATTR_ZONES]:
+            log = zones[zone]["coordinator"].decisions
+            path = hass.config.path(f"thermoadapt_decisions_{zone}.csv")
+            await hass.async_add_executor_job(_write_text, path, log.as_csv())
+            dumped[zone] = {"path": path, "rows": len(log)}
+        _LOGGER.info("Dumped the decision log of %d zone(s)", len(dumped))
+        return dumped
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_DUMP_DECISIONS, _async_dump_decisions,
+        schema=PROVISION_HELPERS_SCHEMA,  # same shape – a list of zones
+        supports_response=SupportsResponse.OPTIONAL,
+    )
     return True
 
 
+def _zones_loaded(hass: HomeAssistant, names: Iterable[str], key: str) -> dict[str, Any]:
+    """hass.data[DOMAIN]; raises unless every zone in *names* has *key* set up."""
+    zones = hass.data.get(DOMAIN, {})
+    unknown = [z for z in names if not isinstance(zones.get(z), dict) or key not in zones[z]]
+    if unknown:
+        raise ServiceValidationError(f"Unknown or not loaded zone(s): {', '.join(unknown)}")
+    return zones
+
+
+def _write_text(path: str, text: str) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        fh.write(text)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """UI-driven setup (Config-Flow).
 
@@ -81,11 +241,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # ------------------------------------------------------------------
     # Store runtime data for this zone so that other platform files can
     # retrieve configuration and units without parsing the entry again.
+    # The coordinator lives here (not in a platform) because both the
+    # climate and the sensor platform attach to it.
     # ------------------------------------------------------------------
+    coordinator = ThermoAdaptCoordinator(
+        hass, entry, _load_params_from_helpers(hass, zone, entry.options)
+    )
     hass.data[DOMAIN][zone] = {
-        "zone":   zone,
-        "config": cfg,
-        "unit":   unit,
+        "zone":        zone,
+        "config":      cfg,
+        "unit":        unit,
+        "coordinator": coordinator,
     }
 
     # ------------------------------------------------------------------
@@ -93,10 +259,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     #   number  → sliders (dead-band, set-point…)
     #   switch  → master enable toggle
     #   climate → adaptive logic entity (ThermoAdaptClimate)
+    #   sensor  → set-point / balance / running mean + diagnostic metrics
     # ------------------------------------------------------------------
     await hass.config_entries.async_forward_entry_setups(
-        entry, ["number", "switch", "climate"]
+        entry, ["number", "switch", "climate", "sensor"]
     )
 
+    # Options-flow edits are applied live (no entry reload)
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+
     return True
 
+
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Push edited comfort options to the sliders and the running coordinator."""
+    zone = entry.data[CONF_NAME]
+
+    for slug in PARAMS:
+        if slug not in entry.options:
+            continue
+        eid = param_entity_id(zone, slug)
+        value = float(entry.options[slug])
+        if state_float(hass.states.get(eid)) == value:
+            continue
+        try:
+            await hass.services.async_call(
+                "number", "set_value", {"entity_id": eid, "value": value}, blocking=True
+            )
+        except Exception as exc:  # out of slider range, entity missing…
+            _LOGGER.warning("[%s] Could not apply option %s=%s: %s", zone, slug, value, exc)
+
+    if (coordinator := hass.data[DOMAIN][zone].get("coordinator")) is not None:
+        coordinator.async_apply_options()
+
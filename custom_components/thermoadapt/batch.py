@@ -0,0 +1,179 @@
+"""ThermoAdapt – batch set-point engine
+
+Vectorised counterpart of ``tset_cool`` / ``tset_heat`` for whole-house
+recomputes and for re-evaluating long recorder series without a Python-level
+loop per sample.  NumPy is used when available; a pure-Python fallback gives
+the same numbers (both follow the scalar arithmetic operation by operation, so
+results are bit-identical to ``helpers.tset_cool`` / ``helpers.tset_heat``).
+
+Season selection mirrors ``ThermoAdaptCoordinator``: the cooling equation is
+used when ``t_out`` is above the cooling balance temperature
+``tc_base - q_int / ua_total``, the heating equation otherwise.  Values are
+*not* rounded; the coordinator rounds to 0.1 °C for display.
+
+Shapes follow NumPy broadcasting: a series of outdoor temperatures against one
+zone (``T`` × scalar), one outdoor sample against many zones (scalar × ``Z``),
+paired arrays (``N`` × ``N``) or, with ``t_out[:, None]``, a full ``T`` × ``Z``
+grid.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from importlib.util import find_spec
+from typing import Any, Iterable, Sequence
+
+from .models import ComfortParams
+
+# NumPy ships with Home Assistant core, but stay usable without it.  It is only
+# imported on the first batch evaluation, not when the integration loads
+# (~80 ms that nothing at startup needs).
+HAS_NUMPY: bool = find_spec("numpy") is not None
+
+
+def _np():
+    import numpy  # noqa: PLC0415 – cached in sys.modules after the first call
+
+    return numpy
+
+
+@dataclass(slots=True)
+class ComfortParamsArray:
+    """Struct-of-arrays view of many zones' ``ComfortParams``.
+
+    Only the coefficients used by the set-point equations are carried; each
+    field is a sequence (or NumPy array) with one value per zone.
+    """
+
+    tc_base: Sequence[float]
+    tc_min: Sequence[float]
+    th_base: Sequence[float]
+    k_heat: Sequence[float]
+    ua_total: Sequence[float]
+    q_int: Sequence[float]
+
+    @classmethod
+    def from_params(cls, params: Iterable[ComfortParams]) -> ComfortParamsArray:
+        """Transpose a list of per-zone ``ComfortParams``."""
+        plist = list(params)
+        cols = {f.name: [getattr(p, f.name) for p in plist] for f in fields(cls)}
+        if HAS_NUMPY:
+            np = _np()
+            return cls(**{k: np.asarray(v, dtype=float) for k, v in cols.items()})
+        return cls(**cols)
+
+    def __len__(self) -> int:
+        return len(self.tc_base)
+
+
+@dataclass(slots=True)
+class BatchResult:
+    """Set-points and chosen season (``cooling`` True → cooling equation)."""
+
+    setpoint: Any  # numpy.ndarray[float] | list[float] | float
+    cooling: Any   # numpy.ndarray[bool]  | list[bool]  | bool
+
+
+# -----------------------------------------------------------------------------
+# Public API
+# -----------------------------------------------------------------------------
+
+def evaluate_setpoints(
+    t_out: float | Sequence[float],
+    params: ComfortParams | ComfortParamsArray,
+    *,
+    use_numpy: bool | None = None,
+) -> BatchResult:
+    """Evaluate the adaptive set-point for every (t_out, zone) combination.
+
+    Args:
+        t_out: outdoor temperature(s) in °C – scalar, sequence or ndarray.
+        params: one zone's ``ComfortParams`` or a ``ComfortParamsArray``.
+        use_numpy: force (True) or disable (False) the NumPy path; by default
+            NumPy is used when installed.
+    """
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY
+    if use_numpy:
+        if not HAS_NUMPY:
+            raise RuntimeError("NumPy is not installed")
+        return _evaluate_numpy(t_out, params)
+    return _evaluate_python(t_out, params)
+
+
+# -----------------------------------------------------------------------------
+# NumPy implementation
+# -----------------------------------------------------------------------------
+
+def _evaluate_numpy(t_out, params) -> BatchResult:
+    np = _np()
+    t = np.asarray(t_out, dtype=float)
+    tc_base = np.asarray(params.tc_base, dtype=float)
+    tc_min = np.asarray(params.tc_min, dtype=float)
+    th_base = np.asarray(params.th_base, dtype=float)
+    k_heat = np.asarray(params.k_heat, dtype=float)
+    q_ua = np.asarray(params.q_int, dtype=float) / np.asarray(params.ua_total, dtype=float)
+
+    t_bal_cool = tc_base - q_ua
+    t_bal_heat = th_base - q_ua
+    cooling = t > t_bal_cool
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d_cool = t - t_bal_cool
+        k_cool = (tc_base - tc_min) / d_cool
+        sp_cool = tc_base - k_cool * d_cool
+    sp_heat = np.where(t >= t_bal_heat, th_base, th_base + k_heat * (t_bal_heat - t))
+
+    setpoint = np.where(cooling, sp_cool, sp_heat)
+    if setpoint.ndim == 0:
+        return BatchResult(setpoint=float(setpoint), cooling=bool(cooling))
+    return BatchResult(setpoint=setpoint, cooling=cooling)
+
+
+# -----------------------------------------------------------------------------
+# Pure-Python fallback
+# -----------------------------------------------------------------------------
+
+def _setpoint(t_out: float, tc_base, tc_min, th_base, k_heat, ua_total, q_int) -> tuple[float, bool]:
+    """Scalar reference – same operations as helpers.tset_cool/tset_heat."""
+    t_bal = tc_base - q_int / ua_total
+    if t_out > t_bal:
+        k_cool = (tc_base - tc_min) / (t_out - t_bal)
+        return tc_base - k_cool * (t_out - t_bal), True
+    t_bal = th_base - q_int / ua_total
+    return (th_base if t_out >= t_bal else th_base + k_heat * (t_bal - t_out)), False
+
+
+def _evaluate_python(t_out, params) -> BatchResult:
+    if isinstance(params, ComfortParams):
+        cols = [[getattr(params, f.name)] for f in fields(ComfortParamsArray)]
+        n_zones = None
+    else:
+        cols = [list(getattr(params, f.name)) for f in fields(ComfortParamsArray)]
+        n_zones = len(cols[0])
+
+    scalar_t = not isinstance(t_out, Iterable)
+    temps = [float(t_out)] if scalar_t else [float(t) for t in t_out]
+
+    if n_zones is None:          # one zone, scalar or series of t_out
+        pairs = ((t, 0) for t in temps)
+    elif scalar_t:               # one t_out, many zones
+        pairs = ((temps[0], z) for z in range(n_zones))
+    elif len(temps) == n_zones:  # paired
+        pairs = zip(temps, range(n_zones))
+    else:
+        raise ValueError(
+            f"t_out has {len(temps)} samples but params has {n_zones} zones; "
+            "use the NumPy path for outer products"
+        )
+
+    setpoint: list[float] = []
+    cooling: list[bool] = []
+    for t, z in pairs:
+        sp, cool = _setpoint(t, *(c[z] for c in cols))
+        setpoint.append(sp)
+        cooling.append(cool)
+
+    if scalar_t and n_zones is None:
+        return BatchResult(setpoint=setpoint[0], cooling=cooling[0])
+    return BatchResult(setpoint=setpoint, cooling=cooling)
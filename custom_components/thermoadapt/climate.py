@@ -2,14 +2,22 @@
 
 Implements the Dear & Brager (1998, 2001) adaptive comfort equations for both
 cooling and heating.  Drives a split-AC (climate.*) and, optionally, a smart
-TRV (number.*) in the same zone.
+TRV (number.*) in the same zone.  Every tick is appended to the zone's decision
+log (``decisions``).  While in HEAT the TRV target is adjusted by the zone's
+``TrvController`` (PI, own cadence, write budget – see ``trv``).
+
+The state is written only when something visible changed (mode, set-point,
+parameters, availability, or a reading moved by *state_epsilon*); a steady
+zone no longer adds a state-machine event and a recorder row every tick.  The
+high-churn diagnostic attributes are kept out of the recorder.
 """
 
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
-from typing import Final
+from dataclasses import asdict, dataclass, field
+from time import monotonic, time
+from typing import Any, Final, Mapping
 
 from homeassistant.components.climate import (
     ClimateEntity,
@@ -18,55 +26,106 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature, CONF_NAME
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-
-from .helpers import tset_cool, tset_heat
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.restore_state import ExtraStoredData, RestoreEntity
+from homeassistant.helpers.start import async_at_started
+
+from .commands import CommandStats, DeviceCommand, async_get_command_queue
+from .const import CONF_HUM_IN, CONF_TEMP_IN, DOMAIN, PRIORITY_SAFETY, TRV_MAX_INTERVAL_SEC
+from .coordinator import ThermoAdaptCoordinator
+from .decisions import CMD_AC, CMD_SAFETY, CMD_TRV, EQ_HEAT
+from .metrics import (
+    STAGE_APPLY_MODE,
+    STAGE_DECISION,
+    STAGE_SENSOR_READ,
+    STAGE_STATE_WRITE,
+    now_ns,
+)
 from .models import ComfortParams
-from .number import PARAMS  # reuse default values
 
 _LOGGER: Final = logging.getLogger(__name__)
-SCAN_INTERVAL: Final = timedelta(seconds=30)
 
 # -----------------------------------------------------------------------------
-# Coordinator – reads sensors & calculates adaptive set-point
+# Warm start – what the zone had decided and commanded before a restart
 # -----------------------------------------------------------------------------
 
-class ThermoAdaptCoordinator(DataUpdateCoordinator[float]):
-    """Periodically provides the adaptive set-point (°C)."""
+@dataclass(slots=True)
+class ZoneRestoreData(ExtraStoredData):
+    """Last set-point, HVAC mode and per-actuator command of one zone."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, params: ComfortParams):
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=f"thermoadapt_{entry.data[CONF_NAME]}",
-            update_interval=SCAN_INTERVAL,
-        )
-        self.entry = entry
-        self.params = params
+    setpoint: float | None = None
+    hvac_mode: str = HVACMode.OFF
+    commanded: dict[str, dict[str, Any]] = field(default_factory=dict)
 
-    async def _async_update_data(self) -> float:  # type: ignore[override]
-        s = self.hass.states
-        t_out = float(s.get(self.entry.data["temp_out"]).state)
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
 
-        # Choose equation based on outdoor vs. balance temperature
-        sp = (
-            tset_cool(t_out, self.params)
-            if t_out > (self.params.tc_base - self.params.q_int / self.params.ua_total)
-            else tset_heat(t_out, self.params)
-        )
-        _LOGGER.debug("[%s] Adaptive set-point %.1f °C (Tout %.1f °C)", self.entry.data[CONF_NAME], sp, t_out)
-        return round(sp, 1)
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> ZoneRestoreData | None:
+        try:
+            return cls(
+                setpoint=None if data.get("setpoint") is None else float(data["setpoint"]),
+                hvac_mode=HVACMode(data.get("hvac_mode", HVACMode.OFF)),
+                commanded={
+                    eid: dict(cmd) for eid, cmd in (data.get("commanded") or {}).items()
+                },
+            )
+        except (TypeError, ValueError):
+            return None
+
+
+def _command_from_dict(data: Mapping[str, Any]) -> DeviceCommand:
+    mode = data.get("hvac_mode")
+    return DeviceCommand(
+        data["entity_id"],
+        HVACMode(mode) if mode is not None else None,
+        data.get("temperature"),
+    )
+
+
+def _attr_float(value: Any) -> float | None:
+    try:
+        return None if value is None else float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _moved(new: tuple[float | None, ...], old: tuple[float | None, ...], eps: float) -> bool:
+    """True when any reading changed by at least *eps* (or became/stopped being None)."""
+    for a, b in zip(new, old):
+        if a is None or b is None:
+            if a is not b:
+                return True
+        elif a != b and abs(a - b) >= eps:
+            return True
+    return False
 
 
 # -----------------------------------------------------------------------------
 # Climate Entity – applies coordinator output to devices
 # -----------------------------------------------------------------------------
 
-class ThermoAdaptClimate(ClimateEntity):
+class ThermoAdaptClimate(RestoreEntity, ClimateEntity):
     _attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_should_poll = False  # pushed by the coordinator
+    _attr_hvac_modes = [HVACMode.OFF, HVACMode.COOL, HVACMode.HEAT, HVACMode.DRY]
+    _enable_turn_on_off_backwards_compatibility = False
+    # Change with every command / sample – diagnostics, not history
+    _unrecorded_attributes = frozenset({
+        "outdoor_temperature",  # recorded by the outdoor sensor itself
+        "commands_sent",
+        "commands_skipped",
+        "commands_cancelled",
+        "commands_failed",
+        "suppressed_min_run",
+        "suppressed_min_off",
+        "suppressed_cap",
+        "filters",
+        "trv",
+    })
 
     def __init__(
         self,
@@ -82,23 +141,21 @@ class ThermoAdaptClimate(ClimateEntity):
         self._climate_entity = entry.data["climate_entity"]
         self._trv_entity = entry.data.get("trv_entity")
 
-        # Read dead-band slider once; updates will be caught via helpers → params in next release.
-        def _slider(slug: str, default: float) -> float:
-            st = hass.states.get(f"number.thermoadapt_{self._zone}_{slug}")
-            try:
-                return float(st.state) if st and st.state not in ("unknown", "unavailable") else default
-            except (TypeError, ValueError):
-                return default
-
-        self._deadband_cool = _slider("deadband", PARAMS["deadband"][-1])
-        self._deadband_heat = self._deadband_cool  # using same slider for heat for now
-
         self._attr_name = f"ThermoAdapt {self._zone.capitalize()}"
         self._attr_unique_id = f"thermoadapt_{self._zone}"
 
-        # Initial state
+        # Initial state (replaced by the restored one, see async_added_to_hass)
         self._attr_target_temperature = None
         self._attr_hvac_mode = HVACMode.OFF
+        self._reconcile = False  # first tick after a restore re-checks devices
+        self._attr_current_temperature = None
+        self._attr_current_humidity = None
+        # slider values for the Lovelace card, rebuilt only when params change
+        self._params_attr: tuple[ComfortParams, dict[str, float]] | None = None
+        self._cmd_flags = 0  # decisions.CMD_* submitted during the current tick
+        self._unsub_trv: CALLBACK_TYPE | None = None  # next TRV loop step
+        # last written (discrete fields, readings) – see _state_changed
+        self._written: tuple[tuple[Any, ...], tuple[float | None, ...]] | None = None
 
     # ------------------------------------------------------------------
     # Home Assistant hooks
@@ -108,110 +165,314 @@ class ThermoAdaptClimate(ClimateEntity):
         return self.coordinator.last_update_success
 
     async def async_added_to_hass(self) -> None:
+        """Restore the last decision and defer the first refresh.
+
+        The entity comes up immediately with the restored mode/set-point; the
+        zone subscribes to its inputs and computes for the first time in the
+        background once Home Assistant has started, so zones do not hold up
+        startup nor fire a command burst while sensors come up.
+        """
+        await super().async_added_to_hass()
+        if (extra := await self.async_get_last_extra_data()) is not None and (
+            restored := ZoneRestoreData.from_dict(extra.as_dict())
+        ) is not None:
+            self._async_restore(restored)
+
         self.async_on_remove(
             self.coordinator.async_add_listener(self._handle_coordinator_update)
         )
-        await self.coordinator.async_config_entry_first_refresh()
+        self.async_on_remove(async_at_started(self.hass, self._async_start_refresh))
+        self.async_on_remove(self._cancel_trv_step)
+
+    @callback
+    def _async_restore(self, restored: ZoneRestoreData) -> None:
+        self._attr_target_temperature = restored.setpoint
+        self._attr_hvac_mode = restored.hvac_mode
+        self.coordinator.controller.restore(restored.hvac_mode)
+        self._reconcile = True
+        for eid in filter(None, (self._climate_entity, self._trv_entity)):
+            queue = async_get_command_queue(self.hass, eid)
+            if queue.last_command is None and (cmd := restored.commanded.get(eid)):
+                queue.last_command = _command_from_dict(cmd)
+        _LOGGER.debug("[%s] Restored %s / %s", self._zone, restored.hvac_mode, restored.setpoint)
+
+    @callback
+    def _async_start_refresh(self, _hass: HomeAssistant) -> None:
+        self.entry.async_create_background_task(
+            self.hass, self._async_first_refresh(), f"thermoadapt first refresh {self._zone}"
+        )
+
+    async def _async_first_refresh(self) -> None:
+        # estimator state first: async_start lets the entity feed it samples
+        await self.coordinator.async_load_thermal()
+        self.async_on_remove(self.coordinator.async_start())
+        await self.coordinator.async_recompute()
+
+    @property
+    def extra_restore_state_data(self) -> ZoneRestoreData:
+        commanded: dict[str, dict[str, Any]] = {}
+        for eid in filter(None, (self._climate_entity, self._trv_entity)):
+            if (cmd := async_get_command_queue(self.hass, eid).last_command) is not None:
+                commanded[eid] = asdict(cmd)
+        return ZoneRestoreData(self._attr_target_temperature, self._attr_hvac_mode, commanded)
 
     # ------------------------------------------------------------------
     # Coordinator callback
     # ------------------------------------------------------------------
     @callback
     def _handle_coordinator_update(self) -> None:
-        sp: float = self.coordinator.data
+        decision = self.coordinator.decision
+        sp = decision.setpoint if decision is not None else self.coordinator.data
+        if sp is None or not self.coordinator.last_update_success:
+            # No valid set-point (outdoor sensor down, zone not computed yet):
+            # keep the restored / last set-point and mode, command nothing and
+            # only report the availability change.
+            if self._state_changed():
+                self.async_write_ha_state()
+            return
+
+        m = self.coordinator.metrics
+        if m is not None:
+            t0 = now_ns()
+
+        if decision is not None:  # hub mode – inputs already read, mode decided
+            t_in, hum = decision.t_in, decision.hum
+        else:
+            t_in = self.coordinator.read_input(CONF_TEMP_IN)  # filtered (see filters)
+            hum = self.coordinator.read_input(CONF_HUM_IN)
         self._attr_target_temperature = sp
+        self._attr_current_temperature = t_in
+        self._attr_current_humidity = hum
 
-        t_in_state = self.hass.states.get(self.entry.data["temp_in"])
-        try:
-            t_in = float(t_in_state.state) if t_in_state and t_in_state.state not in ("unknown", "unavailable") else None
-        except ValueError:
-            t_in = None
+        if m is not None:
+            m.record(STAGE_SENSOR_READ, t0)
 
+        mode_before = self._attr_hvac_mode
+        self._cmd_flags = 0
         if t_in is None:
             _LOGGER.warning("[%s] Indoor temperature sensor unavailable.", self._zone)
+            self._record_decision(sp, t_in, hum, mode_before)
             return
 
-        mode_before = self._attr_hvac_mode
+        device = self.hass.states.get(self._climate_entity)
+        self.coordinator.async_observe_thermal(
+            t_in,
+            mode_before == HVACMode.OFF and device is not None and device.state == HVACMode.OFF,
+        )
 
-        # Decide HVAC mode based on dead-bands
-        if t_in > sp + self._deadband_cool:
-            self._attr_hvac_mode = HVACMode.COOL
-        elif t_in < sp - self._deadband_heat:
-            self._attr_hvac_mode = HVACMode.HEAT if self._trv_entity else HVACMode.OFF
+        # Decide HVAC mode – hysteresis, min run/off times, humidity (DRY)
+        if m is not None:
+            t0 = now_ns()
+        if decision is not None:
+            self._attr_hvac_mode = decision.mode
+        else:
+            self._attr_hvac_mode = self.coordinator.controller.step(
+                monotonic(), t_in, sp, self.coordinator.params, hum, has_trv=bool(self._trv_entity)
+            )
+        if m is not None:
+            m.record(STAGE_DECISION, t0)
+
+        if self._attr_hvac_mode != mode_before or self._reconcile:
+            # After a restore the mode may be unchanged while a device drifted;
+            # the command queue skips whatever the devices already report.
+            self._reconcile = False
+            if m is not None:
+                m.mode_flips += self._attr_hvac_mode != mode_before
+                t0 = now_ns()
+                self._apply_mode(sp)
+                m.record(STAGE_APPLY_MODE, t0)
+            else:
+                self._apply_mode(sp)
+        self._record_decision(sp, t_in, hum, mode_before)
+
+        if not self._state_changed():
+            if m is not None:
+                m.writes_skipped += 1
+            return
+        if m is not None:
+            t0 = now_ns()
+            self.async_write_ha_state()
+            m.record(STAGE_STATE_WRITE, t0)
+            m.state_writes += 1
         else:
-            self._attr_hvac_mode = HVACMode.OFF
+            self.async_write_ha_state()
 
-        if self._attr_hvac_mode != mode_before:
-            self.hass.async_create_task(self._apply_mode(sp))
+    def _record_decision(
+        self, sp: float | None, t_in: float | None, hum: float | None, mode_before: HVACMode
+    ) -> None:
+        """Append this tick to the zone's decision log (inputs, equation, outcome)."""
+        c = self.coordinator
+        p = c.params
+        heat = c.heating_equation
+        c.decisions.record(
+            time(), t_in, c.last_t_out, sp, p.t_bal_heat if heat else p.t_bal_cool,
+            p.deadband_heat if heat else p.deadband_cool,
+            hum, mode_before, self._attr_hvac_mode,
+            self._cmd_flags | (EQ_HEAT if heat else 0),
+        )
 
-        self.async_write_ha_state()
+    def _state_changed(self) -> bool:
+        """Whether the state differs visibly from the last one written.
+
+        Mode, set-point, parameters and availability compare exactly; current
+        temperature / humidity and the outdoor sample only count once they
+        moved by the zone's *state_epsilon*.  Counters and filter state ride
+        along with the next visible change.
+        """
+        outdoor = self.coordinator.outdoor
+        key = (
+            self.available,
+            self._attr_hvac_mode,
+            self._attr_target_temperature,
+            self.coordinator.params,
+        )
+        values = (
+            self._attr_current_temperature,
+            self._attr_current_humidity,
+            outdoor.data if outdoor is not None else None,
+        )
+        written = self._written
+        if (
+            written is not None
+            and key == written[0]
+            and not _moved(values, written[1], self.coordinator.state_epsilon)
+        ):
+            return False
+        self._written = (key, values)
+        return True
 
     # ------------------------------------------------------------------
     # Device commands
     # ------------------------------------------------------------------
-    async def _apply_mode(self, sp: float) -> None:
-        """Push target temperature to the appropriate device."""
+    @callback
+    def _apply_mode(self, sp: float) -> None:
+        """Push target temperature to the appropriate device.
+
+        Commands go through the per-actuator queue, which skips them when the
+        device already reports the desired state and lets the newest win.
+        """
+        trv = self.coordinator.trv
+        if self._attr_hvac_mode == HVACMode.HEAT and self._trv_entity and trv is not None:
+            # coming from COOL / DRY the split-AC is still running – stop it
+            # (skipped by the queue when it already reports OFF)
+            self._command(DeviceCommand(self._climate_entity, HVACMode.OFF))
+            self._update_trv_range()
+            value, delay = trv.start(monotonic(), self._attr_current_temperature, sp)
+            self._command(DeviceCommand(self._trv_entity, temperature=value))
+            self._schedule_trv_step(delay)
+            return
+        self._cancel_trv_step()
         if self._attr_hvac_mode == HVACMode.COOL:
-            await self.hass.services.async_call(
-                "climate",
-                "set_hvac_mode",
-                {"entity_id": self._climate_entity, "hvac_mode": HVACMode.COOL},
-                blocking=False,
-            )
-            await self.hass.services.async_call(
-                "climate",
-                "set_temperature",
-                {"entity_id": self._climate_entity, "temperature": sp},
-                blocking=False,
-            )
-        elif self._attr_hvac_mode == HVACMode.HEAT and self._trv_entity:
-            await self.hass.services.async_call(
-                "number",
-                "set_value",
-                {"entity_id": self._trv_entity, "value": sp},
-                blocking=False,
-            )
-        else:  # OFF
-            await self.hass.services.async_call(
-                "climate",
-                "set_hvac_mode",
-                {"entity_id": self._climate_entity, "hvac_mode": HVACMode.OFF},
-                blocking=False,
-            )
-            if self._trv_entity:
-                await self.hass.services.async_call(
-                    "number",
-                    "set_value",
-                    {"entity_id": self._trv_entity, "value": 7},  # frost-protection
-                    blocking=False,
+            self._command(DeviceCommand(self._climate_entity, HVACMode.COOL, sp))
+        else:  # OFF / DRY (the AC dehumidifies, the TRV stays closed)
+            ac_mode = HVACMode.DRY if self._attr_hvac_mode == HVACMode.DRY else HVACMode.OFF
+            self._command(DeviceCommand(self._climate_entity, ac_mode))
+            if self._trv_entity and trv is not None:
+                self._update_trv_range()
+                self._command(  # frost-protection – overtakes queued set-point updates
+                    DeviceCommand(self._trv_entity, temperature=trv.frost(monotonic()),
+                                  priority=PRIORITY_SAFETY)
                 )
 
+    # ------------------------------------------------------------------
+    # TRV loop – own cadence while in HEAT (see trv.TrvController)
+    # ------------------------------------------------------------------
+    @callback
+    def _update_trv_range(self) -> None:
+        """Take min / max / step from the TRV's number entity when it reports them."""
+        if (state := self.hass.states.get(self._trv_entity)) is None or self.coordinator.trv is None:
+            return
+        attrs = state.attributes
+        self.coordinator.trv.set_device_range(
+            _attr_float(attrs.get("min")), _attr_float(attrs.get("max")), _attr_float(attrs.get("step"))
+        )
 
-# ---------------------------------------------------------------------------
-# Platform entry-point – registers ThermoAdaptClimate for each Config-Entry
-# ---------------------------------------------------------------------------
+    @callback
+    def _schedule_trv_step(self, delay: float) -> None:
+        self._cancel_trv_step()
+        self._unsub_trv = async_call_later(self.hass, delay, self._async_trv_step)
 
+    @callback
+    def _cancel_trv_step(self) -> None:
+        if self._unsub_trv is not None:
+            self._unsub_trv()
+            self._unsub_trv = None
 
-def _load_params_from_helpers(hass: HomeAssistant, zone: str) -> ComfortParams:
-    """Build ComfortParams from current helper values (input_number)."""
-    g = hass.states.get
+    @callback
+    def _async_trv_step(self, _now: Any) -> None:
+        self._unsub_trv = None
+        trv = self.coordinator.trv
+        if self._attr_hvac_mode != HVACMode.HEAT or trv is None:
+            return
+        t_in = self.coordinator.read_input(CONF_TEMP_IN)
+        sp = self._attr_target_temperature
+        if t_in is None or sp is None:
+            self._schedule_trv_step(TRV_MAX_INTERVAL_SEC)
+            return
+        value, delay = trv.step(monotonic(), t_in, sp)
+        if value is not None:
+            self._command(DeviceCommand(self._trv_entity, temperature=value))
+        self._schedule_trv_step(delay)
 
-    def f(slug: str, dflt: float) -> float:
-        st = g(f"number.thermoadapt_{zone}_{slug}")
-        try:
-            return float(st.state) if st and st.state not in ("unknown", "unavailable") else dflt
-        except (TypeError, ValueError):
-            return dflt
-
-    return ComfortParams(
-        tc_base       = f("setpoint", PARAMS["setpoint"][-1]),
-        tc_min        = f("temp_min", PARAMS["temp_min"][-1]),
-        th_base       = f("heat_base", PARAMS["heat_base"][-1]),
-        k_heat        = f("k_heat",   PARAMS["k_heat"][-1]),
-        deadband_cool = f("deadband", PARAMS["deadband"][-1]),
-        deadband_heat = f("deadband", PARAMS["deadband"][-1]),  # same slider for now
-        humid_max     = int(f("humid_max", PARAMS["humid_max"][-1])),
-    )
+    @callback
+    def _command(self, command: DeviceCommand) -> None:
+        if command.entity_id != self._climate_entity:
+            self._cmd_flags |= CMD_SAFETY if command.priority == PRIORITY_SAFETY else CMD_TRV
+        else:
+            self._cmd_flags |= CMD_AC
+        queue = async_get_command_queue(self.hass, command.entity_id)
+        queue.metrics = self.coordinator.metrics
+        queue.async_submit(command)
+
+    def _params_attributes(self) -> dict[str, float]:
+        """Effective slider values keyed by slider slug (cached per params)."""
+        p = self.coordinator.params
+        if self._params_attr is None or self._params_attr[0] is not p:
+            self._params_attr = (p, {
+                "setpoint": p.tc_base,
+                "temp_min": p.tc_min,
+                "heat_base": p.th_base,
+                "k_heat": p.k_heat,
+                "deadband": p.deadband_cool,
+                "deadband_heat": p.deadband_heat,
+                "humid_max": p.humid_max,
+            })
+        return self._params_attr[1]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Zone data for the Lovelace card plus command / transition / filter state.
+
+        The card renders from this single state object (zone, outdoor sample,
+        effective slider values) instead of looking up each sensor and slider.
+        """
+        totals = CommandStats()
+        for eid in filter(None, (self._climate_entity, self._trv_entity)):
+            stats = async_get_command_queue(self.hass, eid).stats
+            totals.sent += stats.sent
+            totals.skipped += stats.skipped
+            totals.cancelled += stats.cancelled
+            totals.failed += stats.failed
+        outdoor = self.coordinator.outdoor
+        attrs: dict[str, Any] = {
+            "zone": self._zone,
+            "outdoor_temperature": outdoor.data if outdoor is not None else None,
+            "params": self._params_attributes(),
+        }
+        attrs.update({f"commands_{k}": v for k, v in totals.as_dict().items()})
+        cycle = self.coordinator.controller.stats
+        attrs["suppressed_min_run"] = cycle.suppressed_min_run
+        attrs["suppressed_min_off"] = cycle.suppressed_min_off
+        attrs["suppressed_cap"] = cycle.suppressed_cap
+        attrs["filters"] = self.coordinator.filters_as_dict()
+        if self.coordinator.trv is not None:
+            attrs["trv"] = self.coordinator.trv.as_dict()
+        return attrs
+
+
+# ---------------------------------------------------------------------------
+# Platform entry-point – registers ThermoAdaptClimate for each Config-Entry
+# ---------------------------------------------------------------------------
 
 
 async def async_setup_entry(
@@ -220,10 +481,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Register ThermoAdaptClimate entity for this zone."""
-    zone = entry.data[CONF_NAME]
-    params = _load_params_from_helpers(hass, zone)
-
-    coordinator = ThermoAdaptCoordinator(hass, entry, params)
+    coordinator = hass.data[DOMAIN][entry.data[CONF_NAME]]["coordinator"]
     entity = ThermoAdaptClimate(hass, entry, coordinator)
 
     async_add_entities([entity])
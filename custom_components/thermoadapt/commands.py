@@ -0,0 +1,176 @@
+"""ThermoAdapt – per-actuator command pipeline
+
+Slow actuators (Broadlink/SmartIR blasters, Zigbee TRVs) must not receive
+overlapping or redundant commands.  Every actuator entity gets one
+``DeviceCommandQueue`` (shared through ``hass.data[DOMAIN][DATA_COMMANDS]``):
+
+* a command describes the *desired end state* (mode and/or temperature);
+* it is skipped when the device already reports that state;
+* only the newest pending command survives – older pending ones are dropped;
+* mode and temperature are merged into a single ``climate.set_temperature``
+  call (``hvac_mode`` is a documented field of that service);
+* calls run one at a time per device with ``blocking=True``, each one after
+  a grant from the domain-wide ``CommandRateLimiter`` (see ``pacing``);
+* the last command known to be in effect is remembered (and persisted by the
+  climate entity), so a device that is not loaded yet at startup is not
+  re-sent the command it already received before the restart.
+
+Counters for sent / skipped / cancelled / failed commands are kept per queue.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Final
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_COMMANDS, DOMAIN, PRIORITY_NORMAL
+from .helpers import state_float
+from .metrics import STAGE_SERVICE_CALL, ZoneMetrics, now_ns
+from .pacing import async_get_rate_limiter
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class DeviceCommand:
+    """Desired end state of one actuator.
+
+    ``climate.*`` uses *hvac_mode* and optionally *temperature*; a TRV
+    ``number.*`` only uses *temperature* (the value to write).  *priority*
+    only orders the wait for the rate limiter (``PRIORITY_SAFETY`` first).
+    """
+
+    entity_id: str
+    hvac_mode: HVACMode | None = None
+    temperature: float | None = None
+    priority: int = field(default=PRIORITY_NORMAL, compare=False)
+
+
+@dataclass(slots=True)
+class CommandStats:
+    sent: int = 0
+    skipped: int = 0
+    cancelled: int = 0
+    failed: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class DeviceCommandQueue:
+    """Latest-wins, one-at-a-time command queue for a single actuator."""
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        self.hass = hass
+        self.entity_id = entity_id
+        self.domain = entity_id.split(".", 1)[0]
+        self.stats = CommandStats()
+        self.metrics: ZoneMetrics | None = None  # owning zone's, when enabled
+        self.last_command: DeviceCommand | None = None  # last known in effect
+        self._pending: DeviceCommand | None = None
+        self._running = False
+
+    @callback
+    def async_submit(self, command: DeviceCommand) -> None:
+        """Queue *command*, replacing any command that has not started yet."""
+        if self._pending is not None:
+            self.stats.cancelled += 1
+            _LOGGER.debug("Dropping stale command for %s: %s", self.entity_id, self._pending)
+        self._pending = command
+        if not self._running:
+            self._running = True
+            self.hass.async_create_background_task(
+                self._async_drain(), f"thermoadapt command {self.entity_id}"
+            )
+
+    async def _async_drain(self) -> None:
+        try:
+            limiter = async_get_rate_limiter(self.hass)
+            while (command := self._pending) is not None:
+                if not self._is_satisfied(command):
+                    await limiter.async_acquire(self.entity_id, command.priority)
+                    # a newer command may have replaced it while waiting
+                    command = self._pending or command
+                self._pending = None
+                if self._is_satisfied(command):
+                    self.stats.skipped += 1
+                    self.last_command = command
+                    continue
+                if (m := self.metrics) is not None:
+                    m.service_calls += 1
+                    t0 = now_ns()
+                try:
+                    await self._async_send(command)
+                except Exception as exc:  # noqa: BLE001 – device/integration errors
+                    self.stats.failed += 1
+                    if m is not None:
+                        m.service_failures += 1
+                    _LOGGER.warning("Command %s failed: %s", command, exc)
+                else:
+                    self.stats.sent += 1
+                    self.last_command = command
+                finally:
+                    if m is not None:
+                        m.record(STAGE_SERVICE_CALL, t0)
+        finally:
+            self._running = False
+
+    # ------------------------------------------------------------------
+    # Device state comparison
+    # ------------------------------------------------------------------
+    def _is_satisfied(self, command: DeviceCommand) -> bool:
+        st = self.hass.states.get(self.entity_id)
+        if st is None or st.state in ("unknown", "unavailable"):
+            # Device not loaded (yet): trust what was last put in effect
+            return command == self.last_command
+        if self.domain == "number":
+            return state_float(st) == command.temperature
+        if command.hvac_mode is not None and st.state != command.hvac_mode:
+            return False
+        if command.temperature is None or command.hvac_mode == HVACMode.OFF:
+            return True
+        return st.attributes.get("temperature") == command.temperature
+
+    # ------------------------------------------------------------------
+    # Service calls
+    # ------------------------------------------------------------------
+    async def _async_send(self, command: DeviceCommand) -> None:
+        call = self.hass.services.async_call
+        if self.domain == "number":
+            await call(
+                "number",
+                "set_value",
+                {"entity_id": self.entity_id, "value": command.temperature},
+                blocking=True,
+            )
+            return
+
+        if command.temperature is None or command.hvac_mode == HVACMode.OFF:
+            await call(
+                "climate",
+                "set_hvac_mode",
+                {"entity_id": self.entity_id, "hvac_mode": command.hvac_mode},
+                blocking=True,
+            )
+            return
+
+        data: dict = {"entity_id": self.entity_id, "temperature": command.temperature}
+        st = self.hass.states.get(self.entity_id)
+        if command.hvac_mode is not None and (st is None or st.state != command.hvac_mode):
+            data["hvac_mode"] = command.hvac_mode  # one burst: mode + temperature
+        await call("climate", "set_temperature", data, blocking=True)
+
+
+@callback
+def async_get_command_queue(hass: HomeAssistant, entity_id: str) -> DeviceCommandQueue:
+    """Return the shared queue for actuator *entity_id* (created on first use)."""
+    queues: dict[str, DeviceCommandQueue] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_COMMANDS, {}
+    )
+    if (queue := queues.get(entity_id)) is None:
+        queue = queues[entity_id] = DeviceCommandQueue(hass, entity_id)
+    return queue
@@ -6,12 +6,17 @@ Collects:
   • Comfort parameters (min/max T, dead-band, etc.)
 Stores comfort sliders in *entry.options* so they are editable later.  Helpers
 (input_number / input_boolean) are created on-the-fly via `ensure_helpers()`.
+
+Slider names and defaults come from the ``params`` registry.  No other module
+of the integration imports this one (Home Assistant loads it on its own when
+it sets up an entry), so it stays light: ``helpers`` is only imported when the
+wizard actually creates them.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Mapping
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -26,24 +31,47 @@ from .const import (
     CONF_HUM_IN,
     CONF_CLIMATE_ENTITY,
     CONF_TRV_ENTITY,
-    HELPER_SUFFIXES,
+    CONF_EVENT_DRIVEN,
+    CONF_EVENT_EPSILON,
+    CONF_FORECAST_ENTITY,
+    CONF_INPUT_FILTER,
+    CONF_LEARN_THERMAL,
+    CONF_METRICS,
+    CONF_MIN_OFF,
+    CONF_MIN_RUN,
+    CONF_OUTDOOR_INPUT,
+    CONF_PRECONDITION_H,
+    CONF_STATE_EPSILON,
+    CONF_TRV_MAX_WRITES,
+    DEF_EVENT_DRIVEN,
+    DEF_EVENT_EPSILON,
+    DEF_INPUT_FILTER,
+    DEF_LEARN_THERMAL,
+    DEF_METRICS,
+    DEF_MIN_OFF,
+    DEF_MIN_RUN,
+    DEF_OUTDOOR_INPUT,
+    DEF_PRECONDITION_H,
+    DEF_STATE_EPSILON,
+    DEF_TRV_MAX_WRITES,
+    INPUT_FILTER_EWMA,
+    INPUT_FILTER_KALMAN,
+    INPUT_FILTER_MEDIAN,
+    INPUT_FILTER_NONE,
+    OUTDOOR_INPUT_INSTANT,
+    OUTDOOR_INPUT_RUNNING_MEAN,
 )
-from .helpers import ensure_helpers  # util inside the same component
+from .params import DEFAULTS, INT_PARAMS, PARAMS, param_entity_id
 
 _LOGGER = logging.getLogger(__name__)
 
-# -----------------------------------------------------------------------------
-# DEFAULTS – hard-coded here to avoid extra imports/deps
-# -----------------------------------------------------------------------------
-DEFAULTS: Dict[str, float | int] = {
-    "temp_min":   23.0,
-    "temp_max":   27.0,
-    "setpoint":   25.0,
-    "deadband":   0.5,
-    "humid_max":  65,
-    "heat_base":  20.5,
-    "k_heat":     0.18,
-}
+
+def _comfort_schema(values: Mapping[str, Any]) -> Dict[Any, Any]:
+    """One field per comfort parameter (registry order), *values* as defaults."""
+    return {
+        vol.Required(fid, default=values[fid]): vol.All(vol.Coerce(int if fid in INT_PARAMS else float))
+        for fid in PARAMS
+    }
 
 
 class ThermoAdaptConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -76,14 +104,14 @@ class ThermoAdaptConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     # ------------------------------------------------------------------
     async def async_step_comfort(self, user_input: Dict[str, Any] | None = None):
         if user_input is None:
-            # Build a schema dynamically from DEFAULTS so adding fields later is trivial
-            schema_dict: Dict[Any, Any] = {
-                vol.Required(fid, default=DEFAULTS[fid]): vol.All(vol.Coerce(float)) if "humid" not in fid else vol.All(vol.Coerce(int))
-                for fid in HELPER_SUFFIXES if fid in DEFAULTS
-            }
-            return self.async_show_form(step_id="comfort", data_schema=vol.Schema(schema_dict))
+            # Built from the registry so adding a parameter there is enough
+            return self.async_show_form(
+                step_id="comfort", data_schema=vol.Schema(_comfort_schema(DEFAULTS))
+            )
 
         # Merge and create helpers
+        from .helpers import ensure_helpers  # only needed by the wizard
+
         self._data.update(user_input)
         await ensure_helpers(self.hass, self._data[CONF_NAME])
 
@@ -106,11 +134,76 @@ class ThermoAdaptOptionsFlow(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input: Dict[str, Any] | None = None):
         if user_input is None:
-            current = {k: self.entry.options.get(k, DEFAULTS.get(k)) for k in HELPER_SUFFIXES}
-            schema_dict: Dict[Any, Any] = {
-                vol.Required(fid, default=current[fid]): vol.All(vol.Coerce(float)) if "humid" not in fid else vol.All(vol.Coerce(int))
-                for fid in HELPER_SUFFIXES if fid in DEFAULTS
-            }
+            schema_dict = _comfort_schema(self._current_params())
+            # Runtime behaviour (not sliders)
+            schema_dict[vol.Required(
+                CONF_EVENT_DRIVEN,
+                default=self.entry.options.get(CONF_EVENT_DRIVEN, DEF_EVENT_DRIVEN),
+            )] = bool
+            schema_dict[vol.Required(
+                CONF_EVENT_EPSILON,
+                default=self.entry.options.get(CONF_EVENT_EPSILON, DEF_EVENT_EPSILON),
+            )] = vol.All(vol.Coerce(float), vol.Range(min=0, max=5))
+            schema_dict[vol.Required(
+                CONF_STATE_EPSILON,
+                default=self.entry.options.get(CONF_STATE_EPSILON, DEF_STATE_EPSILON),
+            )] = vol.All(vol.Coerce(float), vol.Range(min=0, max=2))
+            schema_dict[vol.Required(
+                CONF_TRV_MAX_WRITES,
+                default=self.entry.options.get(CONF_TRV_MAX_WRITES, DEF_TRV_MAX_WRITES),
+            )] = vol.All(vol.Coerce(int), vol.Range(min=0, max=60))
+            schema_dict[vol.Required(
+                CONF_METRICS,
+                default=self.entry.options.get(CONF_METRICS, DEF_METRICS),
+            )] = bool
+            schema_dict[vol.Required(
+                CONF_LEARN_THERMAL,
+                default=self.entry.options.get(CONF_LEARN_THERMAL, DEF_LEARN_THERMAL),
+            )] = bool
+            schema_dict[vol.Required(
+                CONF_OUTDOOR_INPUT,
+                default=self.entry.options.get(CONF_OUTDOOR_INPUT, DEF_OUTDOOR_INPUT),
+            )] = vol.In([OUTDOOR_INPUT_INSTANT, OUTDOOR_INPUT_RUNNING_MEAN])
+            schema_dict[vol.Required(
+                CONF_INPUT_FILTER,
+                default=self.entry.options.get(CONF_INPUT_FILTER, DEF_INPUT_FILTER),
+            )] = vol.In([INPUT_FILTER_MEDIAN, INPUT_FILTER_EWMA, INPUT_FILTER_KALMAN, INPUT_FILTER_NONE])
+            schema_dict[vol.Required(
+                CONF_MIN_RUN,
+                default=self.entry.options.get(CONF_MIN_RUN, DEF_MIN_RUN),
+            )] = vol.All(vol.Coerce(float), vol.Range(min=0, max=60))
+            schema_dict[vol.Required(
+                CONF_MIN_OFF,
+                default=self.entry.options.get(CONF_MIN_OFF, DEF_MIN_OFF),
+            )] = vol.All(vol.Coerce(float), vol.Range(min=0, max=60))
+            schema_dict[vol.Optional(
+                CONF_FORECAST_ENTITY,
+                description={"suggested_value": self.entry.options.get(CONF_FORECAST_ENTITY)},
+            )] = selector({"entity": {"domain": "weather"}})
+            schema_dict[vol.Required(
+                CONF_PRECONDITION_H,
+                default=self.entry.options.get(CONF_PRECONDITION_H, DEF_PRECONDITION_H),
+            )] = vol.All(vol.Coerce(int), vol.Range(min=0, max=12))
             return self.async_show_form(step_id="init", data_schema=vol.Schema(schema_dict))
 
         return self.async_create_entry(title="ThermoAdapt options", data=user_input)
+
+    def _current_params(self) -> Dict[str, float]:
+        """Live slider values as form defaults, else the stored options.
+
+        The sliders are also edited from the card and ``thermoadapt.set_params``
+        (which do not touch *entry.options*); seeding the form with the stored
+        options would write those edits back on submit.
+        """
+        from .helpers import state_float  # the integration is loaded by now
+
+        zone = self.entry.data[CONF_NAME]
+        opts = self.entry.options
+        current: Dict[str, float] = {}
+        for slug, default in DEFAULTS.items():
+            if slug == "deadband_heat":  # older entries: the shared dead-band
+                default = current["deadband"]
+            value = state_float(self.hass.states.get(param_entity_id(zone, slug)))
+            value = value if value is not None else float(opts.get(slug, default))
+            current[slug] = int(value) if slug in INT_PARAMS else value
+        return current
@@ -13,6 +13,14 @@ from __future__ import annotations
 DOMAIN: str = "thermoadapt"
 LEGACY_DOMAIN: str = "climate_react_plus"  # ← kept for one release cycle
 
+# hass.data[DOMAIN] keys shared by all zones (zones are keyed by name)
+DATA_OUTDOOR:  str = "outdoor_coordinators"
+DATA_COMMANDS: str = "command_queues"
+DATA_SCHEDULER: str = "zone_scheduler"
+DATA_LIMITER:   str = "rate_limiter"
+DATA_FORECAST:  str = "forecast_coordinators"
+DATA_HUB:       str = "hub"
+
 # Config-flow keys (UI)
 CONF_TEMP_IN:        str = "temp_in"
 CONF_HUM_IN:         str = "hum_in"
@@ -20,28 +28,132 @@ CONF_TEMP_OUT:       str = "temp_out"
 CONF_CLIMATE_ENTITY: str = "climate_entity"
 CONF_TRV_ENTITY:     str = "trv_entity"
 
-# Default comfort parameters (Dear & Brager category II)
-DEF_TEMP_MIN:   float = 23.0  # °C – lower comfort threshold in manual mode
-DEF_TEMP_MAX:   float = 27.0  # °C – upper comfort threshold in manual mode
-DEF_SETPOINT:   float = 25.0  # °C – fixed set-point when adaptive algo is off
-DEF_DEADBAND:   float = 0.5   # °C – neutral zone before switching
-DEF_HUMID_MAX:  int   = 65    # %  – triggers *dry* mode above this
-DEF_HEAT_BASE:  float = 20.5  # °C – T_base for heating curve
-DEF_K_HEAT:     float = 0.18  # slope for adaptive heating (Dear & Brager 2001)
-
-# Helper suffixes used to auto-generate input_numbers / booleans
-HELPER_SUFFIXES = [
-    "temp_min",
-    "temp_max",
-    "setpoint",
-    "deadband",
-    "humid_max",
-    "heat_base",
-    "k_heat",
-    "ativo",     # master enable (switch)
-    "dinamico",  # adaptive algorithm toggle
-]
+# Comfort parameters (names, ranges, defaults) – see params.py
+
+# Anti-short-cycling (options) – minutes
+CONF_MIN_RUN: str = "min_run_minutes"
+CONF_MIN_OFF: str = "min_off_minutes"
+DEF_MIN_RUN:  float = 5.0
+DEF_MIN_OFF:  float = 5.0
+HUMID_HYSTERESIS: float = 3.0  # % RH below humid_max before DRY stops
+
+HELPER_CREATE_CONCURRENCY: int = 8  # parallel input_*/create calls
+
+# Services
+SERVICE_PROVISION_HELPERS: str = "provision_helpers"
+SERVICE_SET_PARAMS:        str = "set_params"
+SERVICE_DUMP_DECISIONS:    str = "dump_decisions"
+ATTR_ZONES:                str = "zones"
 
 # Update interval for coordinator
 SCAN_INTERVAL_SEC: int = 30
 
+# Decision log – 24 h of ticks per zone (see decisions.py)
+DECISION_LOG_SIZE: int = 24 * 3600 // SCAN_INTERVAL_SEC
+
+# Domain-wide pacing (YAML `rate_limit:`) – calls/s, 0 = unlimited
+CONF_RATE_LIMIT:    str = "rate_limit"
+CONF_GLOBAL_RATE:   str = "global_rate"
+CONF_GLOBAL_BURST:  str = "global_burst"
+CONF_GATEWAY_RATE:  str = "gateway_rate"
+CONF_GATEWAY_BURST: str = "gateway_burst"
+CONF_STAGGER:       str = "stagger"
+
+DEF_RATE_GLOBAL:        float = 2.0
+DEF_RATE_GLOBAL_BURST:  int   = 5
+DEF_RATE_GATEWAY:       float = 0.5   # IR blasters / Zigbee hubs are slow
+DEF_RATE_GATEWAY_BURST: int   = 2
+DEF_STAGGER_SEC:        float = 5.0   # s – the last zone reacts this much later
+
+# Whole-house hub (YAML `hub:`) – one batched tick for all zones
+CONF_HUB:             str = "hub"
+CONF_MAX_COMPRESSORS: str = "max_compressors"
+DEF_MAX_COMPRESSORS:  int = 0   # 0 = no cap
+
+# TRV heating loop (see trv.py) – PI on temp_in with its own cadence
+CONF_TRV_MAX_WRITES: str   = "trv_max_writes"   # per device and hour (options)
+DEF_TRV_MAX_WRITES:  int   = 6                  # 0 = no budget
+TRV_BUDGET_BURST:    int   = 2                  # writes that may be saved up
+TRV_KP:              float = 1.0                # °C of TRV target per °C of error
+TRV_KI:              float = 1.0 / 3600         # …plus this per °C·s of accumulated error
+TRV_MIN_OFFSET:      float = -1.0               # TRV target relative to the set-point
+TRV_MAX_BOOST:       float = 3.0
+TRV_STEP:            float = 0.5                # °C – unless the device reports its own
+TRV_MIN_TEMP:        float = 5.0
+TRV_MAX_TEMP:        float = 30.0
+TRV_FROST_TEMP:      float = 7.0                # frost protection outside HEAT
+TRV_MIN_INTERVAL_SEC: int  = 300                # far from the set-point…
+TRV_MAX_INTERVAL_SEC: int  = 1800               # …close to it
+
+# Command priorities (lower goes first)
+PRIORITY_SAFETY: int = 0   # frost protection
+PRIORITY_NORMAL: int = 1
+
+# Event-driven recompute (options) – react to sensor changes instead of polling
+CONF_EVENT_DRIVEN:  str = "event_driven"
+CONF_EVENT_EPSILON: str = "event_epsilon"
+
+DEF_EVENT_DRIVEN:  bool  = True
+DEF_EVENT_EPSILON: float = 0.1   # °C / % – ignore sensor jitter below this
+
+# State writes (options) – the climate entity only writes when something visible
+# changed; current temperature / humidity / outdoor changes below this are not
+# written (0 = write every change)
+CONF_STATE_EPSILON: str   = "state_epsilon"
+DEF_STATE_EPSILON:  float = 0.1   # °C / %
+
+# Diagnostics (options) – hot-path timers/counters, off by default
+CONF_METRICS: str  = "diagnostics_metrics"
+DEF_METRICS:  bool = False
+
+# Predictive mode (options) – weather.* hourly forecast, pre-conditioning lead
+CONF_FORECAST_ENTITY:  str = "forecast_entity"
+CONF_PRECONDITION_H:   str = "precondition_hours"
+DEF_PRECONDITION_H:    int = 2
+
+FORECAST_HORIZON_H:         int = 24
+FORECAST_SCAN_INTERVAL_SEC: int = 1800   # plus a refresh whenever the weather entity updates
+
+# Online thermal identification (options) – feed learned UA/Q_int back
+CONF_LEARN_THERMAL: str  = "learn_thermal"
+DEF_LEARN_THERMAL:  bool = False
+
+THERMAL_CAPACITANCE:  float = 1.0e6   # J/K – nominal, only Q_int/UA is identifiable
+THERMAL_FORGETTING:   float = 0.995   # RLS forgetting factor (~200 samples memory)
+THERMAL_SAMPLE_SEC:   int   = 600     # min. free-floating interval per sample
+THERMAL_MAX_GAP_SEC:  int   = 3600    # longer gaps restart the interval
+THERMAL_MIN_SAMPLES:  int   = 36      # ≈ 6 h free-floating before feedback
+THERMAL_STORE_VERSION:   int = 1
+THERMAL_SAVE_DELAY_SEC:  int = 300
+
+# Outdoor model input (options) – instantaneous reading or EN 16798 running mean
+CONF_OUTDOOR_INPUT:         str = "outdoor_input"
+OUTDOOR_INPUT_INSTANT:      str = "instant"
+OUTDOOR_INPUT_RUNNING_MEAN: str = "running_mean"
+DEF_OUTDOOR_INPUT:          str = OUTDOOR_INPUT_INSTANT
+
+RUNNING_MEAN_ALPHA:          float = 0.8   # EN 16798-1 daily weight (0 < α < 1)
+RUNNING_MEAN_STORE_VERSION:  int   = 1
+RUNNING_MEAN_SAVE_DELAY_SEC: int   = 600
+
+# Input filtering (options) – see filters.py
+CONF_INPUT_FILTER:   str = "input_filter"
+INPUT_FILTER_NONE:   str = "none"
+INPUT_FILTER_MEDIAN: str = "median"
+INPUT_FILTER_EWMA:   str = "ewma"
+INPUT_FILTER_KALMAN: str = "kalman"
+DEF_INPUT_FILTER:    str = INPUT_FILTER_NONE  # opt-in: smoothing adds lag
+
+FILTER_MEDIAN_WINDOW:   int   = 5
+FILTER_EWMA_TAU_SEC:    float = 300.0
+FILTER_KALMAN_Q:        float = 1.0e-5  # °C²/s – how fast the true value may wander
+FILTER_KALMAN_R:        float = 0.04    # °C² – sensor noise (σ ≈ 0.2 °C)
+FILTER_MAX_JUMP:        float = 2.0     # °C – larger jumps are outliers…
+FILTER_MAX_RATE:        float = 4.0     # °C/h – …plus this much per hour since the last sample
+FILTER_OUTLIER_CONFIRM: int   = 3       # consecutive outliers accepted as a real step
+FILTER_STALE_SEC:       int   = 600     # hold the last value this long while unavailable
+FILTER_HUM_SCALE:       float = 5.0     # % RH per °C for the limits above
+
+EVENT_DEBOUNCE_SEC:       float = 1.0   # coalesce bursts of state changes
+SAFETY_SCAN_INTERVAL_SEC: int   = 300   # fallback poll while event-driven
+
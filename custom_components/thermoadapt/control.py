@@ -0,0 +1,158 @@
+"""ThermoAdapt – pure control decisions
+
+The set-point and HVAC-mode decisions used by ``ThermoAdaptCoordinator`` and
+``ThermoAdaptClimate`` live here without any Home Assistant state, so the
+offline simulator (``tools/sim``) replays exactly the same logic.
+
+``decide_mode`` is the stateless dead-band rule; ``ModeController`` is the
+state machine the integration runs on top of it (hysteresis, minimum run/off
+times, humidity-driven DRY and – in hub mode – the house compressor cap).
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Final
+
+from homeassistant.components.climate import HVACMode
+
+from .const import HUMID_HYSTERESIS
+from .helpers import tset_cool, tset_heat
+from .models import ComfortParams
+
+# Modes that run the split-AC's compressor (HEAT runs the TRV only)
+COMPRESSOR_MODES: Final = frozenset({HVACMode.COOL, HVACMode.DRY})
+
+
+def adaptive_setpoint(t_out: float, p: ComfortParams) -> float:
+    """Adaptive set-point (°C, rounded to 0.1) for outdoor temperature *t_out*."""
+    # Choose equation based on outdoor vs. balance temperature
+    sp = tset_cool(t_out, p) if t_out > p.t_bal_cool else tset_heat(t_out, p)
+    return round(sp, 1)
+
+
+def decide_mode(t_in: float, sp: float, p: ComfortParams, *, has_trv: bool) -> HVACMode:
+    """HVAC mode for indoor temperature *t_in* around set-point *sp* (dead-bands)."""
+    if t_in > sp + p.deadband_cool:
+        return HVACMode.COOL
+    if t_in < sp - p.deadband_heat:
+        return HVACMode.HEAT if has_trv else HVACMode.OFF
+    return HVACMode.OFF
+
+
+@dataclass(slots=True)
+class TransitionStats:
+    transitions: int = 0
+    suppressed_min_run: int = 0   # wanted to stop/switch before min_run
+    suppressed_min_off: int = 0   # wanted to start before min_off
+    suppressed_cap: int = 0       # compressor start refused by the hub cap
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class ModeController:
+    """Anti-short-cycling HVAC mode state machine of one zone.
+
+    * COOL starts above ``sp + deadband_cool`` and runs until ``sp`` is reached;
+      HEAT (TRV only) starts below ``sp - deadband_heat`` and runs until ``sp``.
+    * DRY runs while neither is needed and ``hum_in`` exceeds ``humid_max``
+      (stops ``HUMID_HYSTERESIS`` % below it).
+    * A running mode is kept for at least *min_run* s, OFF for at least
+      *min_off* s; a transition held back by either is counted once.
+    * ``step(..., allow_start=False)`` refuses to start the compressor (hub
+      cap); the zone then behaves as if it wanted OFF.
+
+    Times are plain seconds from any monotonic clock (simulated time in
+    ``tools/sim``).
+    """
+
+    __slots__ = ("mode", "since", "min_run", "min_off", "stats", "_held", "_capped")
+
+    def __init__(self, min_run: float = 0.0, min_off: float = 0.0) -> None:
+        self.mode: HVACMode = HVACMode.OFF
+        self.since: float | None = None  # None – no timing constraint yet
+        self.min_run = min_run
+        self.min_off = min_off
+        self.stats = TransitionStats()
+        self._held: HVACMode | None = None
+        self._capped = False
+
+    def restore(self, mode: HVACMode) -> None:
+        """Resume in *mode*; its start time is unknown, so it is not enforced."""
+        self.mode = mode
+        self.since = None
+
+    def demand(
+        self, t_in: float, sp: float, p: ComfortParams, hum: float | None, *, has_trv: bool
+    ) -> HVACMode:
+        """Mode wanted right now, with hysteresis relative to the current one."""
+        mode = self.mode
+        if t_in > sp + p.deadband_cool or (mode == HVACMode.COOL and t_in > sp):
+            return HVACMode.COOL
+        if has_trv and (t_in < sp - p.deadband_heat or (mode == HVACMode.HEAT and t_in < sp)):
+            return HVACMode.HEAT
+        if hum is not None and (
+            hum > p.humid_max or (mode == HVACMode.DRY and hum > p.humid_max - HUMID_HYSTERESIS)
+        ):
+            return HVACMode.DRY
+        return HVACMode.OFF
+
+    def _locked(self, now: float) -> bool:
+        """True while min run/off time keeps the current mode."""
+        if self.since is None:
+            return False
+        return now - self.since < (self.min_run if self.mode != HVACMode.OFF else self.min_off)
+
+    def peek(
+        self,
+        now: float,
+        t_in: float,
+        sp: float,
+        p: ComfortParams,
+        hum: float | None = None,
+        *,
+        has_trv: bool,
+    ) -> HVACMode:
+        """Mode ``step`` would return right now, without advancing."""
+        want = self.demand(t_in, sp, p, hum, has_trv=has_trv)
+        return self.mode if want != self.mode and self._locked(now) else want
+
+    def step(
+        self,
+        now: float,
+        t_in: float,
+        sp: float,
+        p: ComfortParams,
+        hum: float | None = None,
+        *,
+        has_trv: bool,
+        allow_start: bool = True,
+    ) -> HVACMode:
+        """Advance the state machine and return the mode to run."""
+        want = self.demand(t_in, sp, p, hum, has_trv=has_trv)
+        if not allow_start and want in COMPRESSOR_MODES and self.mode not in COMPRESSOR_MODES:
+            if not self._capped:  # count each refused start once
+                self._capped = True
+                self.stats.suppressed_cap += 1
+            want = HVACMode.OFF
+        else:
+            self._capped = False
+        if want == self.mode:
+            self._held = None
+            return want
+
+        if self._locked(now):
+            if want != self._held:  # count each held-back transition once
+                self._held = want
+                if self.mode != HVACMode.OFF:
+                    self.stats.suppressed_min_run += 1
+                else:
+                    self.stats.suppressed_min_off += 1
+            return self.mode
+
+        self.mode = want
+        self.since = now
+        self._held = None
+        self.stats.transitions += 1
+        return want
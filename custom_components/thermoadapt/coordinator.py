@@ -0,0 +1,583 @@
+"""ThermoAdapt – zone coordinator
+
+``ThermoAdaptCoordinator`` computes the adaptive set-point of one zone and
+owns its parameters, controller, thermal estimator and forecast trajectory.
+It lives outside the platform modules because ``__init__`` creates it before
+forwarding the entry, and both the climate and the sensor platform attach to
+it.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import replace
+from time import monotonic, time
+from typing import TYPE_CHECKING, Any, Final, Mapping
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import (
+    CONF_EVENT_DRIVEN,
+    CONF_EVENT_EPSILON,
+    CONF_FORECAST_ENTITY,
+    CONF_HUM_IN,
+    CONF_INPUT_FILTER,
+    CONF_LEARN_THERMAL,
+    CONF_METRICS,
+    CONF_MIN_OFF,
+    CONF_MIN_RUN,
+    CONF_OUTDOOR_INPUT,
+    CONF_PRECONDITION_H,
+    CONF_STATE_EPSILON,
+    CONF_TEMP_IN,
+    CONF_TEMP_OUT,
+    CONF_TRV_ENTITY,
+    CONF_TRV_MAX_WRITES,
+    DATA_HUB,
+    DEF_EVENT_DRIVEN,
+    DEF_EVENT_EPSILON,
+    DEF_INPUT_FILTER,
+    DEF_LEARN_THERMAL,
+    DEF_METRICS,
+    DEF_MIN_OFF,
+    DEF_MIN_RUN,
+    DEF_OUTDOOR_INPUT,
+    DEF_PRECONDITION_H,
+    DEF_STATE_EPSILON,
+    DEF_TRV_MAX_WRITES,
+    DECISION_LOG_SIZE,
+    DOMAIN,
+    EVENT_DEBOUNCE_SEC,
+    OUTDOOR_INPUT_RUNNING_MEAN,
+    THERMAL_SAVE_DELAY_SEC,
+    THERMAL_STORE_VERSION,
+)
+from .control import ModeController, adaptive_setpoint
+from .decisions import DecisionLog
+from .estimator import ThermalEstimator
+from .filters import InputFilter, make_input_filter
+from .helpers import state_float
+from .metrics import STAGE_SENSOR_READ, STAGE_SETPOINT, ZoneMetrics, now_ns
+from .models import ComfortParams
+from .outdoor import OutdoorCoordinator, async_acquire_outdoor, async_release_outdoor
+from .pacing import async_get_scheduler
+from .params import DEFAULTS, PARAMS, param_entity_id
+
+# Optional features (forecast, hub, TRV) are imported where a zone turns them
+# on, so a plain zone never loads them (nor NumPy through ``batch``).
+if TYPE_CHECKING:
+    from .forecast import ForecastCoordinator, HourlyForecast, SetpointTrajectory
+    from .hub import HubCoordinator, ZoneDecision
+    from .trv import TrvController
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+# -----------------------------------------------------------------------------
+# Coordinator – receives the shared outdoor sample & calculates set-point
+# -----------------------------------------------------------------------------
+
+class ThermoAdaptCoordinator(DataUpdateCoordinator[float]):
+    """Provides the adaptive set-point (°C).
+
+    The zone has no timer of its own: the shared ``OutdoorCoordinator`` of its
+    ``temp_out`` sensor reads the sample once per tick and fans it out here.
+    The domain ``ZoneScheduler`` delays each zone's share of a tick by its
+    phase offset, so zones do not evaluate (and command) in lock-step.
+    In event-driven mode (default) the zone additionally recomputes shortly
+    after ``temp_in`` / ``hum_in`` move by more than *event_epsilon*; bursts
+    are coalesced by a debouncer.
+
+    With a *forecast_entity* the set-point is pre-conditioned from a
+    ``SetpointTrajectory`` that is rebuilt only when a new forecast arrives or
+    the parameters change (see ``forecast``).
+
+    The zone's ``ModeController`` (anti-short-cycling state machine) lives
+    here too, so options edits reach it without touching the entity.
+
+    A ``ThermalEstimator`` learns UA/Q_int from the free-floating periods the
+    climate entity reports; with *learn_thermal* enabled the learned values
+    replace the ComfortParams defaults.
+
+    Every decision of the climate entity lands in ``decisions`` (a bounded
+    ``DecisionLog``), exported by diagnostics and ``thermoadapt.dump_decisions``.
+
+    Sensor readings reach the decisions through one ``InputFilter`` per input
+    (``read_input`` / ``feed_input``, see ``filters``): outliers are dropped,
+    short unavailability is bridged and the chosen *input_filter* smooths.
+
+    When the whole-house hub is configured (``hub``) the zone does not listen
+    to the outdoor fan-out nor to its inputs: the hub evaluates it together
+    with all other zones and pushes a ``ZoneDecision`` through
+    ``async_set_updated_data``.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, params: ComfortParams):
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"thermoadapt_{entry.data[CONF_NAME]}",
+            update_interval=None,  # driven by the outdoor coordinator
+        )
+        self.entry = entry
+        self.params = params
+        self.event_driven: bool = entry.options.get(CONF_EVENT_DRIVEN, DEF_EVENT_DRIVEN)
+        self.epsilon: float = float(entry.options.get(CONF_EVENT_EPSILON, DEF_EVENT_EPSILON))
+        self.state_epsilon: float = float(entry.options.get(CONF_STATE_EPSILON, DEF_STATE_EPSILON))
+        self.outdoor: OutdoorCoordinator | None = None
+        self.metrics: ZoneMetrics | None = (
+            ZoneMetrics() if entry.options.get(CONF_METRICS, DEF_METRICS) else None
+        )
+        self._unsub_inputs: CALLBACK_TYPE | None = None
+        self._bulk_params = False  # set_params in progress – ignore slider events
+        self._unsub_staggered: CALLBACK_TYPE | None = None
+        self.learn_thermal: bool = entry.options.get(CONF_LEARN_THERMAL, DEF_LEARN_THERMAL)
+        self.outdoor_input: str = entry.options.get(CONF_OUTDOOR_INPUT, DEF_OUTDOOR_INPUT)
+        self.forecast: ForecastCoordinator | None = None
+        self.precondition_h: int = int(entry.options.get(CONF_PRECONDITION_H, DEF_PRECONDITION_H))
+        self.trajectory: SetpointTrajectory | None = None
+        self._trajectory_src: tuple[HourlyForecast, ComfortParams, int] | None = None
+        self._unsub_forecast: CALLBACK_TYPE | None = None
+        self.controller = ModeController()
+        self._apply_cycle_limits(entry.options)
+        self.estimator = ThermalEstimator()
+        # TRV heating loop – run by the climate entity on its own cadence
+        self.trv: TrvController | None = None
+        if self.has_trv:
+            from .trv import TrvController
+
+            self.trv = TrvController(
+                int(entry.options.get(CONF_TRV_MAX_WRITES, DEF_TRV_MAX_WRITES)), monotonic()
+            )
+        self._thermal_store: Store[dict[str, Any]] | None = None
+        self.hub: HubCoordinator | None = None
+        self.decision: ZoneDecision | None = None  # latest hub decision
+        self.decisions = DecisionLog(DECISION_LOG_SIZE)  # recorded by the climate entity
+        self.last_t_out: float | None = None  # model input of the latest set-point
+        self.input_filter: str = entry.options.get(CONF_INPUT_FILTER, DEF_INPUT_FILTER)
+        self.filters: dict[str, InputFilter] = {}  # CONF_TEMP_IN / CONF_HUM_IN / CONF_TEMP_OUT
+        self._filter_keys: dict[str, str] = {}     # input entity id -> key
+        self._build_filters()
+
+        # Last value per input that caused a recompute (None = unavailable)
+        self._last_inputs: dict[str, float | None] = {}
+        self._event_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=EVENT_DEBOUNCE_SEC,
+            immediate=False,
+            function=self.async_refresh,
+        )
+
+    # ------------------------------------------------------------------
+    # Wiring – outdoor fan-out and indoor state events
+    # ------------------------------------------------------------------
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Subscribe to the outdoor coordinator, indoor sensors and sliders.
+
+        Returns the callback that undoes everything (entity removal).
+        """
+        zone: str = self.entry.data[CONF_NAME]
+        outdoor = self.outdoor = async_acquire_outdoor(
+            self.hass,
+            self.entry.data[CONF_TEMP_OUT],
+            zone,
+            event_driven=self.event_driven,
+            epsilon=self.epsilon,
+        )
+        unsubs: list[CALLBACK_TYPE] = [
+            async_track_state_change_event(
+                self.hass,
+                [param_entity_id(zone, slug) for slug in PARAMS],
+                self._handle_param_event,
+            ),
+        ]
+        scheduler = async_get_scheduler(self.hass)
+        self.hub = self.hass.data[DOMAIN].get(DATA_HUB)  # hub.async_get_hub, minus the import
+        if self.hub is not None:
+            unsubs.append(self.hub.async_attach(self))  # hub reads outdoor + inputs
+        else:
+            unsubs.append(outdoor.async_add_listener(self._handle_outdoor_update))
+            self._async_track_inputs()
+            scheduler.async_register(zone)
+        self._async_track_forecast(self.entry.options.get(CONF_FORECAST_ENTITY) or None)
+
+        @callback
+        def _unsub() -> None:
+            for unsub in unsubs:
+                unsub()
+            if self._unsub_inputs:
+                self._unsub_inputs()
+                self._unsub_inputs = None
+            if self._unsub_staggered:
+                self._unsub_staggered()
+                self._unsub_staggered = None
+            self._async_track_forecast(None)
+            scheduler.async_unregister(zone)
+            self._event_debouncer.async_cancel()
+            async_release_outdoor(self.hass, outdoor, zone)
+            self.outdoor = None
+            self.hub = None
+
+        return _unsub
+
+    @property
+    def heating_equation(self) -> bool:
+        """True when the latest set-point came from the heating equation."""
+        return self.last_t_out is not None and self.last_t_out <= self.params.t_bal_cool
+
+    @property
+    def has_trv(self) -> bool:
+        return bool(self.entry.data.get(CONF_TRV_ENTITY))
+
+    @callback
+    def async_schedule_recompute(self) -> None:
+        """Coalesced recompute of this zone – by the hub when one owns it."""
+        if self.hub is not None:
+            self.hub.async_schedule_refresh()
+        else:
+            self._event_debouncer.async_schedule_call()
+
+    async def async_recompute(self) -> None:
+        """Recompute now (first refresh after startup)."""
+        if self.hub is not None:
+            self.hub.async_schedule_refresh()  # one tick for all zones starting up
+        else:
+            await self.async_refresh()
+
+    @callback
+    def _async_track_inputs(self) -> None:
+        if self._unsub_inputs:
+            self._unsub_inputs()
+            self._unsub_inputs = None
+        if not self.event_driven or self.hub is not None:
+            return
+        eids = list(self._filter_keys)
+        for eid in eids:
+            self._last_inputs[eid] = self.feed_input(eid, self.hass.states.get(eid))
+        self._unsub_inputs = async_track_state_change_event(self.hass, eids, self._handle_input_event)
+
+    # ------------------------------------------------------------------
+    # Input filters
+    # ------------------------------------------------------------------
+    def _build_filters(self) -> None:
+        data = self.entry.data
+        self.filters = {
+            key: make_input_filter(self.input_filter, "hum" if key == CONF_HUM_IN else "temp")
+            for key in (CONF_TEMP_IN, CONF_HUM_IN, CONF_TEMP_OUT)
+            if data.get(key)
+        }
+        self._filter_keys = {data[k]: k for k in (CONF_TEMP_IN, CONF_HUM_IN) if data.get(k)}
+
+    @callback
+    def feed_input(self, entity_id: str, state: State | None) -> float | None:
+        """Filter a new state of input *entity_id*; returns the filtered value."""
+        if (key := self._filter_keys.get(entity_id)) is None:
+            return state_float(state)
+        return self.filters[key].update(state_float(state), monotonic(), state)
+
+    @callback
+    def read_input(self, key: str) -> float | None:
+        """Filtered value of input *key* (None: not configured, unavailable or stale)."""
+        if (flt := self.filters.get(key)) is None:
+            return None
+        state = self.hass.states.get(self.entry.data[key])
+        return flt.update(state_float(state), monotonic(), state)  # same state: no new sample
+
+    def filters_as_dict(self) -> dict[str, dict[str, Any]]:
+        now = monotonic()
+        return {key: flt.as_dict(now) for key, flt in self.filters.items()}
+
+    @callback
+    def _async_track_forecast(self, entity_id: str | None) -> None:
+        """(Re)subscribe to the shared forecast of *entity_id* (None = off)."""
+        current = self.forecast.entity_id if self.forecast is not None else None
+        if entity_id == current:
+            return
+        from .forecast import async_acquire_forecast, async_release_forecast
+
+        zone: str = self.entry.data[CONF_NAME]
+        if self.forecast is not None:
+            if self._unsub_forecast:
+                self._unsub_forecast()
+                self._unsub_forecast = None
+            async_release_forecast(self.hass, self.forecast, zone)
+            self.forecast = None
+            self.trajectory = self._trajectory_src = None
+        if entity_id:
+            self.forecast = async_acquire_forecast(self.hass, entity_id, zone)
+            self._unsub_forecast = self.forecast.async_add_listener(self._handle_forecast_update)
+
+    @callback
+    def _handle_forecast_update(self) -> None:
+        """New forecast (listeners are not called for unchanged ones)."""
+        self.async_schedule_recompute()
+
+    @callback
+    def _handle_outdoor_update(self) -> None:
+        """Fan-out target: evaluate this zone (after its phase offset)."""
+        assert self.outdoor is not None
+        if not self.outdoor.last_update_success:
+            self.async_set_update_error(
+                self.outdoor.last_exception or UpdateFailed("Outdoor sensor unavailable")
+            )
+            return
+        if self._unsub_staggered is not None:
+            return  # already waiting for our slot – it will read the newest sample
+        delay = async_get_scheduler(self.hass).delay(self.entry.data[CONF_NAME])
+        if delay <= 0:
+            self._evaluate_outdoor()
+        else:
+            self._unsub_staggered = async_call_later(self.hass, delay, self._handle_slot)
+
+    @callback
+    def _handle_slot(self, _now: Any) -> None:
+        self._unsub_staggered = None
+        if self.outdoor is not None and self.outdoor.last_update_success:
+            self._evaluate_outdoor()
+
+    @callback
+    def _evaluate_outdoor(self) -> None:
+        assert self.outdoor is not None
+        self.async_set_updated_data(self._compute(self._model_t_out(self.outdoor)))
+
+    @callback
+    def _handle_input_event(self, event: Event) -> None:
+        eid: str = event.data["entity_id"]
+        value = self.feed_input(eid, event.data.get("new_state"))
+        last = self._last_inputs.get(eid)
+
+        if value is None and last is None:
+            return
+        if value is not None and last is not None and abs(value - last) <= self.epsilon:
+            return  # jitter – wait until the input really moved
+
+        self._last_inputs[eid] = value
+        self.async_schedule_recompute()
+
+    # ------------------------------------------------------------------
+    # Live parameters – sliders and options flow, no entry reload
+    # ------------------------------------------------------------------
+    @callback
+    def _handle_param_event(self, event: Event) -> None:
+        if self._bulk_params:
+            return  # async_set_params reloads once at the end
+        self.async_update_params(
+            _load_params_from_helpers(self.hass, self.entry.data[CONF_NAME], self.entry.options)
+        )
+
+    @callback
+    def async_update_params(self, params: ComfortParams) -> bool:
+        """Swap in *params* and recompute; no-op when nothing changed."""
+        if self.learn_thermal and (learned := self.estimator.learned()) is not None:
+            params = replace(params, ua_total=learned[0], q_int=learned[1])
+        if params == self.params:
+            return False
+        self.params = params
+        _LOGGER.debug("[%s] Comfort parameters updated: %s", self.entry.data[CONF_NAME], params)
+        self.async_schedule_recompute()
+        return True
+
+    @callback
+    def async_set_params(self, values: Mapping[str, float]) -> bool:
+        """Write validated slider *values* (slug -> value) in one go, recompute once.
+
+        The slider states are written directly (no ``number.set_value`` call
+        per slider) and their state events do not reload the parameters one by
+        one; the zone reloads them once and schedules a single recompute.
+        """
+        numbers = self.hass.data[DOMAIN][self.entry.data[CONF_NAME]]["numbers"]
+        self._bulk_params = True
+        try:
+            for slug, value in values.items():
+                if numbers[slug].native_value != value:
+                    numbers[slug].async_write_value(value)
+        finally:
+            self._bulk_params = False
+        return self.async_update_params(
+            _load_params_from_helpers(self.hass, self.entry.data[CONF_NAME], self.entry.options)
+        )
+
+    def _apply_cycle_limits(self, opts: Mapping[str, Any]) -> None:
+        self.controller.min_run = float(opts.get(CONF_MIN_RUN, DEF_MIN_RUN)) * 60
+        self.controller.min_off = float(opts.get(CONF_MIN_OFF, DEF_MIN_OFF)) * 60
+
+    @callback
+    def async_apply_options(self) -> None:
+        """Re-read entry.options (options-flow edit) and apply them in place."""
+        opts = self.entry.options
+        self._apply_cycle_limits(opts)
+        self.state_epsilon = float(opts.get(CONF_STATE_EPSILON, DEF_STATE_EPSILON))
+        if self.trv is not None:
+            self.trv.set_budget(int(opts.get(CONF_TRV_MAX_WRITES, DEF_TRV_MAX_WRITES)))
+        if bool(opts.get(CONF_METRICS, DEF_METRICS)) != (self.metrics is not None):
+            self.metrics = ZoneMetrics() if self.metrics is None else None
+            self.async_schedule_recompute()  # metric sensors follow on the next tick
+        self.learn_thermal = opts.get(CONF_LEARN_THERMAL, DEF_LEARN_THERMAL)
+        precondition_h = int(opts.get(CONF_PRECONDITION_H, DEF_PRECONDITION_H))
+        forecast_entity = opts.get(CONF_FORECAST_ENTITY) or None
+        forecast_changed = forecast_entity != (
+            self.forecast.entity_id if self.forecast is not None else None
+        )
+        if self.outdoor is not None:  # started – otherwise async_start picks it up
+            self._async_track_forecast(forecast_entity)
+        if forecast_changed or precondition_h != self.precondition_h:
+            self.precondition_h = precondition_h
+            self.async_schedule_recompute()
+        input_filter = opts.get(CONF_INPUT_FILTER, DEF_INPUT_FILTER)
+        if input_filter != self.input_filter:
+            self.input_filter = input_filter
+            self._build_filters()
+            self.async_schedule_recompute()
+        outdoor_input = opts.get(CONF_OUTDOOR_INPUT, DEF_OUTDOOR_INPUT)
+        if outdoor_input != self.outdoor_input:
+            self.outdoor_input = outdoor_input
+            self.async_schedule_recompute()
+
+        event_driven: bool = opts.get(CONF_EVENT_DRIVEN, DEF_EVENT_DRIVEN)
+        epsilon = float(opts.get(CONF_EVENT_EPSILON, DEF_EVENT_EPSILON))
+        if (event_driven, epsilon) != (self.event_driven, self.epsilon):
+            self.event_driven, self.epsilon = event_driven, epsilon
+            if self.outdoor is not None:
+                async_acquire_outdoor(
+                    self.hass,
+                    self.outdoor.entity_id,
+                    self.entry.data[CONF_NAME],
+                    event_driven=event_driven,
+                    epsilon=epsilon,
+                )
+                self._async_track_inputs()
+        self.async_update_params(
+            _load_params_from_helpers(self.hass, self.entry.data[CONF_NAME], opts)
+        )
+
+    # ------------------------------------------------------------------
+    # Thermal identification – fed by the climate entity
+    # ------------------------------------------------------------------
+    async def async_load_thermal(self) -> None:
+        """Restore the estimator state saved before the last restart."""
+        self._thermal_store = Store(
+            self.hass, THERMAL_STORE_VERSION, f"{DOMAIN}.thermal.{self.entry.entry_id}"
+        )
+        if (data := await self._thermal_store.async_load()) is not None:
+            self.estimator.restore(data)
+
+    @callback
+    def async_observe_thermal(self, t_in: float, free_floating: bool) -> None:
+        """Feed one indoor sample (plus the shared outdoor one) to the estimator."""
+        outdoor = self.outdoor
+        if outdoor is None or outdoor.data is None or not outdoor.last_update_success:
+            return
+        if not self.estimator.observe(time(), t_in, outdoor.data, free_floating):
+            return
+        if self._thermal_store is not None:
+            self._thermal_store.async_delay_save(self.estimator.as_dict, THERMAL_SAVE_DELAY_SEC)
+        if self.learn_thermal:
+            self.async_update_params(self.params)
+
+    # ------------------------------------------------------------------
+    # Set-point
+    # ------------------------------------------------------------------
+    async def _async_update_data(self) -> float:  # type: ignore[override]
+        if self.outdoor is None:
+            raise UpdateFailed("Zone not started")
+        if (m := self.metrics) is not None:
+            t0 = now_ns()
+            await self.outdoor.async_ensure_data()
+            m.record(STAGE_SENSOR_READ, t0)
+        else:
+            await self.outdoor.async_ensure_data()
+        if not self.outdoor.last_update_success:
+            raise UpdateFailed(f"Outdoor sensor {self.outdoor.entity_id} unavailable")
+        return self._compute(self._model_t_out(self.outdoor))
+
+    def _model_t_out(self, outdoor: OutdoorCoordinator) -> float:
+        """Outdoor temperature fed to the model: running mean or filtered instant."""
+        if self.outdoor_input == OUTDOOR_INPUT_RUNNING_MEAN and outdoor.running_mean is not None:
+            self.last_t_out = outdoor.running_mean
+            return self.last_t_out
+        # the sample object is the stamp: re-evaluations between outdoor reads are not new samples
+        value = self.filters[CONF_TEMP_OUT].update(outdoor.data, monotonic(), outdoor.data)
+        self.last_t_out = outdoor.data if value is None else value
+        return self.last_t_out
+
+    def _current_trajectory(self) -> SetpointTrajectory | None:
+        """Trajectory for the current forecast/params, rebuilt only on change."""
+        forecast = self.forecast
+        if forecast is None or forecast.data is None or not forecast.last_update_success:
+            return None
+        src = self._trajectory_src
+        if (
+            src is None
+            or src[0] is not forecast.data
+            or src[1] is not self.params
+            or src[2] != self.precondition_h
+        ):
+            from .forecast import SetpointTrajectory  # loaded with the forecast
+
+            self.trajectory = SetpointTrajectory.build(
+                forecast.data, self.params, self.precondition_h
+            )
+            self._trajectory_src = (forecast.data, self.params, self.precondition_h)
+        return self.trajectory
+
+    def _precondition(self, sp: float, t_out: float) -> float:
+        """Pull the reactive set-point *sp* along the forecast trajectory."""
+        if (traj := self._current_trajectory()) is not None:
+            sp = traj.adjust(time(), sp, t_out > self.params.t_bal_cool)
+        return sp
+
+    def _predictive_setpoint(self, t_out: float) -> float:
+        return self._precondition(adaptive_setpoint(t_out, self.params), t_out)
+
+    def _compute(self, t_out: float) -> float:
+        if (m := self.metrics) is not None:
+            t0 = now_ns()
+            sp = self._predictive_setpoint(t_out)
+            m.record(STAGE_SETPOINT, t0)
+            m.ticks += 1
+        else:
+            sp = self._predictive_setpoint(t_out)
+        _LOGGER.debug("[%s] Adaptive set-point %.1f °C (Tout %.1f °C)", self.entry.data[CONF_NAME], sp, t_out)
+        return sp
+
+
+# -----------------------------------------------------------------------------
+# Parameters – current slider values
+# -----------------------------------------------------------------------------
+
+def _load_params_from_helpers(
+    hass: HomeAssistant, zone: str, options: Mapping[str, Any] | None = None
+) -> ComfortParams:
+    """Build ComfortParams from current slider values (number.thermoadapt_*).
+
+    Sliders that are not available yet fall back to the options-flow value,
+    then to the registry default (``params.DEFAULTS``).
+    """
+    g = hass.states.get
+    opts = options or {}
+
+    def f(slug: str) -> float:
+        value = state_float(g(param_entity_id(zone, slug)))
+        return value if value is not None else float(opts.get(slug, DEFAULTS[slug]))
+
+    deadband = f("deadband")
+    # heating dead-band: own slider, else the (older) shared dead-band
+    deadband_heat = state_float(g(param_entity_id(zone, "deadband_heat")))
+    if deadband_heat is None:
+        deadband_heat = float(opts.get("deadband_heat", deadband))
+    return ComfortParams(
+        tc_base       = f("setpoint"),
+        tc_min        = f("temp_min"),
+        th_base       = f("heat_base"),
+        k_heat        = f("k_heat"),
+        deadband_cool = deadband,
+        deadband_heat = deadband_heat,
+        humid_max     = int(f("humid_max")),
+    )
@@ -0,0 +1,164 @@
+"""ThermoAdapt – per-zone decision log
+
+A fixed-size ring of the last ``DECISION_LOG_SIZE`` control decisions of one
+zone, so an oscillating zone can be explained without digging through the
+recorder: what the sensors said, which equation and dead-band applied, which
+mode it was in, which it chose and which actuators were commanded.
+
+Storage is one ``array.array`` per column of compact fixed-point values –
+18 bytes per decision, about 52 KB for 24 h at the 30 s tick – grown on
+demand up to the size and then overwritten oldest first.  No Home Assistant
+imports besides the mode enum; decoding happens only on export
+(``rows`` / ``as_dict`` / ``as_csv``).
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Final, Iterator
+
+from homeassistant.components.climate import HVACMode
+
+# Command flags (one byte per decision)
+CMD_AC: Final = 1        # split-AC mode / set-point
+CMD_TRV: Final = 2       # TRV set-point
+CMD_SAFETY: Final = 4    # TRV frost protection
+EQ_HEAT: Final = 8       # heating equation (else cooling)
+
+COLUMNS: Final = (
+    "time", "t_in", "t_out", "setpoint", "t_bal", "equation", "deadband",
+    "hum", "mode_before", "mode_after", "commands",
+)
+
+_MODES: Final = (HVACMode.OFF, HVACMode.COOL, HVACMode.HEAT, HVACMode.DRY)
+_MODE_INDEX: Final = {mode: i for i, mode in enumerate(_MODES)}
+_NO_TEMP: Final = -32768   # int16 sentinel – reading unavailable
+_NO_HUM: Final = 255
+
+
+def _centi(value: float | None) -> int:
+    if value is None:
+        return _NO_TEMP
+    raw = round(value * 100)
+    return raw if -32767 <= raw <= 32767 else (32767 if raw > 0 else -32767)
+
+
+def _decenti(raw: int) -> float | None:
+    return None if raw == _NO_TEMP else raw / 100
+
+
+def _commands(flags: int) -> str:
+    return "|".join(
+        name for bit, name in ((CMD_AC, "ac"), (CMD_TRV, "trv"), (CMD_SAFETY, "safety"))
+        if flags & bit
+    )
+
+
+class DecisionLog:
+    """Ring buffer of compact decision records (oldest overwritten first)."""
+
+    __slots__ = (
+        "size", "total", "_next",
+        "_ts", "_t_in", "_t_out", "_sp", "_t_bal", "_db", "_hum", "_before", "_after", "_flags",
+    )
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.total = 0     # decisions recorded since start (incl. overwritten)
+        self._next = 0     # slot of the next record once full
+        self._ts = array("I")                # epoch seconds
+        self._t_in = array("h")              # °C × 100
+        self._t_out = array("h")
+        self._sp = array("h")
+        self._t_bal = array("h")
+        self._db = array("h")
+        self._hum = array("B")               # % RH
+        self._before = array("B")            # index into _MODES
+        self._after = array("B")
+        self._flags = array("B")             # CMD_* | EQ_HEAT
+
+    def __len__(self) -> int:
+        return len(self._ts)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            col.itemsize * len(col)
+            for col in (self._ts, self._t_in, self._t_out, self._sp, self._t_bal,
+                        self._db, self._hum, self._before, self._after, self._flags)
+        )
+
+    def record(
+        self,
+        ts: float,
+        t_in: float | None,
+        t_out: float | None,
+        setpoint: float | None,
+        t_bal: float,
+        deadband: float,
+        hum: float | None,
+        mode_before: HVACMode,
+        mode_after: HVACMode,
+        flags: int,
+    ) -> None:
+        self.total += 1
+        if len(self._ts) < self.size:  # still growing – append a slot to every column
+            for col in (self._ts, self._t_in, self._t_out, self._sp, self._t_bal,
+                        self._db, self._hum, self._before, self._after, self._flags):
+                col.append(0)
+            i = len(self._ts) - 1
+        else:
+            i = self._next
+            self._next = (i + 1) % self.size
+        self._ts[i] = int(ts)
+        self._t_in[i] = _centi(t_in)
+        self._t_out[i] = _centi(t_out)
+        self._sp[i] = _centi(setpoint)
+        self._t_bal[i] = _centi(t_bal)
+        self._db[i] = _centi(deadband)
+        self._hum[i] = _NO_HUM if hum is None else max(min(int(hum + 0.5), 254), 0)
+        self._before[i] = _MODE_INDEX.get(mode_before, 0)
+        self._after[i] = _MODE_INDEX.get(mode_after, 0)
+        self._flags[i] = flags
+
+    def rows(self) -> Iterator[tuple[Any, ...]]:
+        """Decoded records, oldest first, in ``COLUMNS`` order."""
+        n = len(self._ts)
+        start = self._next if n == self.size else 0
+        for k in range(n):
+            i = (start + k) % n
+            flags = self._flags[i]
+            hum = self._hum[i]
+            yield (
+                datetime.fromtimestamp(self._ts[i], timezone.utc).isoformat(),
+                _decenti(self._t_in[i]),
+                _decenti(self._t_out[i]),
+                _decenti(self._sp[i]),
+                _decenti(self._t_bal[i]),
+                "heat" if flags & EQ_HEAT else "cool",
+                _decenti(self._db[i]),
+                None if hum == _NO_HUM else hum,
+                str(_MODES[self._before[i]]),
+                str(_MODES[self._after[i]]),
+                _commands(flags),
+            )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "size": self.size,
+            "count": len(self),
+            "total": self.total,
+            "bytes": self.nbytes,
+            "columns": list(COLUMNS),
+            "rows": [list(row) for row in self.rows()],
+        }
+
+    def as_csv(self) -> str:
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(COLUMNS)
+        writer.writerows(("" if v is None else v for v in row) for row in self.rows())
+        return buf.getvalue()
@@ -0,0 +1,82 @@
+"""ThermoAdapt – config-entry diagnostics download
+
+Settings ▸ Devices & Services ▸ ThermoAdapt ▸ ⋮ ▸ *Download diagnostics*
+returns the zone configuration, live comfort parameters, the shared outdoor
+sample, actuator command counters and – when *diagnostics_metrics* is enabled
+in the options – per-stage latency histograms of the control hot path.
+The zone's decision log (last 24 h of ticks) is included as a compact table.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+
+from .commands import async_get_command_queue
+from .const import CONF_CLIMATE_ENTITY, CONF_TRV_ENTITY, DOMAIN
+from .pacing import async_get_rate_limiter, async_get_scheduler
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for one zone."""
+    zone = entry.data[CONF_NAME]
+    coordinator = hass.data[DOMAIN][zone]["coordinator"]
+    outdoor = coordinator.outdoor
+
+    actuators = [entry.data.get(k) for k in (CONF_CLIMATE_ENTITY, CONF_TRV_ENTITY)]
+    return {
+        "entry": {"data": dict(entry.data), "options": dict(entry.options)},
+        "params": asdict(coordinator.params),
+        "setpoint": coordinator.data,
+        "last_update_success": coordinator.last_update_success,
+        "event_driven": coordinator.event_driven,
+        "outdoor_input": coordinator.outdoor_input,
+        "input_filter": coordinator.input_filter,
+        "filters": coordinator.filters_as_dict(),
+        "trv": None if coordinator.trv is None else coordinator.trv.as_dict(),
+        "outdoor": None if outdoor is None else {
+            "entity_id": outdoor.entity_id,
+            "value": outdoor.data,
+            "running_mean": outdoor.running_mean,
+            "last_update_success": outdoor.last_update_success,
+            "update_interval_s": outdoor.update_interval.total_seconds()
+            if outdoor.update_interval else None,
+        },
+        "forecast": None if coordinator.forecast is None else {
+            "entity_id": coordinator.forecast.entity_id,
+            "last_update_success": coordinator.forecast.last_update_success,
+            "hours": len(coordinator.forecast.data.times) if coordinator.forecast.data else 0,
+            "precondition_hours": coordinator.precondition_h,
+            "trajectory": coordinator.trajectory.as_dict() if coordinator.trajectory else None,
+        },
+        "thermal": {
+            **coordinator.estimator.as_dict(),
+            "ua_total": coordinator.estimator.ua_total,
+            "q_int": coordinator.estimator.q_int,
+            "learned": coordinator.estimator.learned(),
+            "feedback": coordinator.learn_thermal,
+        },
+        "controller": {
+            "mode": coordinator.controller.mode,
+            "min_run_s": coordinator.controller.min_run,
+            "min_off_s": coordinator.controller.min_off,
+            **coordinator.controller.stats.as_dict(),
+        },
+        "commands": {
+            eid: async_get_command_queue(hass, eid).stats.as_dict() for eid in filter(None, actuators)
+        },
+        "pacing": {
+            "stagger_s": async_get_scheduler(hass).stagger,
+            "slot_delay_s": async_get_scheduler(hass).delay(zone),
+            "rate_limiter": async_get_rate_limiter(hass).as_dict(),
+        },
+        "hub": coordinator.hub.as_dict() if coordinator.hub is not None else None,
+        "metrics": coordinator.metrics.as_dict() if coordinator.metrics is not None else None,
+        "decisions": coordinator.decisions.as_dict(),
+    }
@@ -0,0 +1,155 @@
+"""ThermoAdapt – online identification of the zone's thermal parameters
+
+While the HVAC is off the room floats freely and follows the lumped RC model
+
+    C · dT_in/dt = UA · (T_out − T_in) + Q_int
+
+i.e. ``dT_in/dt = a · (T_out − T_in) + b`` with ``a = UA/C`` and ``b = Q_int/C``.
+``ThermalEstimator`` fits *a* and *b* by recursive least squares with a
+forgetting factor: every sample costs a handful of float operations and the
+state is two coefficients plus a 2×2 covariance, so nothing is re-fitted from
+recorder history and the state can be persisted in a few bytes.
+
+Free-floating data only identifies the ratio ``Q_int/UA`` – exactly what the
+balance temperatures need.  Absolute ``UA`` / ``Q_int`` are reported against a
+nominal capacitance (``THERMAL_CAPACITANCE``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Final
+
+from .const import (
+    THERMAL_CAPACITANCE,
+    THERMAL_FORGETTING,
+    THERMAL_MAX_GAP_SEC,
+    THERMAL_MIN_SAMPLES,
+    THERMAL_SAMPLE_SEC,
+)
+
+_P0: Final = 1.0e3          # initial covariance (uninformative prior)
+_P_MAX: Final = 1.0e6       # covariance trace cap – stops wind-up without excitation
+_MAX_SLOPE: Final = 10.0    # K/h – faster drifts are windows/doors, not the envelope
+
+# Plausible envelope – learned values outside are not fed back
+_UA_RANGE: Final = (5.0, 500.0)    # W/K
+_Q_RANGE: Final = (0.0, 5000.0)    # W
+
+
+@dataclass(slots=True)
+class _Sample:
+    ts: float      # POSIX seconds
+    t_in: float
+    t_out: float
+
+
+class ThermalEstimator:
+    """Two-parameter RLS fit of ``dT_in/dt = a·(T_out − T_in) + b`` (K/h)."""
+
+    __slots__ = ("a", "b", "p00", "p01", "p11", "samples", "forgetting", "_prev")
+
+    def __init__(self, forgetting: float = THERMAL_FORGETTING) -> None:
+        self.forgetting = forgetting
+        self.a = 0.0
+        self.b = 0.0
+        self.p00, self.p01, self.p11 = _P0, 0.0, _P0
+        self.samples = 0
+        self._prev: _Sample | None = None
+
+    # ------------------------------------------------------------------
+    # Observations
+    # ------------------------------------------------------------------
+    def observe(self, ts: float, t_in: float, t_out: float, free_floating: bool) -> bool:
+        """Feed one indoor/outdoor reading; return True when the fit moved.
+
+        Readings are accumulated until ``THERMAL_SAMPLE_SEC`` have elapsed;
+        any reading taken while the HVAC runs discards the pending interval.
+        """
+        if not free_floating:
+            self._prev = None
+            return False
+        prev = self._prev
+        if prev is None or ts - prev.ts > THERMAL_MAX_GAP_SEC or ts < prev.ts:
+            self._prev = _Sample(ts, t_in, t_out)
+            return False
+        dt_h = (ts - prev.ts) / 3600
+        if dt_h * 3600 < THERMAL_SAMPLE_SEC:
+            return False  # keep the interval start, wait for more signal
+
+        self._prev = _Sample(ts, t_in, t_out)
+        y = (t_in - prev.t_in) / dt_h
+        if abs(y) > _MAX_SLOPE:
+            return False
+        x = 0.5 * ((prev.t_out - prev.t_in) + (t_out - t_in))
+        self._update(x, y)
+        return True
+
+    def _update(self, x: float, y: float) -> None:
+        """RLS step for regressor (x, 1) and target y."""
+        lam = self.forgetting
+        p00, p01, p11 = self.p00, self.p01, self.p11
+        px0 = p00 * x + p01          # P·φ
+        px1 = p01 * x + p11
+        k_den = lam + x * px0 + px1
+        k0, k1 = px0 / k_den, px1 / k_den
+        err = y - (self.a * x + self.b)
+        self.a += k0 * err
+        self.b += k1 * err
+
+        # P ← (P − k·φᵀP) / λ, skipping the division once P is large enough
+        p00 -= k0 * px0
+        p01 -= k0 * px1
+        p11 -= k1 * px1
+        if p00 + p11 < _P_MAX:
+            p00, p01, p11 = p00 / lam, p01 / lam, p11 / lam
+        self.p00, self.p01, self.p11 = p00, p01, p11
+        self.samples += 1
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+    @property
+    def ua_total(self) -> float:
+        """Envelope conductance (W/K) for the nominal capacitance."""
+        return self.a * THERMAL_CAPACITANCE / 3600
+
+    @property
+    def q_int(self) -> float:
+        """Internal gains (W) for the nominal capacitance."""
+        return self.b * THERMAL_CAPACITANCE / 3600
+
+    def learned(self) -> tuple[float, float] | None:
+        """``(ua_total, q_int)`` once the fit is trustworthy, else None.
+
+        Rounded (0.5 W/K, 5 W) so feeding them back does not trigger a
+        recompute for every insignificant change.
+        """
+        if self.samples < THERMAL_MIN_SAMPLES:
+            return None
+        ua, q = self.ua_total, self.q_int
+        if not (_UA_RANGE[0] <= ua <= _UA_RANGE[1] and _Q_RANGE[0] <= q <= _Q_RANGE[1]):
+            return None
+        return round(ua * 2) / 2, round(q / 5) * 5
+
+    # ------------------------------------------------------------------
+    # Persistence (helpers.storage.Store payload)
+    # ------------------------------------------------------------------
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "a": self.a,
+            "b": self.b,
+            "p": [self.p00, self.p01, self.p11],
+            "samples": self.samples,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        try:
+            a, b = float(data["a"]), float(data["b"])
+            p00, p01, p11 = (float(v) for v in data["p"])
+            samples = int(data["samples"])
+        except (KeyError, TypeError, ValueError):
+            return  # corrupt/old payload – start from scratch
+        self.a, self.b = a, b
+        self.p00, self.p01, self.p11 = p00, p01, p11
+        self.samples = samples
@@ -0,0 +1,224 @@
+"""ThermoAdapt – streaming input filters
+
+Every zone runs its sensor readings (``temp_in``, ``hum_in`` and the outdoor
+sample) through an ``InputFilter`` before they reach the set-point and mode
+decisions, so one bad reading cannot flip COOL/OFF and send a round of device
+commands.  Per sample the filter
+
+* drops repeated reads of the same state (the *stamp*, e.g. the ``State``
+  object, is compared by identity);
+* holds the last good value while the sensor is ``unknown``/``unavailable``
+  and only reports it as *stale* (None) after ``FILTER_STALE_SEC``;
+* rejects outliers – a jump larger than ``max_jump`` plus ``max_rate`` × the
+  time since the last accepted sample – unless ``FILTER_OUTLIER_CONFIRM``
+  readings in a row agree, which is a real step and re-seeds the estimate;
+* smooths with one of three estimators: rolling median, EWMA (time constant
+  on irregular samples) or a scalar Kalman filter (random-walk model).
+
+Each step is constant time (the median window is fixed); the state is a few
+floats.  No Home Assistant imports – ``tools/sim`` runs the same filters
+(``simulate(input_filter=...)``).
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Any, Final
+
+from .const import (
+    FILTER_EWMA_TAU_SEC,
+    FILTER_HUM_SCALE,
+    FILTER_KALMAN_Q,
+    FILTER_KALMAN_R,
+    FILTER_MAX_JUMP,
+    FILTER_MAX_RATE,
+    FILTER_MEDIAN_WINDOW,
+    FILTER_OUTLIER_CONFIRM,
+    FILTER_STALE_SEC,
+    INPUT_FILTER_EWMA,
+    INPUT_FILTER_KALMAN,
+    INPUT_FILTER_MEDIAN,
+    INPUT_FILTER_NONE,
+)
+
+_UNSET: Final = object()
+
+
+# -----------------------------------------------------------------------------
+# Estimators – update(x, now) -> estimate
+# -----------------------------------------------------------------------------
+
+class _Passthrough:
+    __slots__ = ()
+
+    def update(self, x: float, now: float) -> float:
+        return x
+
+    def reset(self) -> None:
+        pass
+
+
+class _RollingMedian:
+    """Median of the last *window* samples (ring + sorted copy)."""
+
+    __slots__ = ("_ring", "_sorted")
+
+    def __init__(self, window: int) -> None:
+        self._ring: deque[float] = deque(maxlen=window)
+        self._sorted: list[float] = []
+
+    def update(self, x: float, now: float) -> float:
+        ring, srt = self._ring, self._sorted
+        if len(ring) == ring.maxlen:
+            del srt[bisect_left(srt, ring[0])]
+        ring.append(x)
+        insort(srt, x)
+        n = len(srt)
+        mid = n // 2
+        return srt[mid] if n % 2 else (srt[mid - 1] + srt[mid]) / 2
+
+    def reset(self) -> None:
+        self._ring.clear()
+        self._sorted.clear()
+
+
+class _Ewma:
+    """Exponential moving average with time constant *tau* seconds."""
+
+    __slots__ = ("tau", "_x", "_ts")
+
+    def __init__(self, tau: float) -> None:
+        self.tau = tau
+        self._x: float | None = None
+        self._ts = 0.0
+
+    def update(self, x: float, now: float) -> float:
+        if self._x is None:
+            self._x = x
+        else:
+            alpha = 1.0 - math.exp(-max(now - self._ts, 0.0) / self.tau)
+            self._x += alpha * (x - self._x)
+        self._ts = now
+        return self._x
+
+    def reset(self) -> None:
+        self._x = None
+
+
+class _Kalman:
+    """Scalar Kalman filter, random walk with *q* (unit²/s) and noise *r* (unit²)."""
+
+    __slots__ = ("q", "r", "_x", "_p", "_ts")
+
+    def __init__(self, q: float, r: float) -> None:
+        self.q, self.r = q, r
+        self._x: float | None = None
+        self._p = r
+        self._ts = 0.0
+
+    def update(self, x: float, now: float) -> float:
+        if self._x is None:
+            self._x, self._p = x, self.r
+        else:
+            p = self._p + self.q * max(now - self._ts, 0.0)
+            k = p / (p + self.r)
+            self._x += k * (x - self._x)
+            self._p = (1.0 - k) * p
+        self._ts = now
+        return self._x
+
+    def reset(self) -> None:
+        self._x = None
+
+
+# -----------------------------------------------------------------------------
+# Filter stage
+# -----------------------------------------------------------------------------
+
+class InputFilter:
+    """Staleness hold, outlier rejection and smoothing of one sensor."""
+
+    __slots__ = (
+        "method", "max_jump", "max_rate", "hold", "value", "raw", "samples", "rejected",
+        "_est", "_stamp", "_good_ts", "_bad_since", "_streak",
+    )
+
+    def __init__(self, method: str = INPUT_FILTER_MEDIAN, *, scale: float = 1.0) -> None:
+        self.method = method
+        if method == INPUT_FILTER_MEDIAN:
+            self._est: Any = _RollingMedian(FILTER_MEDIAN_WINDOW)
+        elif method == INPUT_FILTER_EWMA:
+            self._est = _Ewma(FILTER_EWMA_TAU_SEC)
+        elif method == INPUT_FILTER_KALMAN:
+            self._est = _Kalman(FILTER_KALMAN_Q * scale**2, FILTER_KALMAN_R * scale**2)
+        else:
+            self._est = _Passthrough()
+        raw_only = method == INPUT_FILTER_NONE
+        self.max_jump = math.inf if raw_only else FILTER_MAX_JUMP * scale
+        self.max_rate = FILTER_MAX_RATE * scale / 3600.0  # per second
+        self.hold = 0.0 if raw_only else float(FILTER_STALE_SEC)
+        self.value: float | None = None  # filtered estimate (last accepted)
+        self.raw: float | None = None    # last reading, accepted or not
+        self.samples = 0
+        self.rejected = 0
+        self._stamp: object = _UNSET
+        self._good_ts = 0.0
+        self._bad_since: float | None = None
+        self._streak = 0
+
+    def update(self, raw: float | None, now: float, stamp: object = _UNSET) -> float | None:
+        """Feed a reading taken at monotonic time *now*; returns ``current(now)``.
+
+        A *stamp* identical to the previous one means the same reading again
+        (e.g. the unchanged ``State``) and is not counted as a new sample.
+        """
+        if stamp is not _UNSET and stamp is self._stamp:
+            return self.current(now)
+        self._stamp = stamp
+        self.raw = raw
+        if raw is None:
+            if self._bad_since is None:
+                self._bad_since = now
+            return self.current(now)
+        if self._bad_since is not None and now - self._bad_since >= self.hold:
+            self._est.reset()  # back from stale – old samples no longer count
+        self._bad_since = None
+
+        est = self.value
+        if est is not None and abs(raw - est) > self.max_jump + self.max_rate * (now - self._good_ts):
+            self._streak += 1
+            if self._streak < FILTER_OUTLIER_CONFIRM:
+                self.rejected += 1
+                return est
+            self._est.reset()  # it persists – a real step, start over from here
+        self._streak = 0
+        self.value = self._est.update(raw, now)
+        self._good_ts = now
+        self.samples += 1
+        return self.value
+
+    def current(self, now: float) -> float | None:
+        """Filtered value, or None while the sensor has been invalid too long."""
+        if self._bad_since is not None and now - self._bad_since >= self.hold:
+            return None
+        return self.value
+
+    def stale(self, now: float) -> bool:
+        return self.value is not None and self.current(now) is None
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        return {
+            "method": self.method,
+            "value": None if self.value is None else round(self.value, 2),
+            "raw": self.raw,
+            "samples": self.samples,
+            "rejected": self.rejected,
+            "stale": self.stale(now),
+        }
+
+
+def make_input_filter(method: str, role: str = "temp") -> InputFilter:
+    """Filter for a temperature (°C) or humidity (``role="hum"``, % RH) input."""
+    return InputFilter(method, scale=FILTER_HUM_SCALE if role == "hum" else 1.0)
@@ -0,0 +1,220 @@
+"""ThermoAdapt – forecast-driven set-point trajectory (predictive mode)
+
+With a ``weather.*`` entity configured, the zone looks ahead: the hourly
+forecast is turned into an adaptive set-point trajectory for the next hours in
+one batched evaluation (``batch.evaluate_setpoints``), and the current
+set-point is pulled towards the upcoming extreme within the *pre-condition*
+lead time – pre-cooling before a heat peak, pre-heating before a cold spell –
+so compressors run in the milder, more efficient hours.
+
+One ``ForecastCoordinator`` per weather entity is shared by all zones (same
+registry pattern as ``outdoor``).  It calls ``weather.get_forecasts`` on a slow
+timer and when the weather entity updates; because it is created with
+``always_update=False`` its listeners – and so the trajectory computation –
+only run when the forecast actually changed, never on a regular zone tick.
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Final
+
+from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import TemperatureConverter
+
+from .batch import evaluate_setpoints
+from .const import (
+    DATA_FORECAST,
+    DOMAIN,
+    EVENT_DEBOUNCE_SEC,
+    FORECAST_HORIZON_H,
+    FORECAST_SCAN_INTERVAL_SEC,
+)
+from .models import ComfortParams
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+_HOUR: Final = 3600.0
+
+
+@dataclass(frozen=True, slots=True)
+class HourlyForecast:
+    """Forecast hours (POSIX start time) and outdoor temperature (°C)."""
+
+    times: tuple[float, ...]
+    temps: tuple[float, ...]
+
+
+# -----------------------------------------------------------------------------
+# Trajectory – computed once per (forecast, params)
+# -----------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class SetpointTrajectory:
+    """Adaptive set-point per forecast hour and the extremes ahead of it.
+
+    ``cool_ahead[i]`` is the lowest cooling set-point and ``heat_ahead[i]`` the
+    highest heating set-point among hours ``i … i + lead`` (None when that
+    window has no hour of the season).
+    """
+
+    times: tuple[float, ...]
+    setpoint: tuple[float, ...]
+    cooling: tuple[bool, ...]
+    cool_ahead: tuple[float | None, ...]
+    heat_ahead: tuple[float | None, ...]
+
+    @classmethod
+    def build(cls, forecast: HourlyForecast, params: ComfortParams, lead_h: int) -> SetpointTrajectory:
+        res = evaluate_setpoints(forecast.temps, params)
+        sps = tuple(round(float(sp), 1) for sp in res.setpoint)
+        cooling = tuple(bool(c) for c in res.cooling)
+
+        n = len(sps)
+        cool_ahead: list[float | None] = []
+        heat_ahead: list[float | None] = []
+        for i in range(n):
+            window = range(i, min(i + lead_h + 1, n))
+            cool = [sps[j] for j in window if cooling[j]]
+            heat = [sps[j] for j in window if not cooling[j]]
+            cool_ahead.append(min(cool) if cool else None)
+            heat_ahead.append(max(heat) if heat else None)
+        return cls(forecast.times, sps, cooling, tuple(cool_ahead), tuple(heat_ahead))
+
+    def adjust(self, ts: float, sp: float, cooling: bool) -> float:
+        """Pre-conditioned set-point for *now* (*sp* = reactive set-point).
+
+        Only moves *sp* within the current season: lower while cooling, higher
+        while heating.  Outside the forecast range *sp* is returned unchanged.
+        """
+        i = bisect_right(self.times, ts) - 1
+        if i < 0 or ts >= self.times[-1] + _HOUR:
+            return sp
+        if cooling:
+            ahead = self.cool_ahead[i]
+            return min(sp, ahead) if ahead is not None else sp
+        ahead = self.heat_ahead[i]
+        return max(sp, ahead) if ahead is not None else sp
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "start": dt_util.utc_from_timestamp(self.times[0]).isoformat() if self.times else None,
+            "setpoint": list(self.setpoint),
+            "cooling": list(self.cooling),
+        }
+
+
+# -----------------------------------------------------------------------------
+# Shared forecast reader
+# -----------------------------------------------------------------------------
+
+class ForecastCoordinator(DataUpdateCoordinator[HourlyForecast]):
+    """Hourly forecast of one weather entity, shared by all zones using it."""
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"thermoadapt_forecast_{entity_id}",
+            update_interval=timedelta(seconds=FORECAST_SCAN_INTERVAL_SEC),
+            always_update=False,  # listeners only see *new* forecasts
+        )
+        self.entity_id = entity_id
+        self._zones: set[str] = set()
+        self._unsub_state: CALLBACK_TYPE | None = None
+        self._event_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=EVENT_DEBOUNCE_SEC,
+            immediate=False,
+            function=self.async_refresh,
+        )
+
+    async def _async_update_data(self) -> HourlyForecast:  # type: ignore[override]
+        try:
+            resp = await self.hass.services.async_call(
+                "weather",
+                "get_forecasts",
+                {"entity_id": self.entity_id, "type": "hourly"},
+                blocking=True,
+                return_response=True,
+            )
+        except Exception as exc:  # service missing, entity gone, no hourly support…
+            raise UpdateFailed(f"Forecast of {self.entity_id} unavailable: {exc}") from exc
+
+        items = ((resp or {}).get(self.entity_id) or {}).get("forecast") or []
+        st = self.hass.states.get(self.entity_id)
+        unit = st.attributes.get("temperature_unit") if st else None
+
+        times: list[float] = []
+        temps: list[float] = []
+        for item in items[:FORECAST_HORIZON_H]:
+            when = dt_util.parse_datetime(str(item.get("datetime", "")))
+            temp = item.get(ATTR_TEMPERATURE)
+            if when is None or temp is None:
+                continue
+            temp = float(temp)
+            if unit == UnitOfTemperature.FAHRENHEIT:
+                temp = TemperatureConverter.convert(
+                    temp, UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.CELSIUS
+                )
+            times.append(when.timestamp())
+            temps.append(temp)
+        if not times:
+            raise UpdateFailed(f"No hourly forecast from {self.entity_id}")
+        forecast = HourlyForecast(tuple(times), tuple(temps))
+        # keep the same object when unchanged – zones cache their trajectory by identity
+        return self.data if forecast == self.data else forecast
+
+    @callback
+    def _handle_state_event(self, event: Event) -> None:
+        self._event_debouncer.async_schedule_call()
+
+    @callback
+    def _async_attach(self, zone: str) -> None:
+        self._zones.add(zone)
+        if self._unsub_state is None:
+            self._unsub_state = async_track_state_change_event(
+                self.hass, [self.entity_id], self._handle_state_event
+            )
+            self.hass.async_create_background_task(
+                self.async_refresh(), f"thermoadapt forecast {self.entity_id}"
+            )
+
+    @callback
+    def _async_detach(self, zone: str) -> bool:
+        self._zones.discard(zone)
+        if self._zones:
+            return False
+        if self._unsub_state:
+            self._unsub_state()
+            self._unsub_state = None
+        self._event_debouncer.async_cancel()
+        return True
+
+
+@callback
+def async_acquire_forecast(hass: HomeAssistant, entity_id: str, zone: str) -> ForecastCoordinator:
+    """Return the shared forecast coordinator for *entity_id*."""
+    registry: dict[str, ForecastCoordinator] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_FORECAST, {}
+    )
+    if (forecast := registry.get(entity_id)) is None:
+        forecast = registry[entity_id] = ForecastCoordinator(hass, entity_id)
+    forecast._async_attach(zone)
+    return forecast
+
+
+@callback
+def async_release_forecast(hass: HomeAssistant, forecast: ForecastCoordinator, zone: str) -> None:
+    """Unsubscribe *zone*; drops the coordinator once its last zone is gone."""
+    if forecast._async_detach(zone):
+        hass.data[DOMAIN][DATA_FORECAST].pop(forecast.entity_id, None)
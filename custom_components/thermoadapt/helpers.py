@@ -7,36 +7,87 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Dict
+from typing import Dict, Iterable, Tuple
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 
-from .number import PARAMS
-from .const import DOMAIN, HELPER_SUFFIXES
+from .const import DOMAIN, HELPER_CREATE_CONCURRENCY
+from .models import ComfortParams
+from .params import PARAMS
 
 _LOGGER = logging.getLogger(__name__)
 
+# -----------------------------------------------------------------------------
+# State parsing
+# -----------------------------------------------------------------------------
+
+def state_float(st: State | None) -> float | None:
+    """Numeric value of a sensor state, or None when unknown/unavailable."""
+    if st is None or st.state in ("unknown", "unavailable"):
+        return None
+    try:
+        return float(st.state)
+    except (TypeError, ValueError):
+        return None
+
 # -----------------------------------------------------------------------------
 # Equations – used by ThermoAdaptCoordinator
 # -----------------------------------------------------------------------------
 
-def tset_cool(t_out: float, p) -> float:  # p: ComfortParams or Mapping
+def tset_cool(t_out: float, p: ComfortParams) -> float:
     """Adaptive cooling set-point (Dear & Brager 1998, Eq. 7)."""
-    t_bal = p.tc_base - p.q_int / p.ua_total
-    k_cool = (p.tc_base - p.tc_min) / (t_out - t_bal) if t_out > t_bal else 0
+    t_bal = p.t_bal_cool
+    k_cool = p.cool_span / (t_out - t_bal) if t_out > t_bal else 0
     return p.tc_base if t_out <= t_bal else p.tc_base - k_cool * (t_out - t_bal)
 
 
-def tset_heat(t_out: float, p) -> float:  # p: ComfortParams or Mapping
+def tset_heat(t_out: float, p: ComfortParams) -> float:
     """Adaptive heating set-point (Dear & Brager 2001)."""
-    t_bal = p.th_base - p.q_int / p.ua_total
+    t_bal = p.t_bal_heat
     return p.th_base if t_out >= t_bal else p.th_base + p.k_heat * (t_bal - t_out)
 
 # -----------------------------------------------------------------------------
 # Helper creation – makes onboarding 100 % UI-based
 # -----------------------------------------------------------------------------
 
+def _helper_specs(zone: str) -> Dict[str, Tuple[str, str, Dict]]:
+    """Map entity_id -> (domain, service, data) of every helper of *zone*."""
+    specs: Dict[str, Tuple[str, str, Dict]] = {}
+
+    # Numeric sliders ---------------------------------------------------
+    for slug, spec in PARAMS.items():
+        eid = f"input_number.thermoadapt_{zone}_{slug}"
+        specs[eid] = (
+            "input_number",
+            "create",
+            {
+                "name": f"{zone.capitalize()} {slug}",
+                "min": spec.min,
+                "max": spec.max,
+                "step": spec.step,
+                "initial": spec.default,
+                "unit_of_measurement": spec.unit,
+                "entity_id": eid,
+            },
+        )
+
+    # Boolean toggles ----------------------------------------------------
+    for slug in ("ativo", "dinamico"):
+        eid = f"input_boolean.thermoadapt_{zone}_{slug}"
+        specs[eid] = (
+            "input_boolean",
+            "create",
+            {
+                "name": f"{zone.capitalize()} {slug}",
+                "initial": slug == "ativo",  # enabled by default
+                "entity_id": eid,
+            },
+        )
+    return specs
+
+
 async def ensure_helpers(hass: HomeAssistant, zone: str) -> None:
     """Create sliders and toggles if they do not yet exist.
 
@@ -44,46 +95,42 @@ async def ensure_helpers(hass: HomeAssistant, zone: str) -> None:
         hass: Home Assistant instance
         zone: prefix used for this zone (e.g. "quarto")
     """
+    await ensure_helpers_bulk(hass, [zone])
 
-    # Build map slug -> default & meta from PARAMS (input_number) and
-    # HELPER_SUFFIXES for booleans.
-    to_create: Dict[str, Dict] = {}
 
-    # Numeric sliders ---------------------------------------------------
-    for slug, (_friendly, v_min, v_max, step, _uom, default) in PARAMS.items():
-        eid = f"input_number.thermoadapt_{zone}_{slug}"
-        if eid not in hass.states.async_entity_ids():
-            to_create[eid] = {
-                "service": "input_number/create",
-                "data": {
-                    "name": f"{zone.capitalize()} {slug}",
-                    "min": v_min,
-                    "max": v_max,
-                    "step": step,
-                    "initial": default,
-                    "unit_of_measurement": _uom if _uom else None,
-                    "entity_id": eid,
-                },
-            }
+async def ensure_helpers_bulk(hass: HomeAssistant, zones: Iterable[str]) -> int:
+    """Create the missing helpers of many zones in one pass.
 
-    # Boolean toggles ----------------------------------------------------
-    for slug in ("ativo", "dinamico"):
-        eid = f"input_boolean.thermoadapt_{zone}_{slug}"
-        if eid not in hass.states.async_entity_ids():
-            to_create[eid] = {
-                "service": "input_boolean/create",
-                "data": {
-                    "name": f"{zone.capitalize()} {slug}",
-                    "initial": slug == "ativo",  # enabled by default
-                    "entity_id": eid,
-                },
-            }
-
-    # Call creation services -------------------------------------------
-    for eid, meta in to_create.items():
-        domain, service = meta["service"].split("/")
-        _LOGGER.debug("Creating helper %s via %s.%s", eid, domain, service)
-        try:
-            await hass.services.async_call(domain, service, meta["data"], blocking=True)
-        except Exception as exc:  # pragma: no cover
-            _LOGGER.error("Could not create helper %s: %s", eid, exc)
+    The existing helpers are indexed once (a set of input_number /
+    input_boolean entity_ids) and the creation calls run concurrently, at
+    most ``HELPER_CREATE_CONCURRENCY`` at a time.
+
+    Returns:
+        Number of helpers successfully created.
+    """
+    existing = set(hass.states.async_entity_ids(("input_number", "input_boolean")))
+    to_create: Dict[str, Tuple[str, str, Dict]] = {}
+    for zone in zones:
+        for eid, spec in _helper_specs(zone).items():
+            if eid not in existing:
+                to_create[eid] = spec
+
+    if not to_create:
+        return 0
+
+    sem = asyncio.Semaphore(HELPER_CREATE_CONCURRENCY)
+
+    async def _create(eid: str, domain: str, service: str, data: Dict) -> bool:
+        async with sem:
+            _LOGGER.debug("Creating helper %s via %s.%s", eid, domain, service)
+            try:
+                await hass.services.async_call(domain, service, data, blocking=True)
+            except Exception as exc:  # pragma: no cover
+                _LOGGER.error("Could not create helper %s: %s", eid, exc)
+                return False
+            return True
+
+    results = await asyncio.gather(
+        *(_create(eid, *spec) for eid, spec in to_create.items())
+    )
+    return sum(results)
@@ -0,0 +1,302 @@
+"""ThermoAdapt – whole-house hub (optional, YAML ``hub:``)
+
+Without a hub every zone is evaluated on its own: the outdoor fan-out calls
+each zone coordinator, which reads its sensors, computes its set-point and
+lets its climate entity decide the mode.  With the top-level ``hub`` key one
+``HubCoordinator`` owns all zones instead:
+
+* one listener per outdoor sensor plus the indoor input events of all zones
+  feed a single debounced refresh;
+* each tick reads every zone's sensors in one pass, evaluates all set-points in
+  one ``batch.evaluate_setpoints`` call and steps every ``ModeController``;
+* house-level policy – at most *max_compressors* split-ACs run COOL/DRY at
+  once; running ones keep their slot, new starts go to the largest demand;
+* only zones whose decision changed are pushed to their coordinator (and so to
+  their climate entity, which dispatches the device commands).
+
+The zone coordinators stay the owners of their parameters, forecast,
+estimator and controller; the hub only replaces their scheduling.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.const import CONF_NAME
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .batch import ComfortParamsArray, evaluate_setpoints
+from .const import CONF_HUM_IN, CONF_TEMP_IN, DATA_HUB, DOMAIN, EVENT_DEBOUNCE_SEC
+from .control import COMPRESSOR_MODES
+from .metrics import LatencyHistogram, now_ns
+from .models import ComfortParams
+
+if TYPE_CHECKING:
+    from .coordinator import ThermoAdaptCoordinator
+    from .outdoor import OutdoorCoordinator
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneDecision:
+    """What the hub decided for one zone in one tick."""
+
+    setpoint: float
+    t_in: float | None
+    hum: float | None
+    mode: HVACMode
+
+
+@dataclass(slots=True)
+class HubStats:
+    ticks: int = 0
+    pushed: int = 0          # zone updates sent to entities
+    compressors: int = 0     # zones in COOL / DRY after the last tick
+    capped: int = 0          # compressor starts refused by the cap (total)
+
+
+class HubCoordinator(DataUpdateCoordinator[HubStats]):
+    """Evaluates every ThermoAdapt zone of the house in one batched tick."""
+
+    def __init__(self, hass: HomeAssistant, max_compressors: int) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="thermoadapt_hub",
+            update_interval=None,  # driven by the outdoor coordinators and input events
+        )
+        self.max_compressors = max_compressors
+        self.stats = HubStats()
+        self.tick_latency = LatencyHistogram()
+
+        self._zones: dict[str, ThermoAdaptCoordinator] = {}
+        self._unsub_inputs: dict[str, CALLBACK_TYPE] = {}
+        self._last_inputs: dict[str, float | None] = {}
+        # outdoor sensor entity id -> (unsub listener, zones using it)
+        self._outdoors: dict[str, tuple[CALLBACK_TYPE, set[str]]] = {}
+        # params array, rebuilt when any zone swaps its ComfortParams
+        self._params_src: tuple[ComfortParams, ...] = ()
+        self._params_arr: ComfortParamsArray | None = None
+        self._event_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=EVENT_DEBOUNCE_SEC,
+            immediate=False,
+            function=self.async_refresh,
+        )
+
+    # ------------------------------------------------------------------
+    # Zones
+    # ------------------------------------------------------------------
+    @callback
+    def async_attach(self, zone: ThermoAdaptCoordinator) -> CALLBACK_TYPE:
+        """Take over the scheduling of *zone* (its outdoor must be acquired)."""
+        name: str = zone.entry.data[CONF_NAME]
+        outdoor = zone.outdoor
+        assert outdoor is not None
+        self._zones[name] = zone
+
+        data = zone.entry.data
+        eids = [data[k] for k in (CONF_TEMP_IN, CONF_HUM_IN) if data.get(k)]
+        for eid in eids:
+            self._last_inputs[eid] = zone.feed_input(eid, self.hass.states.get(eid))
+        self._unsub_inputs[name] = async_track_state_change_event(
+            self.hass, eids, lambda event: self._handle_input_event(zone, event)
+        )
+
+        if (entry := self._outdoors.get(outdoor.entity_id)) is None:
+            unsub = outdoor.async_add_listener(self._handle_outdoor_update)
+            self._outdoors[outdoor.entity_id] = (unsub, {name})
+        else:
+            entry[1].add(name)
+
+        @callback
+        def _detach() -> None:
+            self._zones.pop(name, None)
+            if unsub_inputs := self._unsub_inputs.pop(name, None):
+                unsub_inputs()
+            unsub_outdoor, users = self._outdoors[outdoor.entity_id]
+            users.discard(name)
+            if not users:
+                unsub_outdoor()
+                del self._outdoors[outdoor.entity_id]
+
+        return _detach
+
+    @callback
+    def async_schedule_refresh(self) -> None:
+        """Coalesced whole-house tick (zone inputs, params, forecast, startup)."""
+        self._event_debouncer.async_schedule_call()
+
+    @callback
+    def _handle_outdoor_update(self) -> None:
+        self._event_debouncer.async_schedule_call()
+
+    @callback
+    def _handle_input_event(self, zone: ThermoAdaptCoordinator, event: Event) -> None:
+        if not zone.event_driven:
+            return  # that zone follows the outdoor ticks only
+        eid: str = event.data["entity_id"]
+        value = zone.feed_input(eid, event.data.get("new_state"))
+        last = self._last_inputs.get(eid)
+        if value is None and last is None:
+            return
+        if value is not None and last is not None and abs(value - last) <= zone.epsilon:
+            return
+        self._last_inputs[eid] = value
+        self._event_debouncer.async_schedule_call()
+
+    # ------------------------------------------------------------------
+    # Tick
+    # ------------------------------------------------------------------
+    async def _async_update_data(self) -> HubStats:  # type: ignore[override]
+        t0 = now_ns()
+        zones = [z for z in self._zones.values() if z.outdoor is not None]
+        if not zones:
+            raise UpdateFailed("No zone attached to the hub")
+
+        outdoors: dict[str, OutdoorCoordinator] = {}
+        for zone in zones:
+            outdoors.setdefault(zone.outdoor.entity_id, zone.outdoor)  # type: ignore[union-attr]
+        for outdoor in outdoors.values():
+            await outdoor.async_ensure_data()
+        zones = [z for z in self._zones.values() if z.outdoor is not None]  # may have changed
+
+        # 1. read every zone's (filtered) inputs in one pass
+        ok: list[ThermoAdaptCoordinator] = []
+        t_outs: list[float] = []
+        inputs: list[tuple[float | None, float | None]] = []
+        for zone in zones:
+            outdoor = zone.outdoor
+            assert outdoor is not None
+            if not outdoor.last_update_success:
+                zone.decision = None
+                zone.async_set_update_error(
+                    outdoor.last_exception or UpdateFailed("Outdoor sensor unavailable")
+                )
+                continue
+            ok.append(zone)
+            t_outs.append(zone._model_t_out(outdoor))
+            inputs.append((zone.read_input(CONF_TEMP_IN), zone.read_input(CONF_HUM_IN)))
+        if not ok:
+            raise UpdateFailed("No outdoor sensor available")
+
+        # 2. all set-points in one batched evaluation
+        res = evaluate_setpoints(t_outs, self._params_array(ok))
+        setpoints = [
+            zone._precondition(round(float(sp), 1), t_out)
+            for zone, sp, t_out in zip(ok, res.setpoint, t_outs)
+        ]
+
+        # 3. mode decisions with the house compressor cap
+        now = monotonic()
+        allowed = self._grant_starts(ok, setpoints, inputs, now)
+        compressors = 0
+        pushed = 0
+        for zone, sp, (t_in, hum), allow in zip(ok, setpoints, inputs, allowed):
+            if t_in is None:
+                mode = zone.controller.mode
+            else:
+                mode = zone.controller.step(
+                    now, t_in, sp, zone.params, hum,
+                    has_trv=zone.has_trv, allow_start=allow,
+                )
+            compressors += mode in COMPRESSOR_MODES
+            decision = ZoneDecision(sp, t_in, hum, mode)
+            # 4. push only what changed
+            if decision != zone.decision or not zone.last_update_success or zone.data is None:
+                zone.decision = decision
+                zone.async_set_updated_data(sp)
+                pushed += 1
+
+        stats = self.stats
+        stats.ticks += 1
+        stats.pushed += pushed
+        stats.compressors = compressors
+        stats.capped = sum(z.controller.stats.suppressed_cap for z in self._zones.values())
+        self.tick_latency.record(now_ns() - t0)
+        return stats
+
+    def _params_array(self, zones: list[ThermoAdaptCoordinator]) -> ComfortParamsArray:
+        src = tuple(z.params for z in zones)
+        if self._params_arr is None or len(src) != len(self._params_src) or any(
+            a is not b for a, b in zip(src, self._params_src)
+        ):
+            self._params_arr = ComfortParamsArray.from_params(src)
+            self._params_src = src
+        return self._params_arr
+
+    def _grant_starts(
+        self,
+        zones: list[ThermoAdaptCoordinator],
+        setpoints: list[float],
+        inputs: list[tuple[float | None, float | None]],
+        now: float,
+    ) -> list[bool]:
+        """Which zones may start a compressor this tick (cap policy)."""
+        allowed = [True] * len(zones)
+        if self.max_compressors <= 0:
+            return allowed
+
+        running = 0
+        starters: list[tuple[bool, float, int]] = []
+        for i, (zone, sp, (t_in, hum)) in enumerate(zip(zones, setpoints, inputs)):
+            if t_in is None:
+                continue
+            running_now = zone.controller.mode in COMPRESSOR_MODES
+            want = zone.controller.peek(now, t_in, sp, zone.params, hum, has_trv=zone.has_trv)
+            if want not in COMPRESSOR_MODES:
+                continue
+            if running_now:
+                running += 1
+            else:
+                # cooling before dehumidification, then the largest excess
+                cooling = want == HVACMode.COOL
+                excess = t_in - sp if cooling else (hum or 0.0) - zone.params.humid_max
+                starters.append((cooling, excess, i))
+                allowed[i] = False
+
+        slots = max(self.max_compressors - running, 0)
+        for *_key, i in sorted(starters, reverse=True)[:slots]:
+            allowed[i] = True
+        return allowed
+
+    async def async_shutdown(self) -> None:
+        await super().async_shutdown()
+        self._event_debouncer.async_cancel()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "max_compressors": self.max_compressors,
+            "zones": sorted(self._zones),
+            "outdoor_sensors": sorted(self._outdoors),
+            "ticks": self.stats.ticks,
+            "pushed": self.stats.pushed,
+            "compressors": self.stats.compressors,
+            "capped": self.stats.capped,
+            "tick": self.tick_latency.as_dict(),
+        }
+
+
+# -----------------------------------------------------------------------------
+# Accessors – hass.data[DOMAIN][DATA_HUB]
+# -----------------------------------------------------------------------------
+
+@callback
+def async_setup_hub(hass: HomeAssistant, max_compressors: int) -> None:
+    """Install the hub (YAML ``hub:`` present)."""
+    hass.data.setdefault(DOMAIN, {})[DATA_HUB] = HubCoordinator(hass, max_compressors)
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> HubCoordinator | None:
+    """The hub, or None when zones run on their own (default)."""
+    return hass.data.get(DOMAIN, {}).get(DATA_HUB)
@@ -0,0 +1,109 @@
+"""ThermoAdapt – per-zone hot-path instrumentation
+
+Counters and latency histograms for one zone.  Instrumented code holds a
+``ZoneMetrics | None`` and only touches the clock when it is not ``None``, so
+with diagnostics disabled (default) the cost is a single attribute check.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter_ns
+from typing import Any
+
+# Histogram upper bounds in µs: 1, 2, 4 … 2**20 (≈1 s); last bucket is +inf
+_BUCKETS_US: tuple[int, ...] = tuple(1 << i for i in range(21))
+
+STAGE_SENSOR_READ = "sensor_read"
+STAGE_SETPOINT = "setpoint"
+STAGE_DECISION = "decision"
+STAGE_STATE_WRITE = "state_write"
+STAGE_APPLY_MODE = "apply_mode"
+STAGE_SERVICE_CALL = "service_call"
+
+now_ns = perf_counter_ns
+
+
+class LatencyHistogram:
+    """Fixed power-of-two buckets; O(1) memory, ~O(1) record."""
+
+    __slots__ = ("counts", "count", "total_ns", "max_ns")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(_BUCKETS_US) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, elapsed_ns: int) -> None:
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        # bucket index = bit length of ceil(µs) → 0 for ≤1 µs, 1 for ≤2 µs, …
+        us = (elapsed_ns + 999) // 1000
+        idx = max(us - 1, 0).bit_length()
+        self.counts[min(idx, len(_BUCKETS_US))] += 1
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound (µs) of the bucket holding quantile *q*, capped at the max."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for idx, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                break
+        max_us = self.max_ns / 1000
+        return min(float(_BUCKETS_US[idx]), max_us) if idx < len(_BUCKETS_US) else max_us
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_us": round(self.total_ns / self.count / 1000, 2) if self.count else None,
+            "p50_us": self.quantile(0.5),
+            "p95_us": self.quantile(0.95),
+            "p99_us": self.quantile(0.99),
+            "max_us": round(self.max_ns / 1000, 2),
+            "buckets_us": {
+                (str(b) if i < len(_BUCKETS_US) else "inf"): n
+                for i, (b, n) in enumerate(zip((*_BUCKETS_US, 0), self.counts))
+                if n
+            },
+        }
+
+
+class ZoneMetrics:
+    """Tick/mode-flip/service counters and per-stage latency for one zone."""
+
+    __slots__ = (
+        "ticks", "mode_flips", "service_calls", "service_failures",
+        "state_writes", "writes_skipped", "stages",
+    )
+
+    def __init__(self) -> None:
+        self.ticks = 0
+        self.mode_flips = 0
+        self.service_calls = 0
+        self.service_failures = 0
+        self.state_writes = 0
+        self.writes_skipped = 0   # ticks with nothing visible to write
+        self.stages: dict[str, LatencyHistogram] = {}
+
+    def record(self, stage: str, started_ns: int) -> None:
+        """Record the time elapsed since *started_ns* (from ``now_ns()``)."""
+        hist = self.stages.get(stage)
+        if hist is None:
+            hist = self.stages[stage] = LatencyHistogram()
+        hist.record(now_ns() - started_ns)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "ticks": self.ticks,
+            "mode_flips": self.mode_flips,
+            "service_calls": self.service_calls,
+            "service_failures": self.service_failures,
+            "state_writes": self.state_writes,
+            "writes_skipped": self.writes_skipped,
+            "stages": {name: h.as_dict() for name, h in self.stages.items()},
+        }
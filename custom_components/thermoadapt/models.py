@@ -1,10 +1,15 @@
 # custom_components/thermoadapt/models.py
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ComfortParams:
-    """All adaptive-comfort coefficients for a single zone."""
+    """All adaptive-comfort coefficients for a single zone.
+
+    Immutable: a parameter change builds a new instance (``dataclasses.replace``)
+    that is swapped into the coordinator, so the derived coefficients below are
+    computed exactly once per change instead of on every tick.
+    """
     tc_base: float = 25.5      # Base set-point (cool)
     tc_min:  float = 23.0
     th_base: float = 20.5      # Base set-point (heat)
@@ -14,3 +19,14 @@ class ComfortParams:
     ua_total:  float = 30.0    # W / K
     q_int:    float = 200.0    # W
     humid_max: int   = 65
+
+    # Derived – balance temperatures and cooling span (°C)
+    t_bal_cool: float = field(init=False, repr=False, compare=False)
+    t_bal_heat: float = field(init=False, repr=False, compare=False)
+    cool_span:  float = field(init=False, repr=False, compare=False)  # k_cool numerator
+
+    def __post_init__(self) -> None:
+        q_ua = self.q_int / self.ua_total
+        object.__setattr__(self, "t_bal_cool", self.tc_base - q_ua)
+        object.__setattr__(self, "t_bal_heat", self.th_base - q_ua)
+        object.__setattr__(self, "cool_span", self.tc_base - self.tc_min)
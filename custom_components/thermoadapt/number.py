@@ -5,13 +5,14 @@ adaptive-comfort algorithm directly from the UI (Settings ▸ Devices & Services
 without writing YAML.
 
 For every **zone** created via Config-Flow the file instantiates one slider per
-item in the *PARAMS* dictionary and restores the last value after a restart.
+item in the *PARAMS* registry (``params.py``) and restores the last value after a restart.
 
 Why sliders?
 -------------
 • *temp_min* / *temp_max*  – static thresholds when adaptive mode is OFF.  
 • *setpoint*               – fixed target when manual.  
-• *deadband*               – neutral zone before switching HVAC.  
+• *deadband*               – neutral zone before switching HVAC (cooling).  
+• *deadband_heat*          – neutral zone below the set-point before heating.  
 • *humid_max*              – UR (%) that triggers *dry* mode.  
 • *heat_base* & *k_heat*   – coefficients for Dear & Brager adaptive heating.
 
@@ -27,28 +28,16 @@ from typing import Final
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import DOMAIN
+from .params import PARAMS, param_entity_id, param_unique_id
 
 _LOGGER: Final = logging.getLogger(__name__)
 
-# -----------------------------------------------------------------------------
-# Slider specification
-# slug -> (friendly-name, min, max, step, unit, default)
-# -----------------------------------------------------------------------------
-PARAMS: Final = {
-    "temp_min":  ("Temp Min",           16, 26, 0.5, "°C", 23.0),
-    "temp_max":  ("Temp Max",           20, 40, 0.5, "°C", 27.0),
-    "setpoint":  ("Set-point Fixed",    18, 30, 0.1, "°C", 25.0),
-    "deadband":  ("Dead-band",            0,  5, 0.1, "°C",  0.5),
-    "humid_max": ("UR Max",             40, 80, 1.0, "%",  65),
-    "heat_base": ("Heat Base",          18, 24, 0.1, "°C", 20.5),
-    "k_heat":    ("k Heat ΔT/ΔText",   0.05, 0.40, 0.01, None, 0.18),
-}
-
 # -----------------------------------------------------------------------------
 # Platform entry-point – called once per Config-Entry / zone
 # -----------------------------------------------------------------------------
@@ -58,26 +47,54 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
 
     zone: str = entry.data[CONF_NAME]
     unit = hass.data[DOMAIN][zone]["unit"]  # "°C" or "°F" for display only
+    _async_migrate_entity_ids(hass, zone)
 
-    entities: list[NumberEntity] = []
-    for slug, meta in PARAMS.items():
-        friendly, v_min, v_max, step, uom, default = meta
+    # older entries have no heating dead-band: start from the shared one
+    initial = {"deadband_heat": entry.options.get("deadband", PARAMS["deadband"].default)}
+    entities: list[ThermoAdaptNumber] = []
+    for slug, spec in PARAMS.items():
         entities.append(
             ThermoAdaptNumber(
                 zone=zone,
                 slug=slug,
-                name=f"{zone.capitalize()} {friendly}",
-                native_min=v_min,
-                native_max=v_max,
-                native_step=step,
-                native_unit=uom or unit,
-                initial_value=default,
+                name=f"{zone.capitalize()} {spec.name}",
+                native_min=spec.min,
+                native_max=spec.max,
+                native_step=spec.step,
+                native_unit=spec.unit or unit,
+                initial_value=entry.options.get(slug, initial.get(slug, spec.default)),
             )
         )
 
+    # slug -> slider, for the bulk writes of ``thermoadapt.set_params``
+    hass.data[DOMAIN][zone]["numbers"] = {e.slug: e for e in entities}
     async_add_entities(entities)
 
 
+@callback
+def _async_migrate_entity_ids(hass: HomeAssistant, zone: str) -> None:
+    """Move registered sliders to the fixed ``param_entity_id``.
+
+    The registry keeps the entity_id a slider got when first added (older
+    versions let HA derive it from the name), and that wins over the id set
+    in the constructor – so the coordinator, the options flow and the card
+    would look for sliders that do not exist.
+    """
+    if er.DATA_REGISTRY not in hass.data:
+        return
+    registry = er.async_get(hass)
+    for slug in PARAMS:
+        old = registry.async_get_entity_id("number", DOMAIN, param_unique_id(zone, slug))
+        new = param_entity_id(zone, slug)
+        if old is None or old == new:
+            continue
+        if registry.async_is_registered(new):
+            _LOGGER.warning("[%s] Cannot rename %s to %s: id already taken", zone, old, new)
+            continue
+        registry.async_update_entity(old, new_entity_id=new)
+        _LOGGER.info("[%s] Renamed slider %s to %s", zone, old, new)
+
+
 # -----------------------------------------------------------------------------
 # Entity class
 # -----------------------------------------------------------------------------
@@ -100,7 +117,11 @@ class ThermoAdaptNumber(RestoreEntity, NumberEntity):
         native_unit: str | None,
         initial_value: float,
     ) -> None:
-        self._attr_unique_id = f"thermoadapt_{zone}_{slug}"
+        self.slug = slug
+        self._attr_unique_id = param_unique_id(zone, slug)
+        # Fixed entity_id – the climate coordinator and the card look sliders up by it
+        # (existing registry entries are moved to it by _async_migrate_entity_ids)
+        self.entity_id = param_entity_id(zone, slug)
         self._attr_name = name
         self._attr_native_min_value = native_min
         self._attr_native_max_value = native_max
@@ -126,5 +147,10 @@ class ThermoAdaptNumber(RestoreEntity, NumberEntity):
         return self._native_value
 
     async def async_set_native_value(self, value: float) -> None:  # type: ignore[override]
+        self.async_write_value(value)
+
+    @callback
+    def async_write_value(self, value: float) -> None:
+        """Set and write the value without a service call (bulk updates)."""
         self._native_value = value
         self.async_write_ha_state()
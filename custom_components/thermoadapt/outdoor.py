@@ -0,0 +1,214 @@
+"""ThermoAdapt – shared outdoor-temperature coordinators
+
+In practice every zone of a house points at the same outdoor sensor.  Instead
+of each zone reading and parsing that sensor on its own schedule, one
+``OutdoorCoordinator`` per sensor entity id lives in
+``hass.data[DOMAIN][DATA_OUTDOOR]``.  It reads the sensor once per tick and
+fans the value out to every subscribed zone, which then only evaluates its own
+``tset_cool`` / ``tset_heat``.  All zones therefore see the same sample.
+
+Each coordinator also keeps the exponentially-weighted running mean of its
+sensor (EN 16798-1: θ_rm = (1 − α)·θ + α·θ_rm per day).  For irregular
+samples the weight is α^(Δt / 1 day), so every sample is O(1) and no recorder
+history is read; the mean and its timestamp are persisted in a ``Store``.
+
+A sensor that drops to ``unavailable`` keeps its last sample for up to
+``FILTER_STALE_SEC`` before the zones see the failure; outlier rejection and
+smoothing are per zone (``filters``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import timedelta
+from time import monotonic, time
+from typing import Any, Final
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import (
+    DATA_OUTDOOR,
+    DOMAIN,
+    EVENT_DEBOUNCE_SEC,
+    FILTER_STALE_SEC,
+    RUNNING_MEAN_ALPHA,
+    RUNNING_MEAN_SAVE_DELAY_SEC,
+    RUNNING_MEAN_STORE_VERSION,
+    SAFETY_SCAN_INTERVAL_SEC,
+    SCAN_INTERVAL_SEC,
+)
+from .helpers import state_float
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+_DAY_SEC: Final = 86400.0
+
+
+class OutdoorCoordinator(DataUpdateCoordinator[float]):
+    """Single reader for one outdoor sensor, shared by all zones using it.
+
+    The most demanding subscriber wins: the sensor is polled every
+    ``SCAN_INTERVAL_SEC`` as soon as one zone is not event-driven, and the
+    smallest *event_epsilon* among the zones is used for state changes.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"thermoadapt_outdoor_{entity_id}",
+            update_interval=timedelta(seconds=SAFETY_SCAN_INTERVAL_SEC),
+        )
+        self.entity_id = entity_id
+        self.epsilon: float = 0.0
+
+        # zone -> (event_driven, epsilon)
+        self._zones: dict[str, tuple[bool, float]] = {}
+        self._last_value: float | None = None
+        self._bad_since: float | None = None
+        self.running_mean: float | None = None
+        self._rm_ts: float | None = None
+        self._rm_store: Store[dict[str, Any]] = Store(
+            hass, RUNNING_MEAN_STORE_VERSION, f"{DOMAIN}.running_mean.{entity_id}"
+        )
+        self._rm_loaded = False
+        self._first_lock = asyncio.Lock()
+        self._unsub_state: CALLBACK_TYPE | None = None
+        self._event_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=EVENT_DEBOUNCE_SEC,
+            immediate=False,
+            function=self.async_refresh,
+        )
+
+    async def _async_update_data(self) -> float:  # type: ignore[override]
+        state = self.hass.states.get(self.entity_id)
+        value = state_float(state)
+        if value is None:
+            now = monotonic()
+            if self._bad_since is None:
+                self._bad_since = now
+            if self.data is not None and now - self._bad_since < FILTER_STALE_SEC:
+                return self.data  # bridge a short outage with the last sample
+            raise UpdateFailed(f"Outdoor sensor {self.entity_id} unavailable")
+        self._bad_since = None
+        self._last_value = value
+        self._update_running_mean(value, time())
+        return value
+
+    async def async_ensure_data(self) -> None:
+        """Make sure at least one sample was read (first refresh of any zone)."""
+        async with self._first_lock:
+            if not self._rm_loaded:
+                self._rm_loaded = True
+                await self._async_load_running_mean()
+            if self.data is None or not self.last_update_success:
+                await self.async_refresh()
+
+    # ------------------------------------------------------------------
+    # Running mean
+    # ------------------------------------------------------------------
+    def _update_running_mean(self, value: float, ts: float) -> None:
+        if self.running_mean is None or self._rm_ts is None:
+            self.running_mean = value  # seed with the first reading
+        elif ts > self._rm_ts:
+            w = RUNNING_MEAN_ALPHA ** ((ts - self._rm_ts) / _DAY_SEC)
+            self.running_mean = w * self.running_mean + (1.0 - w) * value
+        else:
+            return  # clock went backwards – keep the current mean
+        self._rm_ts = ts
+        self._rm_store.async_delay_save(self._running_mean_data, RUNNING_MEAN_SAVE_DELAY_SEC)
+
+    def _running_mean_data(self) -> dict[str, Any]:
+        return {"value": self.running_mean, "ts": self._rm_ts}
+
+    async def _async_load_running_mean(self) -> None:
+        data = await self._rm_store.async_load()
+        if not data or self.running_mean is not None:
+            return
+        try:
+            self.running_mean, self._rm_ts = float(data["value"]), float(data["ts"])
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.debug("Discarding invalid running mean for %s: %s", self.entity_id, data)
+
+    # ------------------------------------------------------------------
+    # Subscribers
+    # ------------------------------------------------------------------
+    @callback
+    def _async_attach(self, zone: str, event_driven: bool, epsilon: float) -> None:
+        self._zones[zone] = (event_driven, epsilon)
+        self._async_apply_policy()
+
+    @callback
+    def _async_detach(self, zone: str) -> bool:
+        """Remove *zone*; returns True when nobody uses this sensor anymore."""
+        self._zones.pop(zone, None)
+        if self._zones:
+            self._async_apply_policy()
+            return False
+        if self._unsub_state:
+            self._unsub_state()
+            self._unsub_state = None
+        self._event_debouncer.async_cancel()
+        return True
+
+    @callback
+    def _async_apply_policy(self) -> None:
+        event_driven = all(ed for ed, _ in self._zones.values())
+        self.epsilon = min(eps for _, eps in self._zones.values())
+        self.update_interval = timedelta(
+            seconds=SAFETY_SCAN_INTERVAL_SEC if event_driven else SCAN_INTERVAL_SEC
+        )
+        if self._unsub_state is None:
+            self._unsub_state = async_track_state_change_event(
+                self.hass, [self.entity_id], self._handle_state_event
+            )
+
+    @callback
+    def _handle_state_event(self, event: Event) -> None:
+        value = state_float(event.data.get("new_state"))
+        last = self._last_value
+
+        if value is None and last is None:
+            return
+        if value is not None and last is not None and abs(value - last) <= self.epsilon:
+            return
+
+        self._last_value = value
+        self._event_debouncer.async_schedule_call()
+
+
+# -----------------------------------------------------------------------------
+# Registry – hass.data[DOMAIN][DATA_OUTDOOR] : sensor entity id -> coordinator
+# -----------------------------------------------------------------------------
+
+@callback
+def async_acquire_outdoor(
+    hass: HomeAssistant,
+    entity_id: str,
+    zone: str,
+    *,
+    event_driven: bool,
+    epsilon: float,
+) -> OutdoorCoordinator:
+    """Return the shared coordinator for *entity_id*, creating it on first use."""
+    registry: dict[str, OutdoorCoordinator] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_OUTDOOR, {}
+    )
+    if (outdoor := registry.get(entity_id)) is None:
+        outdoor = registry[entity_id] = OutdoorCoordinator(hass, entity_id)
+    outdoor._async_attach(zone, event_driven, epsilon)
+    return outdoor
+
+
+@callback
+def async_release_outdoor(hass: HomeAssistant, outdoor: OutdoorCoordinator, zone: str) -> None:
+    """Unsubscribe *zone*; drops the coordinator once its last zone is gone."""
+    if outdoor._async_detach(zone):
+        hass.data[DOMAIN][DATA_OUTDOOR].pop(outdoor.entity_id, None)
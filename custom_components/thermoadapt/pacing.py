@@ -0,0 +1,284 @@
+"""ThermoAdapt – domain-wide pacing of zone updates and device commands
+
+Zones that share an outdoor sensor receive its sample at the same instant; left
+alone, their ``_apply_mode`` calls would hit shared IR blasters and the Zigbee
+mesh in synchronised bursts.  Two domain-wide objects spread that load:
+
+* ``ZoneScheduler`` – gives every zone a phase offset inside the stagger
+  window, so the outdoor fan-out evaluates zone *k* of *n* after
+  ``k / n · window`` seconds instead of all at once.
+* ``CommandRateLimiter`` – token buckets (one global, one per gateway) in
+  front of every outgoing ``climate`` / ``number`` service call.  Waiting
+  calls are granted in priority order, so safety commands (frost protection)
+  overtake regular set-point updates.
+
+The gateway of an actuator is the device it is connected through
+(``via_device``), else its config entry, else the entity itself.  Both objects
+live in ``hass.data[DOMAIN]`` and are configured from the top-level
+``rate_limit`` YAML key.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass
+from typing import Any, Final
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from .const import (
+    DATA_LIMITER,
+    DATA_SCHEDULER,
+    DEF_RATE_GATEWAY,
+    DEF_RATE_GATEWAY_BURST,
+    DEF_RATE_GLOBAL,
+    DEF_RATE_GLOBAL_BURST,
+    DEF_STAGGER_SEC,
+    DOMAIN,
+)
+from .metrics import LatencyHistogram
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class PacingConfig:
+    """``rate_limit`` YAML block (rates in calls/s, 0 = unlimited)."""
+
+    global_rate: float = DEF_RATE_GLOBAL
+    global_burst: int = DEF_RATE_GLOBAL_BURST
+    gateway_rate: float = DEF_RATE_GATEWAY
+    gateway_burst: int = DEF_RATE_GATEWAY_BURST
+    stagger: float = DEF_STAGGER_SEC
+
+
+# -----------------------------------------------------------------------------
+# Zone phase staggering
+# -----------------------------------------------------------------------------
+
+class ZoneScheduler:
+    """Stable phase offsets for the zones of the house."""
+
+    def __init__(self, stagger: float) -> None:
+        self.stagger = stagger
+        self._zones: list[str] = []
+        self._index: dict[str, int] = {}  # zone -> position in _zones
+
+    @callback
+    def async_register(self, zone: str) -> None:
+        if zone not in self._index:
+            self._index[zone] = len(self._zones)
+            self._zones.append(zone)
+
+    @callback
+    def async_unregister(self, zone: str) -> None:
+        if self._index.pop(zone, None) is not None:
+            self._zones.remove(zone)
+            self._index = {z: i for i, z in enumerate(self._zones)}
+
+    def delay(self, zone: str) -> float:
+        """Seconds zone *zone* waits after a shared tick (0 for the first)."""
+        if self.stagger <= 0 or (i := self._index.get(zone)) is None:
+            return 0.0
+        return self.stagger * i / len(self._zones)
+
+
+# -----------------------------------------------------------------------------
+# Outbound command rate limiting
+# -----------------------------------------------------------------------------
+
+class TokenBucket:
+    """*rate* tokens per second, at most *burst* saved up (rate 0 – unlimited)."""
+
+    __slots__ = ("rate", "burst", "tokens", "stamp")
+
+    def __init__(self, rate: float, burst: int, now: float) -> None:
+        self.rate = rate
+        self.burst = float(max(burst, 1))
+        self.tokens = self.burst
+        self.stamp = now
+
+    def ready(self, now: float) -> bool:
+        if self.rate <= 0:
+            return True  # unlimited
+        self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+        return self.tokens >= 1.0
+
+    def take(self) -> None:
+        if self.rate > 0:
+            self.tokens -= 1.0
+
+    def wait(self) -> float:
+        """Seconds until the next token (call right after ``ready``)."""
+        return max(1.0 - self.tokens, 0.0) / self.rate if self.rate > 0 else 0.0
+
+
+class CommandRateLimiter:
+    """Global + per-gateway token buckets with a priority wait queue."""
+
+    def __init__(self, hass: HomeAssistant, config: PacingConfig) -> None:
+        self.hass = hass
+        self.config = config
+        now = hass.loop.time()
+        self._global = TokenBucket(config.global_rate, config.global_burst, now)
+        self._gateways: dict[str, TokenBucket] = {}
+        self._gateway_of: dict[str, str] = {}
+        # (priority, seq, gateway, future, enqueued_at)
+        self._waiters: list[tuple[int, int, str, asyncio.Future[None], float]] = []
+        self._seq = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+        self.granted = 0
+        self.delayed = 0
+        self.max_depth = 0
+        self.wait = LatencyHistogram()
+
+    @property
+    def depth(self) -> int:
+        return sum(not w[3].done() for w in self._waiters)
+
+    async def async_acquire(self, entity_id: str, priority: int) -> None:
+        """Wait until a call to *entity_id* may be sent (lower priority first)."""
+        gateway = self._gateway(entity_id)
+        now = self.hass.loop.time()
+        if not self._waiters and self._try_take(gateway, now):
+            self.granted += 1
+            self.wait.record(0)
+            return
+
+        fut: asyncio.Future[None] = self.hass.loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), gateway, fut, now))
+        self.delayed += 1
+        self.max_depth = max(self.max_depth, len(self._waiters))
+        if self._timer is None:
+            self._dispatch()
+        await fut
+
+    def _try_take(self, gateway: str, now: float) -> bool:
+        bucket = self._bucket(gateway, now)
+        if not (self._global.ready(now) and bucket.ready(now)):
+            return False
+        self._global.take()
+        bucket.take()
+        return True
+
+    @callback
+    def _dispatch(self) -> None:
+        """Grant waiting calls in priority order as tokens allow."""
+        self._timer = None
+        now = self.hass.loop.time()
+        blocked: list[tuple[int, int, str, asyncio.Future[None], float]] = []
+        next_in = float("inf")
+
+        while self._waiters:
+            item = heapq.heappop(self._waiters)
+            _prio, _seq, gateway, fut, enqueued = item
+            if fut.done():  # caller went away (entity removed, shutdown)
+                continue
+            if not self._global.ready(now):
+                next_in = min(next_in, self._global.wait())
+                blocked.append(item)
+                break
+            bucket = self._bucket(gateway, now)
+            if not bucket.ready(now):
+                # this gateway is saturated – others may still go
+                next_in = min(next_in, bucket.wait())
+                blocked.append(item)
+                continue
+            self._global.take()
+            bucket.take()
+            self.granted += 1
+            self.wait.record(int((now - enqueued) * 1e9))
+            fut.set_result(None)
+
+        for item in blocked:
+            heapq.heappush(self._waiters, item)
+        if self._waiters:
+            self._timer = self.hass.loop.call_later(max(next_in, 0.001), self._dispatch)
+
+    def _bucket(self, gateway: str, now: float) -> TokenBucket:
+        if (bucket := self._gateways.get(gateway)) is None:
+            bucket = self._gateways[gateway] = TokenBucket(
+                self.config.gateway_rate, self.config.gateway_burst, now
+            )
+        return bucket
+
+    def _gateway(self, entity_id: str) -> str:
+        if (gateway := self._gateway_of.get(entity_id)) is None:
+            gateway = self._gateway_of[entity_id] = _resolve_gateway(self.hass, entity_id)
+        return gateway
+
+    @callback
+    def async_shutdown(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for *_, fut, _enqueued in self._waiters:
+            if not fut.done():
+                fut.cancel()
+        self._waiters.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "config": {
+                "global_rate": self.config.global_rate,
+                "global_burst": self.config.global_burst,
+                "gateway_rate": self.config.gateway_rate,
+                "gateway_burst": self.config.gateway_burst,
+            },
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "granted": self.granted,
+            "delayed": self.delayed,
+            "wait": self.wait.as_dict(),
+            "gateways": dict(self._gateway_of),
+        }
+
+
+def _resolve_gateway(hass: HomeAssistant, entity_id: str) -> str:
+    """Hub/bridge an actuator talks through (best effort, cached by caller)."""
+    if er.DATA_REGISTRY not in hass.data:
+        return entity_id
+    entry = er.async_get(hass).async_get(entity_id)
+    if entry is None:
+        return entity_id
+    if entry.device_id is not None:
+        device = dr.async_get(hass).async_get(entry.device_id)
+        if device is not None and device.via_device_id is not None:
+            return f"device:{device.via_device_id}"
+    if entry.config_entry_id is not None:
+        return f"entry:{entry.config_entry_id}"
+    return f"platform:{entry.platform}"
+
+
+# -----------------------------------------------------------------------------
+# Accessors – hass.data[DOMAIN][DATA_SCHEDULER] / [DATA_LIMITER]
+# -----------------------------------------------------------------------------
+
+@callback
+def async_setup_pacing(hass: HomeAssistant, config: PacingConfig) -> None:
+    """Install scheduler and limiter built from the YAML ``rate_limit`` block."""
+    data = hass.data.setdefault(DOMAIN, {})
+    data[DATA_SCHEDULER] = ZoneScheduler(config.stagger)
+    data[DATA_LIMITER] = CommandRateLimiter(hass, config)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> ZoneScheduler:
+    data = hass.data.setdefault(DOMAIN, {})
+    if (scheduler := data.get(DATA_SCHEDULER)) is None:
+        scheduler = data[DATA_SCHEDULER] = ZoneScheduler(DEF_STAGGER_SEC)
+    return scheduler
+
+
+@callback
+def async_get_rate_limiter(hass: HomeAssistant) -> CommandRateLimiter:
+    data = hass.data.setdefault(DOMAIN, {})
+    if (limiter := data.get(DATA_LIMITER)) is None:
+        limiter = data[DATA_LIMITER] = CommandRateLimiter(hass, PacingConfig())
+    return limiter
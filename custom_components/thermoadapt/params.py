@@ -0,0 +1,55 @@
+"""ThermoAdapt – comfort parameter registry
+
+The one place that lists the tunable comfort parameters of a zone: the slider
+platform (``number``), the helper auto-creation (``helpers``), the parameter
+loader of the coordinator and the config/options flow all read it, so names,
+ranges and defaults cannot drift apart.
+
+Plain data only – no Home Assistant imports – so any module can use it
+without pulling in a platform.
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Final, Mapping, NamedTuple
+
+
+class ParamSpec(NamedTuple):
+    """Slider specification of one comfort parameter."""
+
+    name: str            # friendly name
+    min: float
+    max: float
+    step: float
+    unit: str | None     # None – dimensionless
+    default: float
+
+
+# slug -> spec; order is the slider / form order
+PARAMS: Final[Mapping[str, ParamSpec]] = MappingProxyType({
+    "temp_min":      ParamSpec("Temp Min",         16,   26,   0.5,  "°C", 23.0),
+    "temp_max":      ParamSpec("Temp Max",         20,   40,   0.5,  "°C", 27.0),
+    "setpoint":      ParamSpec("Set-point Fixed",  18,   30,   0.1,  "°C", 25.0),
+    "deadband":      ParamSpec("Dead-band",         0,    5,   0.1,  "°C",  0.5),
+    "deadband_heat": ParamSpec("Dead-band Heat",    0,    5,   0.1,  "°C",  0.5),
+    "humid_max":     ParamSpec("UR Max",           40,   80,   1.0,  "%",   65),
+    "heat_base":     ParamSpec("Heat Base",        18,   24,   0.1,  "°C", 20.5),
+    "k_heat":        ParamSpec("k Heat ΔT/ΔText", 0.05, 0.40, 0.01, None, 0.18),
+})
+
+# Precomputed views – built once at import, read on every params load
+DEFAULTS: Final[Mapping[str, float]] = MappingProxyType(
+    {slug: spec.default for slug, spec in PARAMS.items()}
+)
+INT_PARAMS: Final = frozenset({"humid_max"})  # whole numbers (UR %)
+
+
+def param_entity_id(zone: str, slug: str) -> str:
+    """Entity id of the *slug* slider of *zone* (fixed, see ``number``)."""
+    return f"number.thermoadapt_{zone}_{slug}"
+
+
+def param_unique_id(zone: str, slug: str) -> str:
+    """Registry unique id of the *slug* slider of *zone*."""
+    return f"thermoadapt_{zone}_{slug}"
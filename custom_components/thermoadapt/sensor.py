@@ -0,0 +1,237 @@
+"""ThermoAdapt – sensors for one zone.
+
+* Adaptive set-point and balance temperature – what the zone computed, as
+  ``measurement`` sensors so the recorder keeps long-term statistics for them
+  (the climate entity itself only writes on visible changes).
+* Outdoor running mean – the EN 16798 running mean of the zone's outdoor
+  sensor, kept incrementally by the shared ``OutdoorCoordinator``.
+* Diagnostic sensors – always created but disabled in the entity registry by
+  default, and unavailable while *diagnostics_metrics* is off in the zone
+  options (the option is toggled live, without reloading the entry).  They
+  mirror the counters collected by ``metrics.ZoneMetrics`` (plus the depth and
+  wait time of the domain-wide command rate limiter) so a misbehaving zone can
+  be spotted from the UI without downloading diagnostics.
+
+The temperature sensors write their state only when the value changed, not on
+every tick.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME, UnitOfTemperature, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import ThermoAdaptCoordinator
+from .metrics import STAGE_SERVICE_CALL, LatencyHistogram, ZoneMetrics
+from .pacing import async_get_rate_limiter
+
+
+@dataclass(frozen=True, kw_only=True)
+class MetricSensorDescription(SensorEntityDescription):
+    value_fn: Callable[[ThermoAdaptCoordinator, ZoneMetrics], float | int | None]
+
+
+def _p95_ms(hist: LatencyHistogram | None) -> float | None:
+    q = hist.quantile(0.95) if hist else None
+    return round(q / 1000, 3) if q is not None else None
+
+
+METRIC_SENSORS: tuple[MetricSensorDescription, ...] = (
+    MetricSensorDescription(
+        key="ticks",
+        name="Ticks",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda _c, m: m.ticks,
+    ),
+    MetricSensorDescription(
+        key="mode_flips",
+        name="Mode flips",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda _c, m: m.mode_flips,
+    ),
+    MetricSensorDescription(
+        key="service_calls",
+        name="Service calls",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda _c, m: m.service_calls,
+    ),
+    MetricSensorDescription(
+        key="service_failures",
+        name="Service failures",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda _c, m: m.service_failures,
+    ),
+    MetricSensorDescription(
+        key="state_writes",
+        name="State writes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda _c, m: m.state_writes,
+    ),
+    MetricSensorDescription(
+        key="trv_writes",
+        name="TRV writes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c, _m: c.trv.stats.sent + c.trv.stats.forced if c.trv else None,
+    ),
+    MetricSensorDescription(
+        key="trv_writes_avoided",
+        name="TRV writes avoided",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c, _m: c.trv.stats.unchanged + c.trv.stats.over_budget if c.trv else None,
+    ),
+    MetricSensorDescription(
+        key="service_latency_p95",
+        name="Service latency p95",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda _c, m: _p95_ms(m.stages.get(STAGE_SERVICE_CALL)),
+    ),
+    MetricSensorDescription(
+        key="command_queue_depth",
+        name="Command queue depth",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda c, _m: async_get_rate_limiter(c.hass).depth,
+    ),
+    MetricSensorDescription(
+        key="command_wait_p95",
+        name="Command wait p95",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda c, _m: _p95_ms(async_get_rate_limiter(c.hass).wait),
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Create the zone temperature sensors and the (registry-disabled) metric sensors."""
+    zone: str = entry.data[CONF_NAME]
+    coordinator: ThermoAdaptCoordinator = hass.data[DOMAIN][zone]["coordinator"]
+    entities: list[SensorEntity] = [
+        ThermoAdaptSetpointSensor(coordinator, zone),
+        ThermoAdaptBalanceSensor(coordinator, zone),
+        ThermoAdaptRunningMeanSensor(coordinator, zone),
+    ]
+    entities.extend(ThermoAdaptMetricSensor(coordinator, zone, desc) for desc in METRIC_SENSORS)
+    async_add_entities(entities)
+
+
+class _ZoneTemperatureSensor(CoordinatorEntity[ThermoAdaptCoordinator], SensorEntity):
+    """°C measurement of a zone, written only when its value changes."""
+
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_suggested_display_precision = 1
+    _key: str
+    _label: str
+
+    def __init__(self, coordinator: ThermoAdaptCoordinator, zone: str) -> None:
+        super().__init__(coordinator)
+        self._attr_unique_id = f"thermoadapt_{zone}_{self._key}"
+        self._attr_name = f"{zone.capitalize()} {self._label}"
+        self._written: float | None = None
+
+    @property
+    def available(self) -> bool:
+        return self.native_value is not None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        value = self.native_value
+        if value != self._written:
+            self._written = value
+            self.async_write_ha_state()
+
+
+class ThermoAdaptSetpointSensor(_ZoneTemperatureSensor):
+    """Adaptive set-point of the zone (forecast pre-conditioning included)."""
+
+    _key = "adaptive_setpoint"
+    _label = "Adaptive set-point"
+
+    @property
+    def native_value(self) -> float | None:
+        if not self.coordinator.last_update_success:
+            return None
+        return self.coordinator.data
+
+
+class ThermoAdaptBalanceSensor(_ZoneTemperatureSensor):
+    """Outdoor balance temperature of the equation in use.
+
+    The cooling balance while the outdoor temperature is above it, the
+    (lower) heating balance once the heating equation applies.
+    """
+
+    _key = "balance_temperature"
+    _label = "Balance temperature"
+
+    @property
+    def native_value(self) -> float | None:
+        c = self.coordinator
+        p = c.params
+        return round(p.t_bal_heat if c.heating_equation else p.t_bal_cool, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, str]:
+        return {"equation": "heat" if self.coordinator.heating_equation else "cool"}
+
+
+class ThermoAdaptRunningMeanSensor(_ZoneTemperatureSensor):
+    """Running-mean outdoor temperature used as (optional) model input."""
+
+    _key = "outdoor_running_mean"
+    _label = "Outdoor running mean"
+
+    @property
+    def native_value(self) -> float | None:
+        outdoor = self.coordinator.outdoor
+        if outdoor is None or outdoor.running_mean is None:
+            return None
+        return round(outdoor.running_mean, 2)
+
+
+class ThermoAdaptMetricSensor(CoordinatorEntity[ThermoAdaptCoordinator], SensorEntity):
+    """One hot-path counter / latency of a zone (unavailable while metrics are off)."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    entity_description: MetricSensorDescription
+
+    def __init__(
+        self,
+        coordinator: ThermoAdaptCoordinator,
+        zone: str,
+        description: MetricSensorDescription,
+    ) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"thermoadapt_{zone}_{description.key}"
+        self._attr_name = f"{zone.capitalize()} {description.name}"
+
+    @property
+    def available(self) -> bool:
+        return self.coordinator.metrics is not None
+
+    @property
+    def native_value(self) -> float | int | None:
+        m = self.coordinator.metrics
+        return self.entity_description.value_fn(self.coordinator, m) if m is not None else None
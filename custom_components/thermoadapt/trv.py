@@ -0,0 +1,147 @@
+"""ThermoAdapt – TRV heating loop
+
+In HEAT mode the split-AC is off and the zone is heated through its smart TRV
+(``number.*`` target temperature).  Writing it the bare adaptive set-point
+once leaves the valve's own regulation – usually a sensor on the radiator –
+in charge.  ``TrvController`` closes the loop on the zone's filtered
+``temp_in`` instead:
+
+* PI on ``e = sp - t_in``: TRV target = ``sp + TRV_KP·e + TRV_KI·∫e dt``,
+  clamped to ``sp + [TRV_MIN_OFFSET, TRV_MAX_BOOST]`` and the device range and
+  quantized to the device step; no integration while clamped (anti-windup);
+* its own cadence instead of the 30 s tick – every ``TRV_MIN_INTERVAL_SEC``
+  when far from the set-point, stretching to ``TRV_MAX_INTERVAL_SEC`` near it;
+* a write budget per device (``trv_max_writes`` per hour, token bucket) so
+  battery-powered Zigbee valves are not drained: an adjustment is only sent
+  when the quantized target changed and a token is left.  Mode changes (heat
+  start, frost protection) always go out but use up a token.
+
+Times are plain seconds from any monotonic clock.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from .const import (
+    TRV_BUDGET_BURST,
+    TRV_FROST_TEMP,
+    TRV_KI,
+    TRV_KP,
+    TRV_MAX_BOOST,
+    TRV_MAX_INTERVAL_SEC,
+    TRV_MAX_TEMP,
+    TRV_MIN_INTERVAL_SEC,
+    TRV_MIN_OFFSET,
+    TRV_MIN_TEMP,
+    TRV_STEP,
+)
+from .pacing import TokenBucket
+
+
+@dataclass(slots=True)
+class TrvStats:
+    steps: int = 0          # loop evaluations
+    sent: int = 0           # adjustments written
+    forced: int = 0         # mode-change writes (heat start / frost protection)
+    unchanged: int = 0      # same quantized target – nothing to write
+    over_budget: int = 0    # adjustment held back, no token left
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class TrvController:
+    """PI loop, cadence and write budget of one zone's TRV."""
+
+    __slots__ = ("max_writes", "budget", "step_size", "lo", "hi", "target", "stats", "_integral", "_ts")
+
+    def __init__(self, max_writes_per_hour: int, now: float) -> None:
+        self.max_writes = max_writes_per_hour
+        self.budget = TokenBucket(max_writes_per_hour / 3600, TRV_BUDGET_BURST, now)
+        self.step_size = TRV_STEP
+        self.lo = TRV_MIN_TEMP
+        self.hi = TRV_MAX_TEMP
+        self.target: float | None = None  # last value written
+        self.stats = TrvStats()
+        self._integral = 0.0  # °C·s
+        self._ts: float | None = None
+
+    def set_budget(self, max_writes_per_hour: int) -> None:
+        self.max_writes = max_writes_per_hour
+        self.budget.rate = max_writes_per_hour / 3600
+
+    def set_device_range(self, lo: float | None, hi: float | None, step: float | None) -> None:
+        """Limits and resolution the TRV reports (``number`` min / max / step)."""
+        self.lo = TRV_MIN_TEMP if lo is None else lo
+        self.hi = TRV_MAX_TEMP if hi is None else hi
+        self.step_size = TRV_STEP if not step or step <= 0 else max(step, 0.1)
+
+    # ------------------------------------------------------------------
+    def _quantize(self, value: float) -> float:
+        return round(round(value / self.step_size) * self.step_size, 2)
+
+    def _interval(self, error: float) -> float:
+        """Seconds to the next step – short far from the set-point."""
+        span = TRV_MAX_INTERVAL_SEC * self.step_size / max(abs(error), self.step_size)
+        return min(max(span, TRV_MIN_INTERVAL_SEC), TRV_MAX_INTERVAL_SEC)
+
+    def _output(self, now: float, t_in: float, sp: float) -> tuple[float, float]:
+        error = sp - t_in
+        dt = 0.0 if self._ts is None else max(now - self._ts, 0.0)
+        self._ts = now
+        lo = max(self.lo, sp + TRV_MIN_OFFSET)
+        hi = min(self.hi, sp + TRV_MAX_BOOST)
+        integral = self._integral + error * dt
+        raw = sp + TRV_KP * error + TRV_KI * integral
+        if lo < raw < hi:
+            self._integral = integral  # integrate only while unsaturated
+        return self._quantize(min(max(raw, lo), hi)), error
+
+    def _force(self, now: float, value: float) -> float:
+        if self.budget.ready(now):
+            self.budget.take()
+        self.stats.forced += 1
+        self.target = value
+        return value
+
+    # ------------------------------------------------------------------
+    def start(self, now: float, t_in: float | None, sp: float) -> tuple[float, float]:
+        """HEAT starts: fresh loop; returns (value to write, seconds to next step)."""
+        self._integral = 0.0
+        self._ts = None
+        if t_in is None:
+            return self._force(now, self._quantize(sp)), TRV_MAX_INTERVAL_SEC
+        value, error = self._output(now, t_in, sp)
+        return self._force(now, value), self._interval(error)
+
+    def frost(self, now: float) -> float:
+        """HEAT ends: frost-protection target within the device range (always written)."""
+        self._ts = None
+        return self._force(now, self._quantize(min(max(TRV_FROST_TEMP, self.lo), self.hi)))
+
+    def step(self, now: float, t_in: float, sp: float) -> tuple[float | None, float]:
+        """One loop evaluation; (value to write or None, seconds to next step)."""
+        self.stats.steps += 1
+        value, error = self._output(now, t_in, sp)
+        delay = self._interval(error)
+        if value == self.target:
+            self.stats.unchanged += 1
+            return None, delay
+        if not self.budget.ready(now):
+            self.stats.over_budget += 1
+            return None, min(max(self.budget.wait(), TRV_MIN_INTERVAL_SEC), delay)
+        self.budget.take()
+        self.stats.sent += 1
+        self.target = value
+        return value, delay
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "target": self.target,
+            "integral": round(self._integral, 1),
+            "max_writes_per_hour": self.max_writes,
+            "step": self.step_size,
+            **self.stats.as_dict(),
+        }
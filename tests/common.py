@@ -0,0 +1,139 @@
+"""Whole zones on the fake ``hass`` of ``tools/bench``.
+
+``async_setup_zone`` runs the integration's own ``async_setup_entry`` and adds
+the collected entities the way the entity platform would (minus the
+registries): the climate entity goes through ``async_added_to_hass`` with an
+optional restored state while the core is still *starting*;
+``async_start_hass`` then fires ``homeassistant_started``.  Pacing is off
+unless the test sets the integration up itself.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any
+
+from homeassistant.components.climate import ClimateEntity
+from homeassistant.components.number import NumberEntity
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.switch import SwitchEntity
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, State
+from homeassistant.helpers.restore_state import DATA_RESTORE_STATE, StoredState
+
+import custom_components.thermoadapt as integration
+from custom_components.thermoadapt.climate import ThermoAdaptClimate, ZoneRestoreData
+from custom_components.thermoadapt.const import (
+    CONF_GATEWAY_RATE,
+    CONF_GLOBAL_RATE,
+    CONF_RATE_LIMIT,
+    CONF_STAGGER,
+    DOMAIN,
+    SERVICE_SET_PARAMS,
+)
+from tools.bench.fakehass import FakeHass, fake_entry
+
+OUTDOOR = "sensor.outdoor"
+
+_DOMAINS: tuple[tuple[type, str], ...] = (
+    (ClimateEntity, "climate"),
+    (NumberEntity, "number"),
+    (SwitchEntity, "switch"),
+    (SensorEntity, "sensor"),
+)
+
+
+def make_hass() -> FakeHass:
+    """Fake hass that is still starting, with responsive devices."""
+    hass = FakeHass()
+    hass.install_device_services()
+    hass.state = CoreState.starting
+    hass.is_running = False
+    hass.data[DATA_RESTORE_STATE] = SimpleNamespace(last_states={})
+    return hass
+
+
+async def async_setup_integration(hass: FakeHass, **domain_config: Any) -> None:
+    """YAML-level setup without pacing (no stagger, no rate limits)."""
+    rate_limit = {CONF_GLOBAL_RATE: 0, CONF_GATEWAY_RATE: 0, CONF_STAGGER: 0}
+    config = {CONF_RATE_LIMIT: integration.RATE_LIMIT_SCHEMA(rate_limit), **domain_config}
+    await integration.async_setup(hass, {DOMAIN: config})
+
+
+async def async_start_hass(hass: FakeHass) -> None:
+    """Fire ``homeassistant_started`` and let the first refreshes run."""
+    hass.state = CoreState.running
+    hass.is_running = True
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+
+def commands(hass: FakeHass) -> int:
+    """Service calls sent to the zones' devices so far."""
+    return sum(n for key, n in hass.services.calls.items() if key.startswith(("climate.", "number.")))
+
+
+def _write_state(hass: FakeHass, entity: Any) -> None:
+    if not entity.available:
+        hass.states.async_set(entity.entity_id, "unavailable")
+        return
+    attrs = dict(entity.state_attributes or {})
+    attrs.update(entity.extra_state_attributes or {})
+    hass.states.async_set(entity.entity_id, entity.state, attrs)
+
+
+async def async_setup_zone(
+    hass: FakeHass,
+    zone: str = "sala",
+    *,
+    t_in: float | None = 26.0,
+    t_out: float | None = 30.0,
+    restore: ZoneRestoreData | None = None,
+    **options: Any,
+) -> ThermoAdaptClimate:
+    """Set up *zone* (AC, TRV, indoor sensors) and return its climate entity.
+
+    ``None`` readings leave the sensor ``unavailable``.
+    """
+    if not hass.services.has_service(DOMAIN, SERVICE_SET_PARAMS):
+        await async_setup_integration(hass)
+    entry = fake_entry(zone, outdoor=OUTDOOR, **options)
+    data = entry.data
+    hass.states.async_set(OUTDOOR, "unavailable" if t_out is None else t_out)
+    hass.states.async_set(data["temp_in"], "unavailable" if t_in is None else t_in)
+    hass.states.async_set(data["hum_in"], 50)
+    hass.states.async_set(data["climate_entity"], "off", {"temperature": 24.0})
+    hass.states.async_set(data["trv_entity"], 7, {"min": 5, "max": 30, "step": 0.5})
+    if restore is not None:
+        hass.data[DATA_RESTORE_STATE].last_states[f"climate.thermoadapt_{zone}"] = StoredState(
+            State(f"climate.thermoadapt_{zone}", restore.hvac_mode), restore, datetime.now(timezone.utc)
+        )
+
+    collected = hass.config_entries.entities
+    first = len(collected)
+    await integration.async_setup_entry(hass, entry)
+    climate: ThermoAdaptClimate | None = None
+    for entity in collected[first:]:
+        entity.hass = hass
+        entity._removers = []
+        entity.async_on_remove = entity._removers.append
+        if entity.entity_id is None:
+            domain = next(d for cls, d in _DOMAINS if isinstance(entity, cls))
+            entity.entity_id = f"{domain}.{entity.unique_id}"
+        entity.async_write_ha_state = lambda entity=entity: _write_state(hass, entity)
+        if isinstance(entity, ThermoAdaptClimate):
+            climate = entity
+            await entity.async_added_to_hass()
+        entity.async_write_ha_state()
+    assert climate is not None
+    return climate
+
+
+async def async_remove_zone(hass: FakeHass, entity: ThermoAdaptClimate) -> None:
+    """Run the climate entity's removal callbacks and settle pending tasks."""
+    for remove in entity._removers:
+        remove()
+    for task in list(hass._tasks):
+        task.cancel()
+    await hass.async_block_till_done()
@@ -0,0 +1,92 @@
+"""Batch set-point engine vs the scalar equations (must match exactly)."""
+
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from custom_components.thermoadapt.batch import (
+    HAS_NUMPY,
+    ComfortParamsArray,
+    evaluate_setpoints,
+)
+from custom_components.thermoadapt.control import adaptive_setpoint
+from custom_components.thermoadapt.helpers import tset_cool, tset_heat
+from custom_components.thermoadapt.models import ComfortParams
+
+PATHS = [False, pytest.param(True, marks=pytest.mark.skipif(not HAS_NUMPY, reason="no NumPy"))]
+
+ZONES = [
+    ComfortParams(),
+    ComfortParams(tc_base=24.0, tc_min=22.5, th_base=21.0, k_heat=0.25, ua_total=45.0, q_int=350.0),
+    ComfortParams(tc_base=26.5, tc_min=26.5, th_base=19.0, k_heat=0.05, ua_total=12.0, q_int=0.0),
+    ComfortParams(tc_base=25.0, tc_min=20.0, th_base=22.0, k_heat=0.40, ua_total=80.0, q_int=1200.0),
+]
+
+
+def _grid(p: ComfortParams) -> list[float]:
+    """Outdoor temperatures from -10 to 45 °C plus both balance points."""
+    return [t / 4 for t in range(-40, 181)] + [p.t_bal_cool, p.t_bal_heat]
+
+
+def _scalar(t_out: float, p: ComfortParams) -> tuple[float, bool]:
+    cooling = t_out > p.t_bal_cool
+    return (tset_cool(t_out, p) if cooling else tset_heat(t_out, p)), cooling
+
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+@pytest.mark.parametrize("p", ZONES)
+def test_series_matches_scalar(p: ComfortParams, use_numpy: bool) -> None:
+    temps = _grid(p)
+    res = evaluate_setpoints(temps, p, use_numpy=use_numpy)
+    for t, sp, cool in zip(temps, list(res.setpoint), list(res.cooling)):
+        assert (sp, bool(cool)) == _scalar(t, p), t
+        # Python's round – np.round differs on ties such as 20.15
+        assert round(float(sp), 1) == adaptive_setpoint(t, p), t
+
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_scalar_input_returns_scalar(use_numpy: bool) -> None:
+    p = ComfortParams()
+    for t in (-5.0, p.t_bal_heat, p.t_bal_cool, 35.0):
+        res = evaluate_setpoints(t, p, use_numpy=use_numpy)
+        assert isinstance(res.setpoint, float) and isinstance(res.cooling, bool)
+        assert (res.setpoint, res.cooling) == _scalar(t, p)
+
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_many_zones_one_sample(use_numpy: bool) -> None:
+    arr = ComfortParamsArray.from_params(ZONES)
+    assert len(arr) == len(ZONES)
+    for t in (0.0, 17.5, 21.0, 33.0):
+        res = evaluate_setpoints(t, arr, use_numpy=use_numpy)
+        assert [(sp, bool(c)) for sp, c in zip(res.setpoint, res.cooling)] == [
+            _scalar(t, p) for p in ZONES
+        ]
+
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_paired_samples(use_numpy: bool) -> None:
+    arr = ComfortParamsArray.from_params(ZONES)
+    temps = [5.0, 19.0, 27.5, 40.0]
+    res = evaluate_setpoints(temps, arr, use_numpy=use_numpy)
+    assert list(res.setpoint) == [_scalar(t, p)[0] for t, p in zip(temps, ZONES)]
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="no NumPy")
+def test_outer_grid() -> None:
+    import numpy as np
+
+    arr = ComfortParamsArray.from_params(ZONES)
+    temps = np.arange(-10.0, 45.0, 0.25)
+    res = evaluate_setpoints(temps[:, None], arr)
+    assert res.setpoint.shape == (len(temps), len(ZONES))
+    for (i, t), (z, p) in itertools.product(enumerate(temps), enumerate(ZONES)):
+        assert (res.setpoint[i, z], bool(res.cooling[i, z])) == _scalar(float(t), p)
+
+
+def test_python_path_rejects_mismatched_lengths() -> None:
+    arr = ComfortParamsArray.from_params(ZONES)
+    with pytest.raises(ValueError):
+        evaluate_setpoints([20.0, 21.0], arr, use_numpy=False)
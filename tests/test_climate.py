@@ -0,0 +1,112 @@
+"""Climate entity start-up on the fake hass (restore, deferred first refresh)."""
+
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.components.climate import HVACMode
+
+from custom_components.thermoadapt.climate import ZoneRestoreData
+from custom_components.thermoadapt.const import CONF_HUB
+from custom_components.thermoadapt.hub import async_get_hub
+from tests.common import (
+    async_remove_zone,
+    async_setup_integration,
+    async_setup_zone,
+    async_start_hass,
+    commands,
+    make_hass,
+)
+
+
+def test_zone_waits_for_started_before_tracking_inputs() -> None:
+    async def main() -> None:
+        hass = make_hass()
+        entity = await async_setup_zone(hass, t_in=26.0)
+        coordinator = entity.coordinator
+
+        # sensors coming up during boot: nothing subscribed, nothing sent
+        hass.states.async_set("sensor.sala_temp", 29.0)
+        hass.states.async_set("sensor.outdoor", 33.0)
+        await asyncio.sleep(0.05)
+        await hass.async_block_till_done()
+        assert coordinator.outdoor is None and coordinator.data is None
+        assert commands(hass) == 0
+
+        await async_start_hass(hass)
+        assert coordinator.outdoor is not None and coordinator.data is not None
+        assert entity.hvac_mode == HVACMode.COOL and commands(hass) > 0
+        await async_remove_zone(hass, entity)
+        assert coordinator.outdoor is None  # async_start's unsub ran on removal
+
+    asyncio.run(main())
+
+
+def _restored() -> ZoneRestoreData:
+    return ZoneRestoreData(setpoint=24.0, hvac_mode=HVACMode.COOL)
+
+
+def test_unavailable_outdoor_at_startup_keeps_restored_state() -> None:
+    async def main() -> None:
+        hass = make_hass()
+        entity = await async_setup_zone(hass, t_out=None, restore=_restored())
+        await async_start_hass(hass)
+
+        # no set-point yet: restored values stay, nothing is commanded
+        assert not entity.available
+        assert (entity.target_temperature, entity.hvac_mode) == (24.0, HVACMode.COOL)
+        assert hass.states.get(entity.entity_id).state == "unavailable"
+        assert commands(hass) == 0
+
+        hass.states.async_set("sensor.outdoor", 30.0)
+        await entity.coordinator.outdoor.async_refresh()
+        await hass.async_block_till_done()
+        assert entity.available and entity.target_temperature == 23.0
+        assert hass.states.get(entity.entity_id).state == HVACMode.COOL
+        assert commands(hass) == 1  # reconciled with the restored COOL
+        await async_remove_zone(hass, entity)
+
+    asyncio.run(main())
+
+
+def test_unavailable_outdoor_in_hub_mode_sends_nothing() -> None:
+    async def main() -> None:
+        hass = make_hass()
+        await async_setup_integration(hass, **{CONF_HUB: {}})
+        entity = await async_setup_zone(hass, t_out=None, restore=_restored())
+        await async_start_hass(hass)
+        hub = async_get_hub(hass)
+        await hub.async_refresh()
+        await hass.async_block_till_done()
+
+        assert not entity.available and entity.coordinator.decision is None
+        assert (entity.target_temperature, entity.hvac_mode) == (24.0, HVACMode.COOL)
+        assert commands(hass) == 0
+        await async_remove_zone(hass, entity)
+        await hub.async_shutdown()
+
+    asyncio.run(main())
+
+
+def test_dry_to_heat_switches_the_ac_off() -> None:
+    async def main() -> None:
+        hass = make_hass()
+        entity = await async_setup_zone(hass, t_in=20.5, t_out=5.0, min_run_minutes=0, min_off_minutes=0)
+        await async_start_hass(hass)
+        sp = entity.target_temperature
+        hass.states.async_set("sensor.sala_hum", 80)
+        hass.states.async_set("sensor.sala_temp", sp)
+        await entity.coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert entity.hvac_mode == HVACMode.DRY
+        assert hass.states.get("climate.sala_ac").state == HVACMode.DRY
+
+        hass.states.async_set("sensor.sala_temp", sp - 2)
+        await entity.coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert entity.hvac_mode == HVACMode.HEAT
+        assert hass.states.get("climate.sala_ac").state == HVACMode.OFF
+        assert float(hass.states.get("number.sala_trv").state) > sp
+        await async_remove_zone(hass, entity)
+
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+"""DeviceCommandQueue: latest-wins, skip when satisfied, merged service calls."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from homeassistant.components.climate import HVACMode
+
+from custom_components.thermoadapt.commands import DeviceCommand, DeviceCommandQueue
+from tools.bench.fakehass import FakeHass
+
+
+async def _hass(state: str = "off", temperature: float = 20.0) -> tuple[FakeHass, list]:
+    """FakeHass with responsive devices; returns it and the list of calls made."""
+    hass = FakeHass()
+    hass.install_device_services()
+    calls: list[tuple[str, dict[str, Any]]] = []
+    for key, handler in list(hass.services.handlers.items()):
+        def record(data: dict[str, Any], key=key, handler=handler) -> None:
+            calls.append((key, dict(data)))
+            handler(data)
+        hass.services.handlers[key] = record
+    hass.states.async_set("climate.ac", state, {"temperature": temperature})
+    hass.states.async_set("number.trv", 18.0)
+    return hass, calls
+
+
+def test_mode_and_temperature_in_one_call() -> None:
+    async def main() -> None:
+        hass, calls = await _hass()
+        queue = DeviceCommandQueue(hass, "climate.ac")
+        queue.async_submit(DeviceCommand("climate.ac", HVACMode.COOL, 23.0))
+        await hass.async_block_till_done()
+        assert calls == [(
+            "climate.set_temperature",
+            {"entity_id": "climate.ac", "temperature": 23.0, "hvac_mode": HVACMode.COOL},
+        )]
+        assert queue.stats.sent == 1 and queue.last_command.temperature == 23.0
+
+    asyncio.run(main())
+
+
+def test_only_newest_pending_command_is_sent() -> None:
+    async def main() -> None:
+        hass, calls = await _hass()
+        queue = DeviceCommandQueue(hass, "climate.ac")
+        for temp in (22.0, 23.0, 24.0):
+            queue.async_submit(DeviceCommand("climate.ac", HVACMode.COOL, temp))
+        await hass.async_block_till_done()
+        assert [c[1]["temperature"] for c in calls] == [24.0]
+        assert queue.stats.cancelled == 2 and queue.stats.sent == 1
+
+    asyncio.run(main())
+
+
+def test_satisfied_command_is_skipped() -> None:
+    async def main() -> None:
+        hass, calls = await _hass("cool", 23.0)
+        queue = DeviceCommandQueue(hass, "climate.ac")
+        queue.async_submit(DeviceCommand("climate.ac", HVACMode.COOL, 23.0))
+        await hass.async_block_till_done()
+        assert calls == [] and queue.stats.skipped == 1
+
+    asyncio.run(main())
+
+
+def test_off_and_trv_use_their_own_services() -> None:
+    async def main() -> None:
+        hass, calls = await _hass("cool", 23.0)
+        DeviceCommandQueue(hass, "climate.ac").async_submit(
+            DeviceCommand("climate.ac", HVACMode.OFF, 23.0)
+        )
+        DeviceCommandQueue(hass, "number.trv").async_submit(
+            DeviceCommand("number.trv", temperature=21.5)
+        )
+        await hass.async_block_till_done()
+        assert sorted(calls) == [
+            ("climate.set_hvac_mode", {"entity_id": "climate.ac", "hvac_mode": HVACMode.OFF}),
+            ("number.set_value", {"entity_id": "number.trv", "value": 21.5}),
+        ]
+
+    asyncio.run(main())
+
+
+def test_unavailable_device_trusts_last_command() -> None:
+    async def main() -> None:
+        hass, calls = await _hass()
+        queue = DeviceCommandQueue(hass, "climate.ac")
+        command = DeviceCommand("climate.ac", HVACMode.COOL, 23.0)
+        queue.async_submit(command)
+        await hass.async_block_till_done()
+        hass.states.async_set("climate.ac", "unavailable")
+        queue.async_submit(command)
+        await hass.async_block_till_done()
+        assert len(calls) == 1 and queue.stats.skipped == 1
+
+    asyncio.run(main())
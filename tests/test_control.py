@@ -0,0 +1,83 @@
+"""Dead-band rule and the ModeController state machine."""
+
+from __future__ import annotations
+
+from homeassistant.components.climate import HVACMode
+
+from custom_components.thermoadapt.const import HUMID_HYSTERESIS
+from custom_components.thermoadapt.control import ModeController, decide_mode
+from custom_components.thermoadapt.models import ComfortParams
+
+P = ComfortParams(deadband_cool=0.5, deadband_heat=1.0, humid_max=65)
+SP = 24.0
+
+
+def test_decide_mode_dead_bands() -> None:
+    assert decide_mode(24.6, SP, P, has_trv=True) == HVACMode.COOL
+    assert decide_mode(24.5, SP, P, has_trv=True) == HVACMode.OFF
+    assert decide_mode(23.0, SP, P, has_trv=True) == HVACMode.OFF
+    assert decide_mode(22.9, SP, P, has_trv=True) == HVACMode.HEAT
+    assert decide_mode(22.9, SP, P, has_trv=False) == HVACMode.OFF
+
+
+def test_cool_hysteresis_runs_down_to_setpoint() -> None:
+    ctl = ModeController()
+    assert ctl.step(0, 24.4, SP, P, has_trv=False) == HVACMode.OFF  # inside the dead-band
+    assert ctl.step(1, 24.6, SP, P, has_trv=False) == HVACMode.COOL
+    assert ctl.step(2, 24.1, SP, P, has_trv=False) == HVACMode.COOL  # keeps cooling
+    assert ctl.step(3, 24.0, SP, P, has_trv=False) == HVACMode.OFF   # set-point reached
+    assert ctl.stats.transitions == 2
+
+
+def test_heat_only_with_trv() -> None:
+    ctl = ModeController()
+    assert ctl.step(0, 22.0, SP, P, has_trv=False) == HVACMode.OFF
+    assert ctl.step(1, 22.0, SP, P, has_trv=True) == HVACMode.HEAT
+    assert ctl.step(2, 23.9, SP, P, has_trv=True) == HVACMode.HEAT
+    assert ctl.step(3, 24.0, SP, P, has_trv=True) == HVACMode.OFF
+
+
+def test_dry_with_humidity_hysteresis() -> None:
+    ctl = ModeController()
+    assert ctl.step(0, SP, SP, P, 66, has_trv=False) == HVACMode.DRY
+    assert ctl.step(1, SP, SP, P, 65 - HUMID_HYSTERESIS + 1, has_trv=False) == HVACMode.DRY
+    assert ctl.step(2, SP, SP, P, 65 - HUMID_HYSTERESIS, has_trv=False) == HVACMode.OFF
+    # cooling demand wins over DRY
+    assert ctl.step(3, 25.0, SP, P, 80, has_trv=False) == HVACMode.COOL
+
+
+def test_min_run_and_min_off_hold_the_mode() -> None:
+    ctl = ModeController(min_run=300, min_off=120)
+    assert ctl.step(0, 25.0, SP, P, has_trv=False) == HVACMode.COOL
+    for now in (60, 120, 299):  # one held-back stop, counted once
+        assert ctl.step(now, 23.0, SP, P, has_trv=False) == HVACMode.COOL
+    assert ctl.stats.suppressed_min_run == 1
+    assert ctl.step(300, 23.0, SP, P, has_trv=False) == HVACMode.OFF
+
+    assert ctl.peek(360, 25.0, SP, P, has_trv=False) == HVACMode.OFF
+    assert ctl.step(360, 25.0, SP, P, has_trv=False) == HVACMode.OFF
+    assert ctl.stats.suppressed_min_off == 1
+    assert ctl.step(420, 25.0, SP, P, has_trv=False) == HVACMode.COOL
+    assert ctl.stats.transitions == 3
+
+
+def test_restore_does_not_enforce_timing() -> None:
+    ctl = ModeController(min_run=600)
+    ctl.restore(HVACMode.COOL)
+    assert ctl.step(0, 23.0, SP, P, has_trv=False) == HVACMode.OFF
+
+
+def test_compressor_cap_refuses_start_once() -> None:
+    ctl = ModeController()
+    for now in range(3):
+        assert ctl.step(now, 25.0, SP, P, has_trv=False, allow_start=False) == HVACMode.OFF
+    assert ctl.stats.suppressed_cap == 1
+    assert ctl.step(3, 25.0, SP, P, has_trv=False) == HVACMode.COOL
+    # a running compressor is not stopped by the cap
+    assert ctl.step(4, 25.0, SP, P, has_trv=False, allow_start=False) == HVACMode.COOL
+
+
+def test_dry_goes_straight_to_heat_when_cold() -> None:
+    ctl = ModeController()
+    assert ctl.step(0, SP, SP, P, 70, has_trv=True) == HVACMode.DRY
+    assert ctl.step(1, 22.9, SP, P, 70, has_trv=True) == HVACMode.HEAT
@@ -0,0 +1,61 @@
+"""DecisionLog ring buffer and its exports."""
+
+from __future__ import annotations
+
+import csv
+import io
+
+from homeassistant.components.climate import HVACMode
+
+from custom_components.thermoadapt.decisions import (
+    CMD_AC,
+    CMD_SAFETY,
+    CMD_TRV,
+    COLUMNS,
+    EQ_HEAT,
+    DecisionLog,
+)
+
+BYTES_PER_ROW = 18
+
+
+def _record(log: DecisionLog, i: int, **kw) -> None:
+    args = dict(
+        ts=1_700_000_000 + 30 * i, t_in=20.0 + i, t_out=10.0, setpoint=22.0, t_bal=16.5,
+        deadband=0.5, hum=55.4, mode_before=HVACMode.OFF, mode_after=HVACMode.HEAT,
+        flags=CMD_TRV | EQ_HEAT,
+    )
+    args.update(kw)
+    log.record(**args)
+
+
+def test_ring_overwrites_oldest_first() -> None:
+    log = DecisionLog(3)
+    for i in range(5):
+        _record(log, i)
+    assert len(log) == 3 and log.total == 5
+    assert [row[1] for row in log.rows()] == [22.0, 23.0, 24.0]
+    assert log.nbytes == 3 * BYTES_PER_ROW
+
+
+def test_row_decoding() -> None:
+    log = DecisionLog(4)
+    _record(log, 0)
+    _record(log, 1, t_in=None, hum=None, t_out=999.0, flags=CMD_AC | CMD_SAFETY,
+            mode_before=HVACMode.COOL, mode_after=HVACMode.OFF)
+    first, second = log.rows()
+    assert first[1:] == (20.0, 10.0, 22.0, 16.5, "heat", 0.5, 55, "off", "heat", "trv")
+    assert second[1] is None and second[7] is None
+    assert second[2] == 327.67  # clamped to the int16 range
+    assert second[5:] == ("cool", 0.5, None, "cool", "off", "ac|safety")
+
+
+def test_exports() -> None:
+    log = DecisionLog(2)
+    _record(log, 0, hum=None)
+    data = log.as_dict()
+    assert data["count"] == 1 and data["bytes"] == BYTES_PER_ROW
+    assert data["columns"] == list(COLUMNS)
+    rows = list(csv.reader(io.StringIO(log.as_csv())))
+    assert rows[0] == list(COLUMNS)
+    assert rows[1][0] == "2023-11-14T22:13:20+00:00" and rows[1][7] == ""
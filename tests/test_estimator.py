@@ -0,0 +1,82 @@
+"""ThermalEstimator: RLS fit of free-floating data, learned() and persistence."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from custom_components.thermoadapt.const import (
+    THERMAL_CAPACITANCE,
+    THERMAL_MIN_SAMPLES,
+    THERMAL_SAMPLE_SEC,
+)
+from custom_components.thermoadapt.estimator import ThermalEstimator
+
+UA, Q = 40.0, 400.0  # W/K, W
+
+
+def _feed(est: ThermalEstimator, hours: float, *, ua: float = UA, q: float = Q) -> None:
+    """Free-floating room (RC model, 60 s Euler steps) under a daily outdoor sine."""
+    t_in, ts = 22.0, 0.0
+    while ts < hours * 3600:
+        t_out = 15.0 + 8.0 * math.sin(2 * math.pi * ts / 86400)
+        if ts % THERMAL_SAMPLE_SEC == 0:
+            est.observe(ts, t_in, t_out, True)
+        t_in += (ua * (t_out - t_in) + q) / THERMAL_CAPACITANCE * 60
+        ts += 60
+
+
+def test_learns_the_envelope() -> None:
+    est = ThermalEstimator()
+    _feed(est, 72)
+    learned = est.learned()
+    assert learned is not None
+    assert learned[0] == pytest.approx(UA, rel=0.1)
+    assert learned[1] == pytest.approx(Q, rel=0.1)
+    # rounded to 0.5 W/K and 5 W
+    assert learned[0] * 2 == int(learned[0] * 2) and learned[1] % 5 == 0
+
+
+def test_nothing_learned_before_enough_samples() -> None:
+    est = ThermalEstimator()
+    _feed(est, THERMAL_MIN_SAMPLES * THERMAL_SAMPLE_SEC / 3600 - 1)
+    assert est.samples < THERMAL_MIN_SAMPLES and est.learned() is None
+
+
+def test_hvac_running_discards_the_interval() -> None:
+    est = ThermalEstimator()
+    assert not est.observe(0.0, 22.0, 30.0, True)
+    assert not est.observe(THERMAL_SAMPLE_SEC / 2, 22.0, 30.0, True)  # too short – wait
+    assert not est.observe(THERMAL_SAMPLE_SEC / 2 + 1, 21.0, 30.0, False)
+    assert not est.observe(THERMAL_SAMPLE_SEC, 22.0, 30.0, True)  # new interval start
+    assert est.observe(2 * THERMAL_SAMPLE_SEC, 22.1, 30.0, True)
+    assert est.samples == 1
+
+
+def test_implausible_fit_is_not_fed_back() -> None:
+    est = ThermalEstimator()
+    _feed(est, 48, ua=1.0, q=0.0)  # far below the plausible envelope
+    assert est.samples >= THERMAL_MIN_SAMPLES and est.learned() is None
+
+
+def test_restore_round_trip() -> None:
+    est = ThermalEstimator()
+    _feed(est, 72)
+    copy = ThermalEstimator()
+    copy.restore(est.as_dict())
+    assert copy.learned() == est.learned() and copy.samples == est.samples
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {},
+        {"a": "x", "b": 1, "p": [1, 0, 1], "samples": 3},
+        {"a": 1, "b": 1, "p": None, "samples": 1},
+    ],
+)
+def test_corrupt_payload_is_ignored(payload: dict) -> None:
+    est = ThermalEstimator()
+    est.restore(payload)
+    assert est.samples == 0 and (est.a, est.b) == (0.0, 0.0)
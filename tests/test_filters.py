@@ -0,0 +1,97 @@
+"""InputFilter: dedupe, outliers, staleness and the three estimators."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.thermoadapt.const import (
+    FILTER_HUM_SCALE,
+    FILTER_MAX_JUMP,
+    FILTER_OUTLIER_CONFIRM,
+    FILTER_STALE_SEC,
+    INPUT_FILTER_EWMA,
+    INPUT_FILTER_KALMAN,
+    INPUT_FILTER_MEDIAN,
+    INPUT_FILTER_NONE,
+)
+from custom_components.thermoadapt.filters import InputFilter, make_input_filter
+
+
+def test_same_stamp_is_not_a_new_sample() -> None:
+    flt = InputFilter(INPUT_FILTER_NONE)
+    stamp = object()
+    assert flt.update(21.0, 0, stamp) == 21.0
+    assert flt.update(21.0, 30, stamp) == 21.0
+    assert flt.samples == 1
+    flt.update(21.5, 60, object())
+    assert flt.samples == 2
+
+
+def test_median_window() -> None:
+    flt = InputFilter(INPUT_FILTER_MEDIAN)
+    out = [flt.update(x, i * 30) for i, x in enumerate((20.0, 21.0, 20.5, 20.6, 20.4, 22.0, 22.0))]
+    assert out[:3] == [20.0, 20.5, 20.5]
+    assert out[-1] == 20.6  # median of the last five
+
+
+def test_outlier_rejected_until_confirmed() -> None:
+    flt = InputFilter(INPUT_FILTER_MEDIAN)
+    flt.update(22.0, 0)
+    spike = 22.0 + FILTER_MAX_JUMP + 1.0
+    for k in range(1, FILTER_OUTLIER_CONFIRM):
+        assert flt.update(spike, k) == 22.0
+    assert flt.rejected == FILTER_OUTLIER_CONFIRM - 1
+    # the step persists – accepted and the estimate starts over from it
+    assert flt.update(spike, FILTER_OUTLIER_CONFIRM) == spike
+
+
+def test_single_spike_does_not_move_the_estimate() -> None:
+    flt = InputFilter(INPUT_FILTER_MEDIAN)
+    flt.update(22.0, 0)
+    assert flt.update(40.0, 30) == 22.0
+    assert flt.update(22.1, 60) == pytest.approx(22.05)
+    assert flt.rejected == 1
+
+
+def test_none_filter_never_rejects_or_holds() -> None:
+    flt = InputFilter(INPUT_FILTER_NONE)
+    flt.update(22.0, 0)
+    assert flt.update(40.0, 1) == 40.0
+    assert flt.update(None, 2) is None
+
+
+def test_stale_hold_then_reset() -> None:
+    flt = InputFilter(INPUT_FILTER_MEDIAN)
+    flt.update(22.0, 0)
+    assert flt.update(None, 10) == 22.0  # held
+    assert not flt.stale(10 + FILTER_STALE_SEC - 1)
+    assert flt.current(10 + FILTER_STALE_SEC) is None
+    assert flt.stale(10 + FILTER_STALE_SEC)
+    # back after the hold: old samples no longer count
+    assert flt.update(23.0, 20 + FILTER_STALE_SEC) == 23.0
+    assert flt.as_dict(20 + FILTER_STALE_SEC)["stale"] is False
+
+
+def test_ewma_time_constant() -> None:
+    flt = InputFilter(INPUT_FILTER_EWMA)
+    flt.update(20.0, 0)
+    a = flt.update(21.0, 30)
+    b = InputFilter(INPUT_FILTER_EWMA)
+    b.update(20.0, 0)
+    c = b.update(21.0, 300)
+    assert 20.0 < a < c < 21.0  # a longer gap moves further
+
+
+def test_kalman_converges() -> None:
+    flt = InputFilter(INPUT_FILTER_KALMAN)
+    value = None
+    for i in range(60):
+        value = flt.update(21.0 + (0.2 if i % 2 else -0.2), i * 30)
+    assert value == pytest.approx(21.0, abs=0.1)
+
+
+def test_humidity_limits_are_scaled() -> None:
+    flt = make_input_filter(INPUT_FILTER_MEDIAN, "hum")
+    assert flt.max_jump == FILTER_MAX_JUMP * FILTER_HUM_SCALE
+    flt.update(55.0, 0)
+    assert flt.update(60.0, 30) == 57.5  # within the humidity jump limit
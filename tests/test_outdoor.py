@@ -0,0 +1,110 @@
+"""OutdoorCoordinator running mean (EN 16798-1) and its ``Store``."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+from time import time
+
+import pytest
+
+from custom_components.thermoadapt.const import RUNNING_MEAN_ALPHA
+from custom_components.thermoadapt.outdoor import OutdoorCoordinator
+from tests.common import OUTDOOR, make_hass
+from tools.bench.fakehass import FakeHass
+
+DAY = 86400.0
+
+
+def _hass(tmp_path: Path) -> FakeHass:
+    """Fake hass whose ``.storage`` lives in *tmp_path*."""
+    hass = make_hass()
+    hass.config.config_dir = str(tmp_path)
+    hass.config.path = lambda *p: os.path.join(tmp_path, *p)
+    return hass
+
+
+async def _stored(hass: FakeHass, data: dict) -> None:
+    # what a previous run left on disk
+    await OutdoorCoordinator(hass, OUTDOOR)._rm_store.async_save(data)
+
+
+def test_daily_weight(tmp_path: Path) -> None:
+    async def main() -> None:
+        hass = _hass(tmp_path)
+        outdoor = OutdoorCoordinator(hass, OUTDOOR)
+        outdoor._update_running_mean(20.0, 1000.0)  # seed
+        assert outdoor.running_mean == 20.0
+        outdoor._update_running_mean(30.0, 1000.0 + DAY)
+        expected = RUNNING_MEAN_ALPHA * 20.0 + (1 - RUNNING_MEAN_ALPHA) * 30.0
+        assert outdoor.running_mean == pytest.approx(expected)
+
+        # irregular samples: two half days weigh as one full day
+        halves = OutdoorCoordinator(hass, OUTDOOR)
+        halves._update_running_mean(20.0, 1000.0)
+        halves._update_running_mean(30.0, 1000.0 + DAY / 2)
+        halves._update_running_mean(30.0, 1000.0 + DAY)
+        assert halves.running_mean == pytest.approx(expected)
+
+    asyncio.run(main())
+
+
+def test_clock_going_back_keeps_the_mean(tmp_path: Path) -> None:
+    async def main() -> None:
+        outdoor = OutdoorCoordinator(_hass(tmp_path), OUTDOOR)
+        outdoor._update_running_mean(20.0, 1000.0)
+        outdoor._update_running_mean(35.0, 500.0)
+        assert outdoor._running_mean_data() == {"value": 20.0, "ts": 1000.0}
+
+    asyncio.run(main())
+
+
+def test_update_queues_a_save(tmp_path: Path) -> None:
+    async def main() -> None:
+        outdoor = OutdoorCoordinator(_hass(tmp_path), OUTDOOR)
+        outdoor._update_running_mean(20.0, 1000.0)
+        # the store hands back its pending delayed save
+        assert await outdoor._rm_store.async_load() == {"value": 20.0, "ts": 1000.0}
+
+    asyncio.run(main())
+
+
+def test_first_refresh_resumes_the_stored_mean(tmp_path: Path) -> None:
+    async def main() -> None:
+        hass = _hass(tmp_path)
+        await _stored(hass, {"value": 20.0, "ts": time() - DAY})
+        hass.states.async_set(OUTDOOR, "30.0")
+        outdoor = OutdoorCoordinator(hass, OUTDOOR)
+        await outdoor.async_ensure_data()
+        assert outdoor.data == 30.0
+        assert outdoor.running_mean == pytest.approx(22.0, abs=0.01)
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "data", [{"value": "x", "ts": 1.0}, {"value": 20.0}, {"value": None, "ts": 1.0}]
+)
+def test_invalid_store_is_discarded(tmp_path: Path, data: dict) -> None:
+    async def main() -> None:
+        hass = _hass(tmp_path)
+        await _stored(hass, data)
+        hass.states.async_set(OUTDOOR, "30.0")
+        outdoor = OutdoorCoordinator(hass, OUTDOOR)
+        await outdoor.async_ensure_data()
+        assert outdoor.running_mean == 30.0  # seeded from the sensor
+
+    asyncio.run(main())
+
+
+def test_load_does_not_override_a_live_mean(tmp_path: Path) -> None:
+    async def main() -> None:
+        hass = _hass(tmp_path)
+        await _stored(hass, {"value": 10.0, "ts": 1.0})
+        outdoor = OutdoorCoordinator(hass, OUTDOOR)
+        outdoor._update_running_mean(25.0, time())
+        await outdoor._async_load_running_mean()
+        assert outdoor.running_mean == 25.0
+
+    asyncio.run(main())
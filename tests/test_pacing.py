@@ -0,0 +1,91 @@
+"""Zone staggering, token buckets and the priority command rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.thermoadapt.const import PRIORITY_NORMAL, PRIORITY_SAFETY
+from custom_components.thermoadapt.pacing import (
+    CommandRateLimiter,
+    PacingConfig,
+    TokenBucket,
+    ZoneScheduler,
+)
+from tools.bench.fakehass import FakeHass
+
+
+def test_scheduler_spreads_zones_over_the_window() -> None:
+    sched = ZoneScheduler(6.0)
+    for zone in ("a", "b", "c"):
+        sched.async_register(zone)
+    sched.async_register("a")  # idempotent
+    assert [sched.delay(z) for z in ("a", "b", "c")] == [0.0, 2.0, 4.0]
+    assert sched.delay("unknown") == 0.0
+    sched.async_unregister("a")
+    assert [sched.delay(z) for z in ("b", "c")] == [0.0, 3.0]
+    assert ZoneScheduler(0).delay("b") == 0.0
+
+
+def test_token_bucket_refill_and_burst() -> None:
+    bucket = TokenBucket(rate=2.0, burst=2, now=0.0)
+    for _ in range(2):
+        assert bucket.ready(0.0)
+        bucket.take()
+    assert not bucket.ready(0.0)
+    assert bucket.wait() == pytest.approx(0.5)
+    assert bucket.ready(0.5)
+    bucket.take()
+    assert bucket.ready(100.0) and bucket.tokens == 2.0  # capped at burst
+
+
+def test_token_bucket_unlimited() -> None:
+    bucket = TokenBucket(rate=0, burst=1, now=0.0)
+    for _ in range(10):
+        assert bucket.ready(0.0)
+        bucket.take()
+    assert bucket.wait() == 0.0
+
+
+def test_limiter_grants_in_priority_order() -> None:
+    async def main() -> list[str]:
+        hass = FakeHass()
+        limiter = CommandRateLimiter(hass, PacingConfig(global_rate=50.0, global_burst=1))
+        await limiter.async_acquire("climate.first", PRIORITY_NORMAL)  # uses the burst
+        order: list[str] = []
+
+        async def call(entity_id: str, priority: int) -> None:
+            await limiter.async_acquire(entity_id, priority)
+            order.append(entity_id)
+
+        await asyncio.gather(
+            call("climate.a", PRIORITY_NORMAL),
+            call("climate.b", PRIORITY_NORMAL),
+            call("number.trv", PRIORITY_SAFETY),
+        )
+        assert limiter.delayed == 3 and limiter.granted == 4
+        assert limiter.depth == 0
+        return order
+
+    assert asyncio.run(main()) == ["number.trv", "climate.a", "climate.b"]
+
+
+def test_limiter_per_gateway_buckets() -> None:
+    async def main() -> None:
+        hass = FakeHass()
+        limiter = CommandRateLimiter(
+            hass, PacingConfig(global_rate=0, gateway_rate=1.0, gateway_burst=1)
+        )
+        # no registry – every entity is its own gateway
+        await limiter.async_acquire("climate.a", PRIORITY_NORMAL)
+        await limiter.async_acquire("climate.b", PRIORITY_NORMAL)
+        assert limiter.delayed == 0
+        waiter = asyncio.ensure_future(limiter.async_acquire("climate.a", PRIORITY_NORMAL))
+        await asyncio.sleep(0.05)
+        assert not waiter.done() and limiter.depth == 1
+        limiter.async_shutdown()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(main())
@@ -0,0 +1,38 @@
+"""Zone sensors: the metric sensors follow the live *diagnostics_metrics* option."""
+
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.thermoadapt.const import CONF_METRICS
+from custom_components.thermoadapt.sensor import METRIC_SENSORS, ThermoAdaptMetricSensor
+from tests.common import async_setup_zone, async_start_hass, make_hass
+
+
+def test_metric_sensors_follow_the_option_without_reload() -> None:
+    async def main() -> None:
+        hass = make_hass()
+        entity = await async_setup_zone(hass, **{CONF_METRICS: False})
+        await async_start_hass(hass)
+        coordinator = entity.coordinator
+        sensors = [
+            e for e in hass.config_entries.entities if isinstance(e, ThermoAdaptMetricSensor)
+        ]
+        # created anyway, disabled in the registry until the user enables them
+        assert len(sensors) == len(METRIC_SENSORS)
+        assert not any(s.entity_registry_enabled_default for s in sensors)
+        assert not any(s.available for s in sensors)
+
+        entry = coordinator.entry
+        entry.options = {**entry.options, CONF_METRICS: True}
+        coordinator.async_apply_options()
+        await coordinator.async_refresh()  # the scheduled tick
+        assert all(s.available for s in sensors)
+        ticks = next(s for s in sensors if s.entity_description.key == "ticks")
+        assert ticks.native_value >= 1
+
+        entry.options = {**entry.options, CONF_METRICS: False}
+        coordinator.async_apply_options()
+        assert coordinator.metrics is None and not any(s.available for s in sensors)
+
+    asyncio.run(main())
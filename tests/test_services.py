@@ -0,0 +1,90 @@
+"""``thermoadapt.set_params``: schema ranges, all-or-nothing, one recompute per zone."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+import voluptuous as vol
+from homeassistant.core import ServiceCall
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.thermoadapt import SET_PARAMS_SCHEMA
+from custom_components.thermoadapt.const import ATTR_ZONES, DOMAIN, SERVICE_SET_PARAMS
+from custom_components.thermoadapt.coordinator import ThermoAdaptCoordinator
+from tests.common import async_setup_zone, async_start_hass, make_hass
+from tools.bench.fakehass import FakeHass
+
+
+async def _async_set_params(hass: FakeHass, zones: dict[str, Any]) -> None:
+    data = SET_PARAMS_SCHEMA({ATTR_ZONES: zones})
+    handler = hass.services.registered[f"{DOMAIN}.{SERVICE_SET_PARAMS}"]
+    await handler(ServiceCall(DOMAIN, SERVICE_SET_PARAMS, data))
+    await hass.async_block_till_done()
+
+
+def _count_recomputes(coordinator: ThermoAdaptCoordinator) -> list[None]:
+    calls: list[None] = []
+    schedule = coordinator.async_schedule_recompute
+
+    def _counting() -> None:
+        calls.append(None)
+        schedule()
+
+    coordinator.async_schedule_recompute = _counting
+    return calls
+
+
+@pytest.mark.parametrize(
+    "values",
+    [{"deadband": 6.0}, {"humid_max": 20}, {"k_heat": "x"}, {"no_such_param": 1.0}, {}],
+)
+def test_schema_rejects_out_of_range_values(values: dict[str, Any]) -> None:
+    with pytest.raises(vol.Invalid):
+        SET_PARAMS_SCHEMA({ATTR_ZONES: {"sala": values}})
+
+
+def test_schema_coerces_whole_numbers() -> None:
+    data = SET_PARAMS_SCHEMA({ATTR_ZONES: {"sala": {"humid_max": "60", "deadband": "1"}}})
+    assert data[ATTR_ZONES]["sala"] == {"humid_max": 60, "deadband": 1.0}
+
+
+def test_set_params_writes_all_sliders_and_recomputes_once() -> None:
+    async def main() -> None:
+        hass = make_hass()
+        sala = (await async_setup_zone(hass, "sala")).coordinator
+        quarto = (await async_setup_zone(hass, "quarto")).coordinator
+        await async_start_hass(hass)
+        recomputes = {"sala": _count_recomputes(sala), "quarto": _count_recomputes(quarto)}
+
+        await _async_set_params(hass, {
+            "sala": {"deadband": 1.0, "temp_min": 22.0, "humid_max": 60},
+            "quarto": {"setpoint": 24.0},
+        })
+        p = sala.params
+        assert (p.deadband_cool, p.tc_min, p.humid_max) == (1.0, 22.0, 60)
+        assert hass.states.get("number.thermoadapt_sala_deadband").state == "1.0"
+        assert quarto.params.tc_base == 24.0
+        assert {zone: len(calls) for zone, calls in recomputes.items()} == {"sala": 1, "quarto": 1}
+
+        # same values again: nothing changes, nothing recomputed
+        await _async_set_params(hass, {"sala": {"deadband": 1.0}})
+        assert len(recomputes["sala"]) == 1
+
+    asyncio.run(main())
+
+
+def test_unknown_zone_changes_nothing() -> None:
+    async def main() -> None:
+        hass = make_hass()
+        sala = (await async_setup_zone(hass, "sala")).coordinator
+        await async_start_hass(hass)
+        before = sala.params
+
+        with pytest.raises(ServiceValidationError, match="cozinha"):
+            await _async_set_params(hass, {"sala": {"deadband": 2.0}, "cozinha": {"deadband": 2.0}})
+        assert sala.params == before
+        assert hass.states.get("number.thermoadapt_sala_deadband").state == "0.5"
+
+    asyncio.run(main())
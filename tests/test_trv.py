@@ -0,0 +1,104 @@
+"""TrvController: quantization, clamps, cadence, frost target and write budget."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.thermoadapt.const import (
+    TRV_BUDGET_BURST,
+    TRV_FROST_TEMP,
+    TRV_MAX_BOOST,
+    TRV_MAX_INTERVAL_SEC,
+    TRV_MIN_INTERVAL_SEC,
+    TRV_MIN_OFFSET,
+    TRV_STEP,
+)
+from custom_components.thermoadapt.trv import TrvController
+
+SP = 21.0
+
+
+def test_output_is_quantized_to_the_device_step() -> None:
+    trv = TrvController(60, 0.0)
+    trv.set_device_range(5, 30, 0.5)
+    value, _ = trv.start(0.0, 20.3, SP)  # sp + kp·0.7
+    assert value == 21.5
+    trv.set_device_range(5, 30, 1.0)
+    value, _ = trv.start(0.0, 20.3, SP)
+    assert value == 22.0
+
+
+def test_device_range_defaults_and_minimum_step() -> None:
+    trv = TrvController(6, 0.0)
+    trv.set_device_range(None, None, None)
+    assert trv.step_size == TRV_STEP
+    trv.set_device_range(5, 30, 0.01)
+    assert trv.step_size == 0.1
+
+
+def test_target_is_clamped_around_the_setpoint_and_to_the_device() -> None:
+    trv = TrvController(60, 0.0)
+    assert trv.start(0.0, 10.0, SP)[0] == SP + TRV_MAX_BOOST       # very cold
+    assert trv.start(0.0, 30.0, SP)[0] == SP + TRV_MIN_OFFSET      # overshoot
+    trv.set_device_range(5, 22, 0.5)
+    assert trv.start(0.0, 10.0, SP)[0] == 22.0
+
+
+def test_no_integration_while_saturated() -> None:
+    trv = TrvController(60, 0.0)
+    trv.start(0.0, 10.0, SP)
+    for now in range(600, 6000, 600):
+        trv.step(float(now), 10.0, SP)
+    assert trv.as_dict()["integral"] == 0.0
+
+
+def test_cadence_stretches_near_the_setpoint() -> None:
+    trv = TrvController(60, 0.0)
+    assert trv.start(0.0, SP - 3, SP)[1] == TRV_MIN_INTERVAL_SEC
+    assert trv.start(0.0, SP, SP)[1] == TRV_MAX_INTERVAL_SEC
+    assert trv.start(0.0, None, SP) == (SP, TRV_MAX_INTERVAL_SEC)
+
+
+@pytest.mark.parametrize(
+    ("lo", "hi", "expected"),
+    [(5, 30, TRV_FROST_TEMP), (8, 30, 8.0), (4, 6, 6.0)],
+)
+def test_frost_target_within_device_range(lo: float, hi: float, expected: float) -> None:
+    trv = TrvController(6, 0.0)
+    trv.set_device_range(lo, hi, 1.0)
+    assert trv.frost(0.0) == expected
+    assert trv.stats.forced == 1
+
+
+def test_write_budget() -> None:
+    trv = TrvController(2, 0.0)  # 2 writes per hour
+    trv.start(0.0, 20.0, SP)     # forced – uses a token
+    sent = [trv.step(60.0 * k, 20.0 - 0.5 * k, SP)[0] for k in range(1, 6)]
+    assert sum(v is not None for v in sent) == TRV_BUDGET_BURST - 1
+    assert trv.stats.over_budget >= 1
+    value, delay = trv.step(300.0, 17.0, SP)
+    assert value is None and delay >= TRV_MIN_INTERVAL_SEC
+    # a token comes back after 30 min
+    assert trv.step(300.0 + 1800.0, 16.0, SP)[0] is not None
+
+
+def test_unchanged_target_is_not_written() -> None:
+    trv = TrvController(60, 0.0)
+    first, _ = trv.start(0.0, 20.0, SP)
+    assert trv.step(1.0, 20.0, SP) == (None, trv._interval(SP - 20.0))
+    assert trv.stats.unchanged == 1 and trv.target == first
+
+
+def test_mode_changes_go_out_with_the_budget_spent() -> None:
+    trv = TrvController(2, 0.0)
+    trv.budget.tokens = 0.0
+    assert trv.frost(0.0) == TRV_FROST_TEMP
+    assert trv.start(0.0, 20.0, SP)[0] is not None
+    assert trv.stats.forced == 2 and trv.stats.sent == 0
+
+
+def test_zero_writes_per_hour_means_no_budget() -> None:
+    trv = TrvController(0, 0.0)
+    trv.start(0.0, 20.0, SP)
+    sent = [trv.step(float(k), 20.0 - 0.5 * k, SP)[0] for k in range(1, 5)]
+    assert all(v is not None for v in sent) and trv.stats.over_budget == 0
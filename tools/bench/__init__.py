@@ -0,0 +1,9 @@
+"""Hot-path microbenchmarks for ThermoAdapt.
+
+Runs against ``fakehass.FakeHass`` – a lightweight state machine, event bus and
+service registry – so no Home Assistant instance or config directory is
+needed (the ``homeassistant`` package must still be importable)::
+
+    python -m tools.bench --json bench.json
+    python -m tools.bench --compare bench.json --max-regression 0.25
+"""
@@ -0,0 +1,88 @@
+"""Run the hot-path and startup benchmarks – ``python -m tools.bench``.
+
+Results are printed as a table and optionally written as JSON.  With
+``--compare`` the run fails (exit code 1) when any benchmark's median got
+slower than the baseline by more than ``--max-regression``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+from homeassistant.const import __version__ as HA_VERSION
+
+from .micro import BenchResult, run_fanout, run_hub, run_single_zone
+from .startup import run_imports, run_setup_entry
+
+
+def _ints(raw: str) -> list[int]:
+    return [int(v) for v in raw.split(",") if v]
+
+
+def compare(results: list[BenchResult], baseline: dict, max_regression: float) -> list[str]:
+    """Return a message per benchmark that regressed past the threshold."""
+    base = {f"{r['name']}[{r['zones']}]": r for r in baseline.get("results", [])}
+    failures = []
+    for res in results:
+        if (old := base.get(res.key)) is None or not old["p50_us"]:
+            continue
+        ratio = res.p50_us / old["p50_us"]
+        if ratio > 1 + max_regression:
+            failures.append(f"{res.key}: p50 {old['p50_us']:.2f} → {res.p50_us:.2f} µs (×{ratio:.2f})")
+    return failures
+
+
+async def _run(args: argparse.Namespace) -> list[BenchResult]:
+    return [
+        *await run_single_zone(args.rounds),
+        *await run_fanout(args.zones, args.rounds),
+        *await run_hub(args.zones, args.rounds),
+        *run_imports(args.import_runs),
+        *await run_setup_entry(args.setup_zones, args.rounds),
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m tools.bench", description=__doc__)
+    ap.add_argument("--zones", type=_ints, default=[1, 10, 100, 1000], help="zone counts for the fan-out tick")
+    ap.add_argument("--setup-zones", type=_ints, default=[1, 10, 100], help="zone counts for async_setup_entry")
+    ap.add_argument("--import-runs", type=int, default=5, help="fresh interpreters for the import timings")
+    ap.add_argument("--rounds", type=int, default=300, help="samples per benchmark")
+    ap.add_argument("--json", type=Path, help="write results to this file")
+    ap.add_argument("--compare", type=Path, help="baseline JSON from a previous run")
+    ap.add_argument("--max-regression", type=float, default=0.25, help="allowed p50 slow-down (0.25 = 25%%)")
+    args = ap.parse_args(argv)
+
+    results = asyncio.run(_run(args))
+
+    print(f"{'benchmark':<40} {'zones':>6} {'p50 µs':>10} {'p95 µs':>10} {'mean µs':>10}")
+    for r in results:
+        print(f"{r.name:<40} {r.zones:>6} {r.p50_us:>10.2f} {r.p95_us:>10.2f} {r.mean_us:>10.2f}")
+
+    if args.json:
+        args.json.write_text(json.dumps({
+            "meta": {
+                "python": platform.python_version(),
+                "homeassistant": HA_VERSION,
+                "machine": platform.machine(),
+                "timestamp": int(time.time()),
+            },
+            "results": [r.as_dict() for r in results],
+        }, indent=2))
+
+    if args.compare:
+        failures = compare(results, json.loads(args.compare.read_text()), args.max_regression)
+        for msg in failures:
+            print(f"REGRESSION {msg}", file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
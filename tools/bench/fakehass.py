@@ -0,0 +1,240 @@
+"""Minimal stand-in for ``HomeAssistant`` used by the benchmarks.
+
+Only what the ThermoAdapt hot path and setup touch is implemented: a
+dict-backed state machine, a service registry that records calls (optionally
+with injected latency), an event bus good enough for
+``async_track_state_change_event``, entry forwarding to the platform modules
+and task helpers bound to the running asyncio loop.  No config directory,
+integrations loader or recorder is involved.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Callable, Coroutine, Iterable
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CoreState
+from homeassistant.util.unit_system import METRIC_SYSTEM
+
+
+@dataclass(slots=True)
+class FakeState:
+    entity_id: str
+    state: str
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+class _EventData(dict):
+    """Event payload; ``.data`` returns itself because HA releases differ in
+    whether bus event filters receive the event or only its data."""
+
+    @property
+    def data(self) -> _EventData:
+        return self
+
+
+class FakeEvent:
+    __slots__ = ("event_type", "data")
+
+    def __init__(self, event_type: str, data: dict[str, Any]) -> None:
+        self.event_type = event_type
+        self.data = _EventData(data)
+
+
+class FakeBus:
+    def __init__(self) -> None:
+        self._listeners: dict[str, list[tuple[Callable, Callable | None]]] = {}
+        self.fired = 0
+
+    def async_listen(
+        self,
+        event_type: str,
+        listener: Callable,
+        event_filter: Callable | None = None,
+        run_immediately: bool = False,
+    ) -> Callable[[], None]:
+        entry = (listener, event_filter)
+        self._listeners.setdefault(event_type, []).append(entry)
+
+        def _remove() -> None:
+            self._listeners[event_type].remove(entry)
+
+        return _remove
+
+    def async_listen_once(self, event_type: str, listener: Callable) -> Callable[[], None]:
+        return self.async_listen(event_type, listener)
+
+    def async_fire(self, event_type: str, data: dict[str, Any] | None = None, **_: Any) -> None:
+        self.fired += 1
+        event = FakeEvent(event_type, data or {})
+        for listener, event_filter in list(self._listeners.get(event_type, ())):
+            if event_filter is None or event_filter(event.data):
+                listener(event)
+
+
+class FakeStates:
+    def __init__(self, bus: FakeBus) -> None:
+        self._states: dict[str, FakeState] = {}
+        self._bus = bus
+        self.writes = 0
+
+    def get(self, entity_id: str) -> FakeState | None:
+        return self._states.get(entity_id)
+
+    def async_entity_ids(self, domain_filter: str | Iterable[str] | None = None) -> list[str]:
+        if domain_filter is None:
+            return list(self._states)
+        domains = (domain_filter,) if isinstance(domain_filter, str) else tuple(domain_filter)
+        return [eid for eid in self._states if eid.split(".", 1)[0] in domains]
+
+    def async_set(self, entity_id: str, state: Any, attributes: dict[str, Any] | None = None) -> None:
+        self.writes += 1
+        old = self._states.get(entity_id)
+        new = self._states[entity_id] = FakeState(entity_id, str(state), dict(attributes or {}))
+        self._bus.async_fire(
+            EVENT_STATE_CHANGED, {"entity_id": entity_id, "old_state": old, "new_state": new}
+        )
+
+
+class FakeServices:
+    """Records calls; *latency* (+ up to *jitter*) seconds are awaited per call
+    to mimic slow devices."""
+
+    def __init__(self, hass: FakeHass, latency: float = 0.0, jitter: float = 0.0) -> None:
+        self._hass = hass
+        self.latency = latency
+        self.jitter = jitter
+        self.calls: Counter[str] = Counter()
+        self.handlers: dict[str, Callable[[dict[str, Any]], None]] = {}
+        self.registered: dict[str, Callable] = {}  # integration handlers, for tests
+
+    async def async_call(
+        self,
+        domain: str,
+        service: str,
+        data: dict[str, Any] | None = None,
+        blocking: bool = False,
+        **_: Any,
+    ) -> None:
+        key = f"{domain}.{service}"
+        self.calls[key] += 1
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + random.uniform(0.0, self.jitter))
+        if (handler := self.handlers.get(key)) is not None:
+            handler(data or {})
+
+    def has_service(self, domain: str, service: str) -> bool:
+        return f"{domain}.{service}" in self.handlers
+
+    def async_register(self, domain: str, service: str, handler: Callable, **_: Any) -> None:
+        self.handlers[f"{domain}.{service}"] = lambda data: None  # not invoked by the benches
+        self.registered[f"{domain}.{service}"] = handler
+
+
+class FakeConfigEntries:
+    """Forwards an entry to platform modules; entities are only collected."""
+
+    def __init__(self, hass: FakeHass) -> None:
+        self._hass = hass
+        self.entities: list[Any] = []
+
+    async def async_forward_entry_setups(self, entry: Any, platforms: Iterable[str]) -> None:
+        for platform in platforms:
+            module = importlib.import_module(f"custom_components.thermoadapt.{platform}")
+            await module.async_setup_entry(self._hass, entry, self.entities.extend)
+
+
+class FakeHass:
+    """Just enough of ``HomeAssistant`` for coordinators and entities."""
+
+    def __init__(self, *, service_latency: float = 0.0, service_jitter: float = 0.0) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.data: dict[str, Any] = {}
+        self.bus = FakeBus()
+        self.states = FakeStates(self.bus)
+        self.services = FakeServices(self, service_latency, service_jitter)
+        self.config_entries = FakeConfigEntries(self)
+        self.config = SimpleNamespace(
+            config_dir="/tmp", path=lambda *p: "/tmp/" + "/".join(p), units=METRIC_SYSTEM
+        )
+        self.state = CoreState.running
+        self.is_stopping = False
+        self.is_running = True
+        self._tasks: set[asyncio.Task] = set()
+
+    # Task helpers ------------------------------------------------------
+    def async_create_task(self, target: Coroutine, name: str | None = None, **_: Any) -> asyncio.Task:
+        task = self.loop.create_task(target, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def async_create_background_task(self, target: Coroutine, name: str, **_: Any) -> asyncio.Task:
+        return self.async_create_task(target, name)
+
+    def async_run_hass_job(self, job: Any, *args: Any) -> Any:
+        result = job.target(*args)
+        if asyncio.iscoroutine(result):
+            return self.async_create_task(result)
+        return result
+
+    def async_add_executor_job(self, target: Callable, *args: Any) -> asyncio.Future:
+        return self.loop.run_in_executor(None, target, *args)
+
+    async def async_block_till_done(self) -> None:
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    # Device simulation -------------------------------------------------
+    def install_device_services(self) -> None:
+        """Make climate/number services update the target entity's state."""
+
+        def _set_temperature(data: dict[str, Any]) -> None:
+            st = self.states.get(data["entity_id"])
+            mode = data.get("hvac_mode", st.state if st else "off")
+            self.states.async_set(data["entity_id"], mode, {"temperature": data["temperature"]})
+
+        def _set_hvac_mode(data: dict[str, Any]) -> None:
+            st = self.states.get(data["entity_id"])
+            self.states.async_set(data["entity_id"], data["hvac_mode"], st.attributes if st else {})
+
+        def _set_value(data: dict[str, Any]) -> None:
+            self.states.async_set(data["entity_id"], data["value"])
+
+        self.services.handlers.update(
+            {
+                "climate.set_temperature": _set_temperature,
+                "climate.set_hvac_mode": _set_hvac_mode,
+                "number.set_value": _set_value,
+            }
+        )
+
+
+def fake_entry(zone: str, *, outdoor: str = "sensor.outdoor", trv: bool = True, **options: Any) -> SimpleNamespace:
+    """Config-entry look-alike for *zone* (data + options)."""
+    return SimpleNamespace(
+        entry_id=f"bench_{zone}",
+        title=zone,
+        domain="thermoadapt",
+        data={
+            "name": zone,
+            "climate_entity": f"climate.{zone}_ac",
+            "trv_entity": f"number.{zone}_trv" if trv else "",
+            "temp_in": f"sensor.{zone}_temp",
+            "temp_out": outdoor,
+            "hum_in": f"sensor.{zone}_hum",
+        },
+        options=options,
+        pref_disable_polling=False,
+        async_on_unload=lambda func: None,
+        add_update_listener=lambda listener: (lambda: None),
+        async_create_background_task=lambda hass, target, name: hass.async_create_background_task(
+            target, name
+        ),
+    )
@@ -0,0 +1,265 @@
+"""Microbenchmarks for the ThermoAdapt control hot path."""
+
+from __future__ import annotations
+
+import gc
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable
+
+from custom_components.thermoadapt.climate import ThermoAdaptClimate
+from custom_components.thermoadapt.const import DATA_LIMITER, DOMAIN
+from custom_components.thermoadapt.coordinator import (
+    ThermoAdaptCoordinator,
+    _load_params_from_helpers,
+)
+from custom_components.thermoadapt.filters import make_input_filter
+from custom_components.thermoadapt.helpers import (
+    ensure_helpers,
+    ensure_helpers_bulk,
+    tset_cool,
+    tset_heat,
+)
+from custom_components.thermoadapt.hub import async_get_hub, async_setup_hub
+from custom_components.thermoadapt.models import ComfortParams
+from custom_components.thermoadapt.pacing import PacingConfig, async_setup_pacing
+from custom_components.thermoadapt.params import DEFAULTS, param_entity_id
+
+from .fakehass import FakeHass, FakeState, fake_entry
+
+
+@dataclass(slots=True)
+class BenchResult:
+    name: str
+    zones: int
+    iterations: int
+    mean_us: float
+    p50_us: float
+    p95_us: float
+    min_us: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.zones}]"
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _summarise(name: str, zones: int, samples_ns: list[float]) -> BenchResult:
+    samples = sorted(s / 1000 for s in samples_ns)
+    return BenchResult(
+        name=name,
+        zones=zones,
+        iterations=len(samples),
+        mean_us=round(statistics.fmean(samples), 3),
+        p50_us=round(samples[len(samples) // 2], 3),
+        p95_us=round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        min_us=round(samples[0], 3),
+    )
+
+
+def bench_sync(name: str, fn: Callable[[], Any], *, zones: int = 1, rounds: int = 200, inner: int = 1) -> BenchResult:
+    """Time *fn*; each sample is the mean of *inner* back-to-back calls."""
+    perf = time.perf_counter_ns
+    for _ in range(min(rounds, 20)):  # warm-up
+        fn()
+    samples: list[float] = []
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            t0 = perf()
+            for _ in range(inner):
+                fn()
+            samples.append((perf() - t0) / inner)
+    finally:
+        gc.enable()
+    return _summarise(name, zones, samples)
+
+
+async def bench_async(
+    name: str, fn: Callable[[], Awaitable[Any]], *, zones: int = 1, rounds: int = 200
+) -> BenchResult:
+    perf = time.perf_counter_ns
+    for _ in range(min(rounds, 10)):
+        await fn()
+    samples: list[float] = []
+    for _ in range(rounds):
+        t0 = perf()
+        await fn()
+        samples.append(perf() - t0)
+    return _summarise(name, zones, samples)
+
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+def seed_zone_states(hass: FakeHass, zone: str, *, t_in: float = 24.0) -> None:
+    entry = fake_entry(zone)
+    hass.states.async_set(entry.data["temp_in"], t_in)
+    hass.states.async_set(entry.data["hum_in"], 55)
+    hass.states.async_set(entry.data["climate_entity"], "off", {"temperature": 24.0})
+    hass.states.async_set(entry.data["trv_entity"], 7)
+    for slug, default in DEFAULTS.items():
+        hass.states.async_set(param_entity_id(zone, slug), default)
+
+
+def build_zone(hass: FakeHass, zone: str) -> tuple[ThermoAdaptCoordinator, ThermoAdaptClimate]:
+    """Wire coordinator + climate entity the way climate.async_setup_entry does."""
+    # flip benches must flip: no cycle limits, no outlier rejection
+    entry = fake_entry(zone, min_run_minutes=0, min_off_minutes=0, input_filter="none")
+    seed_zone_states(hass, zone)
+    if DATA_LIMITER not in hass.data.get(DOMAIN, {}):
+        # hot path only: no stagger delay, no rate limiting
+        async_setup_pacing(hass, PacingConfig(global_rate=0, gateway_rate=0, stagger=0))
+    hass.data.setdefault(DOMAIN, {})[zone] = {"zone": zone, "config": entry.data, "unit": "°C"}
+
+    coordinator = ThermoAdaptCoordinator(hass, entry, _load_params_from_helpers(hass, zone, entry.options))
+    hass.data[DOMAIN][zone]["coordinator"] = coordinator
+    entity = ThermoAdaptClimate(hass, entry, coordinator)
+    entity.entity_id = f"climate.thermoadapt_{zone}"
+
+    def _write_state() -> None:  # state-machine write without the entity platform
+        hass.states.async_set(entity.entity_id, entity.hvac_mode, entity.extra_state_attributes)
+
+    entity.async_write_ha_state = _write_state  # type: ignore[method-assign]
+    coordinator.async_add_listener(entity._handle_coordinator_update)
+    coordinator.async_start()
+    return coordinator, entity
+
+
+# -----------------------------------------------------------------------------
+# Suites
+# -----------------------------------------------------------------------------
+
+async def run_single_zone(rounds: int) -> list[BenchResult]:
+    hass = FakeHass()
+    hass.install_device_services()
+    hass.states.async_set("sensor.outdoor", 30.0)
+    p = ComfortParams()
+    results = [
+        bench_sync("tset_cool", lambda: tset_cool(31.0, p), rounds=rounds, inner=1000),
+        bench_sync("tset_heat", lambda: tset_heat(5.0, p), rounds=rounds, inner=1000),
+    ]
+
+    for method in ("median", "ewma", "kalman"):
+        flt = make_input_filter(method)
+        clock = iter(range(10**9))
+        noisy = [24.0, 24.1, 23.9, 24.2, 24.0, 30.0, 24.1]
+        results.append(
+            bench_sync(f"InputFilter.update[{method}]",
+                       lambda flt=flt, clock=clock: flt.update(noisy[(t := next(clock)) % 7], float(t)),
+                       rounds=rounds, inner=1000)
+        )
+
+    coordinator, entity = build_zone(hass, "bench")
+    await coordinator.async_refresh()
+    results.append(
+        bench_sync("_load_params_from_helpers",
+                   lambda: _load_params_from_helpers(hass, "bench", {}), rounds=rounds, inner=100)
+    )
+    results.append(await bench_async("_async_update_data", coordinator._async_update_data, rounds=rounds))
+    results.append(
+        bench_sync("_handle_coordinator_update[steady]", entity._handle_coordinator_update,
+                   rounds=rounds, inner=100)
+    )
+
+    temps = iter([])
+
+    def _flip() -> None:
+        nonlocal temps
+        try:
+            t_in = next(temps)
+        except StopIteration:
+            temps = iter([30.0, 24.0, 15.0, 24.0] * 50)
+            t_in = next(temps)
+        # new state object (filters tell samples apart by identity), but no event / refresh
+        hass.states._states["sensor.bench_temp"] = FakeState("sensor.bench_temp", str(t_in))
+        entity._handle_coordinator_update()
+
+    results.append(bench_sync("_handle_coordinator_update[flip]", _flip, rounds=rounds))
+    await hass.async_block_till_done()
+
+    # ensure_helpers against an install with thousands of unrelated entities
+    big = FakeHass()
+    for i in range(5000):
+        big.states.async_set(f"sensor.noise_{i}", i)
+    zones = iter(range(10**9))
+    results.append(
+        await bench_async("ensure_helpers", lambda: ensure_helpers(big, f"z{next(zones)}"),
+                          rounds=max(rounds // 10, 5))
+    )
+    batches = iter(range(10**9))
+    results.append(
+        await bench_async(
+            "ensure_helpers_bulk[50 zones]",
+            lambda: ensure_helpers_bulk(big, [f"b{next(batches)}_{i}" for i in range(50)]),
+            zones=50,
+            rounds=max(rounds // 100, 3),
+        )
+    )
+    return results
+
+
+async def run_fanout(zone_counts: list[int], rounds: int) -> list[BenchResult]:
+    """Whole-house tick: one outdoor sample fanned out to N zones."""
+    results: list[BenchResult] = []
+    for n in zone_counts:
+        hass = FakeHass()
+        hass.install_device_services()
+        hass.states.async_set("sensor.outdoor", 30.0)
+        pairs = [build_zone(hass, f"z{i}") for i in range(n)]
+        await pairs[0][0].async_refresh()
+        outdoor = pairs[0][0].outdoor
+        assert outdoor is not None
+
+        samples = iter([])
+
+        def _tick() -> None:
+            nonlocal samples
+            try:
+                t_out = next(samples)
+            except StopIteration:
+                samples = iter([30.0, 30.4, 29.8, 30.1] * 64)
+                t_out = next(samples)
+            outdoor.async_set_updated_data(t_out)
+
+        results.append(bench_sync("tick[fanout]", _tick, zones=n, rounds=max(rounds // max(n // 10, 1), 10)))
+        await hass.async_block_till_done()
+    return results
+
+
+async def run_hub(zone_counts: list[int], rounds: int) -> list[BenchResult]:
+    """Whole-house tick in hub mode: one batched evaluation of N zones."""
+    results: list[BenchResult] = []
+    for n in zone_counts:
+        hass = FakeHass()
+        hass.install_device_services()
+        hass.states.async_set("sensor.outdoor", 30.0)
+        async_setup_hub(hass, max_compressors=max(n // 4, 1))
+        pairs = [build_zone(hass, f"z{i}") for i in range(n)]
+        hub = async_get_hub(hass)
+        assert hub is not None
+        outdoor = pairs[0][0].outdoor
+        assert outdoor is not None
+        await outdoor.async_refresh()
+
+        samples = iter([])
+
+        async def _tick() -> None:
+            nonlocal samples
+            try:
+                t_out = next(samples)
+            except StopIteration:
+                samples = iter([30.0, 30.4, 29.8, 30.1] * 64)
+                t_out = next(samples)
+            outdoor.data = t_out
+            await hub.async_refresh()
+
+        results.append(
+            await bench_async("tick[hub]", _tick, zones=n, rounds=max(rounds // max(n // 10, 1), 10))
+        )
+        await hass.async_block_till_done()
+    return results
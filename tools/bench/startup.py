@@ -0,0 +1,152 @@
+"""Startup cost of the integration: module import time and entry setup.
+
+* ``import[...]`` – wall time of importing the integration package and then
+  each platform in the order Home Assistant forwards them, measured in fresh
+  interpreters.  The Home Assistant modules the core has already loaded by the
+  time a custom integration is imported are preloaded first, so only
+  ThermoAdapt's own cost (and whatever it drags in) is counted.  The config
+  flow is imported last, on its own: no integration module may import it
+  (Home Assistant loads it by itself when it sets up an entry, so it must
+  stay light), and NumPy must not be needed before the first batch tick.
+  Finally a plain zone (no hub, forecast or TRV) is set up and started on
+  ``FakeHass``: the modules of those optional features must still not be
+  loaded – they are imported where a zone turns them on.
+* ``setup_entry`` – ``async_setup_entry`` of N zones (coordinator, forwarding
+  and entity construction for every platform) against ``FakeHass``.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import custom_components.thermoadapt as integration
+from custom_components.thermoadapt.const import DOMAIN
+from custom_components.thermoadapt.params import DEFAULTS, param_entity_id
+
+from .fakehass import FakeHass, fake_entry
+from .micro import BenchResult, _summarise
+
+PACKAGE = "custom_components.thermoadapt"
+PLATFORMS = ("number", "switch", "climate", "sensor")  # as forwarded by __init__
+
+# Loaded by the Home Assistant core (or the entity platforms) before us
+_PRELOAD = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.debounce",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.restore_state",
+    "homeassistant.helpers.selector",
+    "homeassistant.helpers.start",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+    *(f"homeassistant.components.{p}" for p in PLATFORMS),
+)
+
+# Must still be out of sys.modules after the integration and its platforms
+_NOT_AT_STARTUP = (f"{PACKAGE}.config_flow", "numpy")
+# … and after a plain zone has been set up and started
+_NOT_FOR_PLAIN_ZONE = tuple(f"{PACKAGE}.{m}" for m in ("hub", "batch", "forecast", "trv")) + ("numpy",)
+
+_PROBE = """
+import importlib, json, sys, time
+for mod in {preload!r}:
+    importlib.import_module(mod)
+out = {{}}
+for mod in {targets!r}:
+    t0 = time.perf_counter_ns()
+    importlib.import_module(mod)
+    out[mod] = time.perf_counter_ns() - t0
+loaded = [mod for mod in {forbidden!r} if mod in sys.modules]
+t0 = time.perf_counter_ns()
+importlib.import_module({flow!r})
+out[{flow!r}] = time.perf_counter_ns() - t0
+
+import asyncio
+from tools.bench.fakehass import FakeHass, fake_entry
+integration = sys.modules[{package!r}]
+
+async def plain_zone():
+    hass = FakeHass()
+    hass.states.async_set("sensor.outdoor", 30.0)
+    await integration.async_setup(hass, {{}})
+    await integration.async_setup_entry(hass, fake_entry("plain", trv=False))
+    coordinator = hass.data[{domain!r}]["plain"]["coordinator"]
+    await coordinator.async_load_thermal()
+    unsub = coordinator.async_start()
+    await coordinator.async_recompute()
+    assert coordinator.data is not None
+    unsub()
+    await hass.async_block_till_done()
+
+asyncio.run(plain_zone())
+loaded += [mod for mod in {plain_forbidden!r} if mod in sys.modules and mod not in loaded]
+print(json.dumps({{"times": out, "loaded": loaded}}))
+"""
+
+
+def _probe_imports() -> dict:
+    targets = (PACKAGE, *(f"{PACKAGE}.{p}" for p in PLATFORMS))
+    code = _PROBE.format(
+        preload=_PRELOAD,
+        targets=targets,
+        forbidden=_NOT_AT_STARTUP,
+        flow=f"{PACKAGE}.config_flow",
+        package=PACKAGE,
+        domain=DOMAIN,
+        plain_forbidden=_NOT_FOR_PLAIN_ZONE,
+    )
+    root = Path(__file__).resolve().parents[2]
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=root, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def run_imports(runs: int) -> list[BenchResult]:
+    """Import time per module, one fresh interpreter per run."""
+    samples: dict[str, list[float]] = {}
+    for _ in range(runs):
+        probe = _probe_imports()
+        if probe["loaded"]:
+            raise RuntimeError(
+                f"Loaded during startup (imports or plain zone): {', '.join(probe['loaded'])}"
+            )
+        for mod, ns in probe["times"].items():
+            samples.setdefault(mod, []).append(ns)
+    results = []
+    for mod, ns in samples.items():
+        label = "integration" if mod == PACKAGE else mod.rsplit(".", 1)[1]
+        results.append(_summarise(f"import[{label}]", 1, ns))
+    return results
+
+
+async def run_setup_entry(zone_counts: list[int], rounds: int) -> list[BenchResult]:
+    """``async_setup_entry`` of N zones, platforms included (fresh hass per round)."""
+    results: list[BenchResult] = []
+    for n in zone_counts:
+        samples: list[float] = []
+        for _ in range(max(rounds // max(n, 1), 5)):
+            hass = FakeHass()
+            hass.states.async_set("sensor.outdoor", 30.0)
+            entries = [fake_entry(f"z{i}") for i in range(n)]
+            for entry in entries:
+                for slug, default in DEFAULTS.items():
+                    hass.states.async_set(param_entity_id(entry.data["name"], slug), default)
+            await integration.async_setup(hass, {})
+
+            t0 = time.perf_counter_ns()
+            for entry in entries:
+                await integration.async_setup_entry(hass, entry)
+            samples.append(time.perf_counter_ns() - t0)
+
+            assert len(hass.data[DOMAIN]) >= n
+            await hass.async_block_till_done()
+        results.append(_summarise("setup_entry", n, samples))
+    return results
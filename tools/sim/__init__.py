@@ -0,0 +1,17 @@
+"""Headless ThermoAdapt simulator.
+
+Replays recorded ``temp_in`` / ``temp_out`` series through the integration's
+own decision logic, optionally closing the loop with an RC room model, and
+reports mode switches, time outside the comfort band and runtime per mode.
+
+Run from the repository root (Home Assistant must be importable, no running
+instance is needed)::
+
+    python -m tools.sim zone.csv --deadband 0.3,0.5,1.0
+    python -m tools.sim history.csv --temp-in sensor.sala_t --temp-out sensor.ext_t --closed-loop
+"""
+
+from .engine import RoomModel, SimResult, simulate
+from .series import Series, load_csv
+
+__all__ = ["RoomModel", "Series", "SimResult", "load_csv", "simulate"]
@@ -0,0 +1,101 @@
+"""Command line entry point – ``python -m tools.sim``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+from custom_components.thermoadapt.const import (
+    DEF_INPUT_FILTER,
+    DEF_MIN_OFF,
+    DEF_MIN_RUN,
+    INPUT_FILTER_EWMA,
+    INPUT_FILTER_KALMAN,
+    INPUT_FILTER_MEDIAN,
+    INPUT_FILTER_NONE,
+)
+from custom_components.thermoadapt.models import ComfortParams
+
+from .engine import RoomModel, simulate
+from .series import load_csv
+
+
+def _floats(raw: str) -> list[float]:
+    return [float(v) for v in raw.split(",") if v]
+
+
+def _ints(raw: str) -> list[int]:
+    return [int(v) for v in raw.split(",") if v]
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m tools.sim", description=__doc__)
+    ap.add_argument("csv", nargs="+", help="one CSV per zone (wide or HA history export)")
+    ap.add_argument("--temp-in", help="indoor column / entity id")
+    ap.add_argument("--temp-out", help="outdoor column / entity id")
+    ap.add_argument("--hum-in", help="indoor humidity column / entity id (wide default: hum_in)")
+    ap.add_argument("--step", type=float, default=30.0, help="tick length in seconds (30)")
+    ap.add_argument("--deadband", type=_floats, default=[ComfortParams().deadband_cool],
+                    help="comma separated dead-bands to sweep")
+    ap.add_argument("--humid-max", type=_ints, default=[ComfortParams().humid_max],
+                    help="comma separated RH limits (DRY) to sweep")
+    ap.add_argument("--no-trv", action="store_true", help="zone has no TRV (no HEAT mode)")
+    ap.add_argument("--closed-loop", action="store_true", help="drive temp_in from an RC room model")
+    ap.add_argument("--ua", type=float, default=ComfortParams().ua_total, help="UA_total W/K")
+    ap.add_argument("--q-int", type=float, default=ComfortParams().q_int, help="Q_int W")
+    ap.add_argument("--capacitance", type=float, default=RoomModel().capacitance, help="room C in J/K")
+    ap.add_argument("--cool-power", type=float, default=RoomModel().cool_power, help="W")
+    ap.add_argument("--heat-power", type=float, default=RoomModel().heat_power, help="W")
+    ap.add_argument("--dry-power", type=float, default=RoomModel().dry_power, help="W")
+    ap.add_argument("--min-run", type=float, default=DEF_MIN_RUN, help="minimum run time in minutes (5)")
+    ap.add_argument("--min-off", type=float, default=DEF_MIN_OFF, help="minimum off time in minutes (5)")
+    ap.add_argument("--input-filter", default=DEF_INPUT_FILTER,
+                    choices=[INPUT_FILTER_NONE, INPUT_FILTER_MEDIAN, INPUT_FILTER_EWMA, INPUT_FILTER_KALMAN],
+                    help=f"sensor filter, as the input_filter option ({DEF_INPUT_FILTER})")
+    ap.add_argument("--json", action="store_true", help="emit one JSON object per run")
+    args = ap.parse_args(argv)
+
+    base = ComfortParams(ua_total=args.ua, q_int=args.q_int)
+    room = (
+        RoomModel.from_params(
+            base,
+            capacitance=args.capacitance,
+            cool_power=args.cool_power,
+            heat_power=args.heat_power,
+            dry_power=args.dry_power,
+        )
+        if args.closed_loop
+        else None
+    )
+
+    if not args.json:
+        print(f"{'zone':<20} {'db':>5} {'RH max':>6} {'days':>6} {'switches':>9} {'out-band h':>11} "
+              f"{'cool h':>8} {'heat h':>8} {'dry h':>8} {'x realtime':>11}")
+
+    for path in args.csv:
+        series = load_csv(path, step=args.step, temp_in=args.temp_in, temp_out=args.temp_out,
+                          hum_in=args.hum_in)
+        for db, rh in ((db, rh) for db in args.deadband for rh in args.humid_max):
+            params = replace(base, deadband_cool=db, deadband_heat=db, humid_max=rh)
+            started = time.perf_counter()
+            res = simulate(series, params, name=Path(path).stem, has_trv=not args.no_trv, room=room,
+                           min_run=args.min_run * 60, min_off=args.min_off * 60,
+                           input_filter=args.input_filter)
+            speed = res.duration_s / max(time.perf_counter() - started, 1e-9)
+
+            if args.json:
+                print(json.dumps({**res.as_dict(), "x_realtime": round(speed)}))
+                continue
+            print(f"{res.name:<20} {db:>5.2f} {rh:>6.0f} {res.duration_s / 86400:>6.1f} "
+                  f"{res.mode_switches:>9} {res.outside_band_s / 3600:>11.1f} "
+                  f"{res.runtime_s['cool'] / 3600:>8.1f} {res.runtime_s['heat'] / 3600:>8.1f} "
+                  f"{res.runtime_s['dry'] / 3600:>8.1f} {speed:>11,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Simulation engine – replay and closed loop.
+
+Each tick runs the same decisions as the live integration
+(``control.adaptive_setpoint`` in the coordinator, ``control.ModeController``
+in ``ThermoAdaptClimate._handle_coordinator_update``), with the minimum run/off
+times applied on simulated time, the indoor humidity (when the series has
+one) driving DRY and every reading passed through the zone's
+``filters.InputFilter`` first.  In *replay* mode the
+indoor temperature comes from the recorded series; in *closed-loop* mode it
+comes from a first-order RC room model driven by the chosen HVAC mode
+(humidity is always replayed).
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import asdict, dataclass, field
+
+from homeassistant.components.climate import HVACMode
+
+from custom_components.thermoadapt.const import DEF_INPUT_FILTER
+from custom_components.thermoadapt.control import ModeController, adaptive_setpoint
+from custom_components.thermoadapt.filters import make_input_filter
+from custom_components.thermoadapt.models import ComfortParams
+
+from .series import Series
+
+
+@dataclass(slots=True)
+class RoomModel:
+    """Single-node RC room: ``C dT/dt = UA (T_out - T_in) + Q_int + Q_hvac``.
+
+    *ua_total* / *q_int* come from ``ComfortParams``; *capacitance* (J/K) and
+    the HVAC powers (W) are properties of the room and the equipment.
+    """
+
+    ua_total: float = 30.0
+    q_int: float = 200.0
+    capacitance: float = 1.0e6
+    cool_power: float = 2500.0
+    heat_power: float = 1500.0
+    dry_power: float = 800.0  # sensible cooling left while dehumidifying
+
+    @classmethod
+    def from_params(cls, p: ComfortParams, **kwargs: float) -> RoomModel:
+        return cls(ua_total=p.ua_total, q_int=p.q_int, **kwargs)
+
+    def step(self, t_in: float, t_out: float, mode: HVACMode, dt: float) -> float:
+        """Indoor temperature after *dt* seconds (exact exponential step)."""
+        q = self.q_int
+        if mode == HVACMode.COOL:
+            q -= self.cool_power
+        elif mode == HVACMode.DRY:
+            q -= self.dry_power
+        elif mode == HVACMode.HEAT:
+            q += self.heat_power
+        t_eq = t_out + q / self.ua_total
+        return t_eq + (t_in - t_eq) * math.exp(-self.ua_total * dt / self.capacitance)
+
+
+@dataclass(slots=True)
+class SimResult:
+    """Summary of one simulated zone."""
+
+    name: str
+    deadband: float
+    duration_s: float = 0.0
+    ticks: int = 0
+    mode_switches: int = 0
+    suppressed: int = 0  # transitions held back by min run/off times
+    outside_band_s: float = 0.0
+    runtime_s: dict[str, float] = field(default_factory=dict)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def simulate(
+    series: Series,
+    params: ComfortParams,
+    *,
+    name: str = "zone",
+    has_trv: bool = True,
+    room: RoomModel | None = None,
+    t_in0: float | None = None,
+    min_run: float = 0.0,
+    min_off: float = 0.0,
+    input_filter: str = DEF_INPUT_FILTER,
+) -> SimResult:
+    """Run the controller over *series*; closed loop when *room* is given.
+
+    *min_run* / *min_off* are the anti-short-cycling times in seconds;
+    *input_filter* is the ``input_filter`` option (``INPUT_FILTER_*``).  The
+    comfort band is scored on the unfiltered indoor temperature.
+    """
+    res = SimResult(name=name, deadband=params.deadband_cool)
+    runtime = {HVACMode.COOL: 0.0, HVACMode.HEAT: 0.0, HVACMode.DRY: 0.0, HVACMode.OFF: 0.0}
+    band_lo, band_hi = params.deadband_heat, params.deadband_cool
+
+    controller = ModeController(min_run, min_off)
+    mode = HVACMode.OFF
+    sp: float | None = None
+    t_in = t_in0 if t_in0 is not None else next((t for t in series.temp_in if t is not None), None)
+    ts, temps_in, temps_out, hums = series.ts, series.temp_in, series.temp_out, series.hum_in
+    flt_in = make_input_filter(input_filter)
+    flt_out = make_input_filter(input_filter)
+    flt_hum = make_input_filter(input_filter, "hum")
+
+    for i in range(len(ts) - 1):
+        dt = ts[i + 1] - ts[i]
+        # A held sample is the same object tick after tick – like the
+        # unchanged State the coordinator re-reads, it is not a new reading.
+        if room is None:
+            t_in = temps_in[i]
+            seen_in = flt_in.update(t_in, ts[i], t_in)
+        else:
+            seen_in = flt_in.update(t_in, ts[i])
+        t_out = flt_out.update(temps_out[i], ts[i], temps_out[i])
+        hum = flt_hum.update(hums[i], ts[i], hums[i]) if hums else None
+
+        if t_out is not None:  # coordinator keeps the last set-point otherwise
+            sp = adaptive_setpoint(t_out, params)
+        if sp is not None and seen_in is not None:
+            mode = controller.step(ts[i], seen_in, sp, params, hum, has_trv=has_trv)
+        if sp is not None and t_in is not None:
+            if not sp - band_lo <= t_in <= sp + band_hi:
+                res.outside_band_s += dt
+
+        runtime[mode] += dt
+        res.ticks += 1
+        res.duration_s += dt
+
+        if room is not None and t_in is not None and temps_out[i] is not None:
+            t_in = room.step(t_in, temps_out[i], mode, dt)
+
+    stats = controller.stats
+    res.mode_switches = stats.transitions
+    res.suppressed = stats.suppressed_min_run + stats.suppressed_min_off
+    res.runtime_s = {str(m): v for m, v in runtime.items()}
+    return res
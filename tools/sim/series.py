@@ -0,0 +1,110 @@
+"""Input series for the simulator – CSV files and recorder exports.
+
+Two layouts are accepted:
+
+* **wide** – one row per sample with a time column (``timestamp``, ``time``
+  or ``last_changed``) plus ``temp_in`` and ``temp_out`` columns and an
+  optional ``hum_in`` column;
+* **long** – the Home Assistant history export (``entity_id,state,
+  last_changed``); the indoor/outdoor (and humidity) entity ids are given
+  explicitly.
+
+Timestamps may be ISO-8601 or epoch seconds.  Samples are resampled onto a
+fixed tick grid with zero-order hold, like the coordinator sees them.
+"""
+
+from __future__ import annotations
+
+import bisect
+import csv
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+_TIME_COLUMNS = ("timestamp", "time", "last_changed", "last_updated")
+
+
+@dataclass(slots=True)
+class Series:
+    """Samples on a fixed grid (``ts`` in epoch seconds)."""
+
+    ts: list[float]
+    temp_in: list[float | None]
+    temp_out: list[float | None]
+    hum_in: list[float | None] = field(default_factory=list)  # empty – no humidity sensor
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+
+def _parse_time(raw: str) -> float:
+    try:
+        return float(raw)
+    except ValueError:
+        return datetime.fromisoformat(raw.strip()).timestamp()
+
+
+def _parse_value(raw: str | None) -> float | None:
+    try:
+        return float(raw) if raw not in (None, "", "unknown", "unavailable") else None
+    except ValueError:
+        return None
+
+
+def load_csv(
+    path: str | Path,
+    *,
+    step: float = 30.0,
+    temp_in: str | None = None,
+    temp_out: str | None = None,
+    hum_in: str | None = None,
+) -> Series:
+    """Read *path* (wide or long layout) and resample it every *step* seconds."""
+    with open(path, newline="", encoding="utf-8") as fh:
+        reader = csv.DictReader(fh)
+        cols = reader.fieldnames or []
+        time_col = next((c for c in _TIME_COLUMNS if c in cols), None)
+        if time_col is None:
+            raise ValueError(f"{path}: no time column (expected one of {_TIME_COLUMNS})")
+
+        events: dict[str, list[tuple[float, float | None]]] = {"in": [], "out": [], "hum": []}
+        if "entity_id" in cols and "state" in cols:
+            if not (temp_in and temp_out):
+                raise ValueError(f"{path}: long format needs --temp-in and --temp-out entity ids")
+            keys = {temp_in: "in", temp_out: "out"}
+            if hum_in:
+                keys[hum_in] = "hum"
+            for row in reader:
+                if (key := keys.get(row["entity_id"])) is not None:
+                    events[key].append((_parse_time(row[time_col]), _parse_value(row["state"])))
+        else:
+            hum_col = hum_in or "hum_in"
+            has_hum = hum_col in cols
+            for row in reader:
+                ts = _parse_time(row[time_col])
+                events["in"].append((ts, _parse_value(row.get(temp_in or "temp_in"))))
+                events["out"].append((ts, _parse_value(row.get(temp_out or "temp_out"))))
+                if has_hum:
+                    events["hum"].append((ts, _parse_value(row[hum_col])))
+
+    for key in events:
+        events[key].sort(key=lambda ev: ev[0])
+    if not events["in"] or not events["out"]:
+        raise ValueError(f"{path}: no indoor/outdoor samples found")
+
+    start = max(events["in"][0][0], events["out"][0][0])
+    end = min(events["in"][-1][0], events["out"][-1][0])
+    n = int((end - start) // step) + 1
+    grid = [start + i * step for i in range(max(n, 0))]
+    hum = _hold(events["hum"], grid) if events["hum"] else []
+    return Series(grid, _hold(events["in"], grid), _hold(events["out"], grid), hum)
+
+
+def _hold(events: list[tuple[float, float | None]], grid: list[float]) -> list[float | None]:
+    """Zero-order hold of *events* sampled at *grid* (both sorted)."""
+    times = [t for t, _ in events]
+    out: list[float | None] = []
+    for ts in grid:
+        i = bisect.bisect_right(times, ts) - 1
+        out.append(events[i][1] if i >= 0 else None)
+    return out
@@ -0,0 +1,20 @@
+"""In-process scale and soak test for ThermoAdapt.
+
+Sets up N zones through the integration's own ``async_setup_entry`` – real
+``ThermoAdaptCoordinator``, ``ThermoAdaptClimate``, ``ThermoAdaptNumber``,
+``ThermoAdaptSwitch`` and sensor entities – on ``tools.bench.fakehass``,
+feeds them drifting indoor / outdoor readings and fake ``climate`` /
+``number`` services with injected latency, and lets the event loop run for a
+fixed wall time while it records loop lag, memory growth, task counts and
+commands per minute.
+
+Run from the repository root (Home Assistant must be importable, no running
+instance is needed)::
+
+    python -m tools.soak --zones 1,100,2000 --duration 60
+    python -m tools.soak --zones 500 --hub --max-lag-p99 50 --json soak.json
+"""
+
+from .harness import SoakConfig, SoakResult, run_soak
+
+__all__ = ["SoakConfig", "SoakResult", "run_soak"]
@@ -0,0 +1,121 @@
+"""Command line entry point – ``python -m tools.soak``.
+
+Runs one soak per zone count and prints a table.  The run fails (exit code 1)
+when any result crosses a threshold: loop-lag p99, memory growth over the
+measured window, task-count growth or – if given – commands per minute.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import sys
+import time
+from pathlib import Path
+
+from homeassistant.const import __version__ as HA_VERSION
+
+from .harness import SoakConfig, SoakResult, run_soak
+
+
+def _ints(raw: str) -> list[int]:
+    return [int(v) for v in raw.split(",") if v]
+
+
+def check(result: SoakResult, args: argparse.Namespace) -> list[str]:
+    """Return a message per threshold *result* crossed."""
+    failures = []
+    key = f"soak[{result.zones}{',hub' if result.hub else ''}]"
+    if result.lag_p99_ms > args.max_lag_p99:
+        failures.append(f"{key}: loop lag p99 {result.lag_p99_ms:.1f} ms > {args.max_lag_p99} ms")
+    if result.rss_growth_mb > args.max_mem_growth:
+        failures.append(f"{key}: memory grew {result.rss_growth_mb:.1f} MB > {args.max_mem_growth} MB")
+    if result.tasks_end - result.tasks_start > args.max_task_growth:
+        failures.append(
+            f"{key}: tasks {result.tasks_start} → {result.tasks_end} (> +{args.max_task_growth})"
+        )
+    if args.max_commands_per_min is not None and result.commands_per_min > args.max_commands_per_min:
+        failures.append(
+            f"{key}: {result.commands_per_min:.0f} commands/min > {args.max_commands_per_min}"
+        )
+    return failures
+
+
+async def _run(args: argparse.Namespace) -> list[SoakResult]:
+    results = []
+    for n in args.zones:
+        cfg = SoakConfig(
+            zones=n,
+            duration=args.duration,
+            warmup=args.warmup,
+            hub=args.hub,
+            max_compressors=args.max_compressors,
+            latency=args.latency,
+            jitter=args.jitter,
+            global_rate=args.global_rate,
+            feed_interval=args.feed_interval,
+            feed_share=args.feed_share,
+            retune_interval=args.retune_interval,
+            seed=args.seed,
+        )
+        print(f"soak: {n} zone(s){' (hub)' if args.hub else ''}, "
+              f"{args.warmup:g}+{args.duration:g} s …", file=sys.stderr)
+        results.append(await run_soak(cfg))
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m tools.soak", description=__doc__)
+    ap.add_argument("--zones", type=_ints, default=[1, 100, 2000], help="zone counts, one soak each")
+    ap.add_argument("--duration", type=float, default=60.0, help="measured seconds per soak")
+    ap.add_argument("--warmup", type=float, default=10.0, help="seconds before measuring")
+    ap.add_argument("--hub", action="store_true", help="whole-house hub instead of per-zone ticks")
+    ap.add_argument("--max-compressors", type=int, default=0, help="hub compressor cap (0 = none)")
+    ap.add_argument("--latency", type=float, default=0.05, help="fake service latency (s)")
+    ap.add_argument("--jitter", type=float, default=0.05, help="extra random service latency (s)")
+    ap.add_argument("--global-rate", type=float, help="command rate limit (1/s), default as in YAML")
+    ap.add_argument("--feed-interval", type=float, default=1.0, help="s between sensor rounds")
+    ap.add_argument("--feed-share", type=float, default=0.2, help="share of zones reporting per round")
+    ap.add_argument("--retune-interval", type=float, default=15.0, help="s between set_params (0 = off)")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--json", type=Path, help="write results to this file")
+    # thresholds
+    ap.add_argument("--max-lag-p99", type=float, default=50.0, help="loop lag p99 limit (ms)")
+    ap.add_argument("--max-mem-growth", type=float, default=64.0, help="RSS growth limit (MB)")
+    ap.add_argument("--max-task-growth", type=int, default=100, help="task-count growth limit")
+    ap.add_argument("--max-commands-per-min", type=float, help="commands/min limit (off by default)")
+    args = ap.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+    results = asyncio.run(_run(args))
+
+    print(f"{'zones':>6} {'hub':>4} {'setup s':>8} {'lag p50':>8} {'p95':>7} {'p99':>7} {'max ms':>8} "
+          f"{'RSS MB':>7} {'+MB':>6} {'tasks':>11} {'cmd/min':>8} {'writes':>8} {'queue':>6}")
+    for r in results:
+        print(f"{r.zones:>6} {'yes' if r.hub else 'no':>4} {r.setup_s:>8.2f} {r.lag_p50_ms:>8.2f} {r.lag_p95_ms:>7.2f} "
+              f"{r.lag_p99_ms:>7.2f} {r.lag_max_ms:>8.2f} {r.rss_end_mb:>7.1f} {r.rss_growth_mb:>6.1f} "
+              f"{f'{r.tasks_start}/{r.tasks_max}/{r.tasks_end}':>11} {r.commands_per_min:>8.1f} "
+              f"{r.state_writes:>8} {r.limiter_depth:>6}")
+
+    if args.json:
+        args.json.write_text(json.dumps({
+            "meta": {
+                "python": platform.python_version(),
+                "homeassistant": HA_VERSION,
+                "machine": platform.machine(),
+                "timestamp": int(time.time()),
+            },
+            "results": [r.as_dict() for r in results],
+        }, indent=2))
+
+    failures = [msg for r in results for msg in check(r, args)]
+    for msg in failures:
+        print(f"REGRESSION {msg}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
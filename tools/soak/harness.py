@@ -0,0 +1,341 @@
+"""Soak run: N real zones on ``FakeHass`` with drifting sensors, fixed wall time."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import math
+import os
+import random
+import resource
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from homeassistant.components.climate import ClimateEntity
+from homeassistant.components.number import NumberEntity
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.switch import SwitchEntity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+import custom_components.thermoadapt as integration
+from custom_components.thermoadapt.climate import ThermoAdaptClimate
+from custom_components.thermoadapt.const import (
+    CONF_GLOBAL_RATE,
+    CONF_HUB,
+    CONF_MAX_COMPRESSORS,
+    CONF_RATE_LIMIT,
+    DOMAIN,
+)
+from custom_components.thermoadapt.hub import async_get_hub
+from custom_components.thermoadapt.pacing import async_get_rate_limiter
+from custom_components.thermoadapt.params import PARAMS
+
+from tools.bench.fakehass import FakeHass, fake_entry
+
+OUTDOOR = "sensor.outdoor"
+
+# Entity class -> domain of its entity id (first match wins)
+_DOMAINS: tuple[tuple[type, str], ...] = (
+    (ClimateEntity, "climate"),
+    (NumberEntity, "number"),
+    (SwitchEntity, "switch"),
+    (SensorEntity, "sensor"),
+)
+
+
+@dataclass(slots=True)
+class SoakConfig:
+    zones: int
+    duration: float = 60.0        # measured wall seconds (after the warm-up)
+    warmup: float = 10.0          # setup settles, stagger window passes
+    hub: bool = False
+    max_compressors: int = 0
+    latency: float = 0.05         # s per fake service call…
+    jitter: float = 0.05          # …plus up to this much
+    global_rate: float | None = None  # commands/s; None – integration default
+    feed_interval: float = 1.0    # s between sensor feed rounds
+    feed_share: float = 0.2       # share of zones whose sensors report per round
+    day_seconds: float = 600.0    # one synthetic outdoor day in wall seconds
+    retune_interval: float = 15.0  # s between set_params / switch activity (0 – off)
+    lag_interval: float = 0.05    # loop-lag probe period (s)
+    seed: int = 1
+
+
+@dataclass(slots=True)
+class SoakResult:
+    zones: int
+    hub: bool
+    setup_s: float
+    seconds: float
+    lag_p50_ms: float
+    lag_p95_ms: float
+    lag_p99_ms: float
+    lag_max_ms: float
+    rss_start_mb: float
+    rss_end_mb: float
+    rss_growth_mb: float
+    tasks_start: int
+    tasks_max: int
+    tasks_end: int
+    commands: int
+    commands_per_min: float
+    state_writes: int
+    sensor_updates: int
+    limiter_depth: int
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+# -----------------------------------------------------------------------------
+# Process probes
+# -----------------------------------------------------------------------------
+
+def _rss_mb() -> float:
+    """Resident set size now (Linux), else the peak from getrusage."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as fh:
+            pages = int(fh.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+async def _probe_lag(interval: float, out: list[float]) -> None:
+    """How late the loop wakes a sleeper (seconds), one sample per *interval*."""
+    loop = asyncio.get_running_loop()
+    while True:
+        t0 = loop.time()
+        await asyncio.sleep(interval)
+        out.append(max(loop.time() - t0 - interval, 0.0))
+
+
+async def _probe_tasks(peak: list[int]) -> None:
+    while True:
+        peak[0] = max(peak[0], len(asyncio.all_tasks()))
+        await asyncio.sleep(0.5)
+
+
+# -----------------------------------------------------------------------------
+# Zones – real entities, state writes to the fake state machine
+# -----------------------------------------------------------------------------
+
+def _write_state(hass: FakeHass, entity: Any) -> None:
+    attrs = dict(entity.state_attributes or {})
+    attrs.update(entity.extra_state_attributes or {})
+    hass.states.async_set(entity.entity_id, entity.state, attrs)
+
+
+async def _attach(hass: FakeHass, entity: Any, unsubs: list) -> None:
+    """What the entity platform does on add, minus registries and restore."""
+    entity.hass = hass
+    if entity.entity_id is None:
+        domain = next(d for cls, d in _DOMAINS if isinstance(entity, cls))
+        entity.entity_id = f"{domain}.{entity.unique_id}"
+    entity.async_write_ha_state = lambda: _write_state(hass, entity)
+    if isinstance(entity, ThermoAdaptClimate):
+        entity.async_on_remove = unsubs.append  # zone start-up registers here
+        unsubs.append(entity.coordinator.async_add_listener(entity._handle_coordinator_update))
+    elif isinstance(entity, CoordinatorEntity):
+        unsubs.append(entity.coordinator.async_add_listener(entity._handle_coordinator_update))
+    entity.async_write_ha_state()
+
+
+class _Room:
+    """Drifting indoor temperature / humidity of one zone (0.1 °C / 1 % sensors)."""
+
+    __slots__ = ("t_in", "hum", "temp_eid", "hum_eid", "ac_eid", "trv_eid")
+
+    def __init__(self, data: dict[str, str], rng: random.Random) -> None:
+        self.t_in = rng.uniform(21.0, 29.0)
+        self.hum = rng.uniform(45.0, 70.0)
+        self.temp_eid = data["temp_in"]
+        self.hum_eid = data["hum_in"]
+        self.ac_eid = data["climate_entity"]
+        self.trv_eid = data["trv_entity"]
+
+    def step(self, hass: FakeHass, t_out: float, dt: float, rng: random.Random) -> int:
+        ac = hass.states.get(self.ac_eid)
+        trv = hass.states.get(self.trv_eid)
+        drift = 0.02 * (t_out - self.t_in)
+        if ac is not None and ac.state in ("cool", "dry"):
+            drift -= 0.3
+            self.hum -= 0.5
+        if trv is not None and float(trv.state) > 7:
+            drift += 0.25
+        self.t_in += (drift + rng.gauss(0.0, 0.05)) * dt
+        self.hum = min(max(self.hum + rng.gauss(0.1, 0.5) * dt, 30.0), 90.0)
+        return _report(hass, self.temp_eid, round(self.t_in, 1)) + _report(
+            hass, self.hum_eid, round(self.hum)
+        )
+
+
+def _report(hass: FakeHass, entity_id: str, value: float) -> int:
+    """Write like a real sensor: only when the reported value changed."""
+    st = hass.states.get(entity_id)
+    if st is not None and st.state == str(value):
+        return 0
+    hass.states.async_set(entity_id, value)
+    return 1
+
+
+def _outdoor(cfg: SoakConfig, elapsed: float) -> float:
+    return round(27.0 + 6.0 * math.sin(2 * math.pi * elapsed / cfg.day_seconds), 1)
+
+
+async def _setup(cfg: SoakConfig) -> tuple[FakeHass, list[_Room], list]:
+    hass = FakeHass(service_latency=cfg.latency, service_jitter=cfg.jitter)
+    hass.install_device_services()
+    hass.states.async_set(OUTDOOR, _outdoor(cfg, 0.0))
+
+    domain_cfg: dict[str, Any] = {}
+    if cfg.global_rate is not None:
+        domain_cfg[CONF_RATE_LIMIT] = integration.RATE_LIMIT_SCHEMA({CONF_GLOBAL_RATE: cfg.global_rate})
+    if cfg.hub:
+        domain_cfg[CONF_HUB] = {CONF_MAX_COMPRESSORS: cfg.max_compressors}
+    await integration.async_setup(hass, {DOMAIN: domain_cfg})
+
+    rng = random.Random(cfg.seed)
+    rooms: list[_Room] = []
+    unsubs: list = []
+    collected = hass.config_entries.entities
+    for i in range(cfg.zones):
+        entry = fake_entry(f"z{i}", outdoor=OUTDOOR)
+        room = _Room(entry.data, rng)
+        rooms.append(room)
+        room.step(hass, _outdoor(cfg, 0.0), 0.0, rng)
+        hass.states.async_set(entry.data["climate_entity"], "off", {"temperature": 24.0})
+        hass.states.async_set(entry.data["trv_entity"], 7)
+
+        first = len(collected)
+        await integration.async_setup_entry(hass, entry)
+        for entity in collected[first:]:
+            await _attach(hass, entity, unsubs)
+
+    # what async_at_started does for every climate entity
+    for entity in collected:
+        if isinstance(entity, ThermoAdaptClimate):
+            await entity._async_first_refresh()
+    return hass, rooms, unsubs
+
+
+# -----------------------------------------------------------------------------
+# Load
+# -----------------------------------------------------------------------------
+
+async def _feed(cfg: SoakConfig, hass: FakeHass, rooms: list[_Room], counter: list[int]) -> None:
+    """Outdoor sine plus a random share of rooms reporting every round."""
+    rng = random.Random(cfg.seed + 1)
+    start = time.monotonic()
+    per_round = max(1, round(len(rooms) * cfg.feed_share))
+    while True:
+        await asyncio.sleep(cfg.feed_interval)
+        t_out = _outdoor(cfg, time.monotonic() - start)
+        counter[0] += _report(hass, OUTDOOR, t_out)
+        for room in rng.sample(rooms, min(per_round, len(rooms))):
+            counter[0] += room.step(hass, t_out, cfg.feed_interval, rng)
+
+
+async def _retune(cfg: SoakConfig, hass: FakeHass) -> None:
+    """Now and then a user retunes a zone and flips an enable switch."""
+    rng = random.Random(cfg.seed + 2)
+    while True:
+        await asyncio.sleep(cfg.retune_interval)
+        zone = f"z{rng.randrange(cfg.zones)}"
+        data = hass.data[DOMAIN][zone]
+        spec = PARAMS["deadband"]
+        data["coordinator"].async_set_params(
+            {"deadband": round(rng.uniform(0.3, 1.0) / spec.step) * spec.step}
+        )
+        switch = next(
+            e for e in hass.config_entries.entities
+            if isinstance(e, SwitchEntity) and e.unique_id == f"thermoadapt_{zone}_enabled"
+        )
+        await (switch.async_turn_off() if switch.is_on else switch.async_turn_on())
+
+
+async def run_soak(cfg: SoakConfig) -> SoakResult:
+    """Set up *cfg.zones* zones, warm up, then measure for *cfg.duration* s."""
+    t_setup = time.monotonic()
+    hass, rooms, unsubs = await _setup(cfg)
+    setup_s = time.monotonic() - t_setup
+    lags: list[float] = []
+    peak = [0]
+    updates = [0]
+    tasks = [
+        asyncio.create_task(_probe_lag(cfg.lag_interval, lags), name="soak lag"),
+        asyncio.create_task(_feed(cfg, hass, rooms, updates), name="soak feed"),
+    ]
+    if cfg.retune_interval > 0:
+        tasks.append(asyncio.create_task(_retune(cfg, hass), name="soak retune"))
+
+    await asyncio.sleep(cfg.warmup)
+    gc.collect()
+    rss0 = _rss_mb()
+    tasks0 = len(asyncio.all_tasks())
+    calls0 = _commands(hass)
+    writes0 = hass.states.writes
+    updates[0] = 0
+    lags.clear()
+    peak[0] = tasks0
+    tasks.append(asyncio.create_task(_probe_tasks(peak), name="soak tasks"))
+
+    t0 = time.monotonic()
+    await asyncio.sleep(cfg.duration)
+    seconds = time.monotonic() - t0
+    commands = _commands(hass) - calls0
+    writes = hass.states.writes - writes0
+    tasks_end = len(asyncio.all_tasks())
+    depth = async_get_rate_limiter(hass).depth
+    gc.collect()
+    rss1 = _rss_mb()
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await _teardown(hass, unsubs)
+
+    lags.sort()
+    return SoakResult(
+        zones=cfg.zones,
+        hub=cfg.hub,
+        setup_s=round(setup_s, 2),
+        seconds=round(seconds, 1),
+        lag_p50_ms=round(_percentile(lags, 0.50) * 1000, 2),
+        lag_p95_ms=round(_percentile(lags, 0.95) * 1000, 2),
+        lag_p99_ms=round(_percentile(lags, 0.99) * 1000, 2),
+        lag_max_ms=round((lags[-1] if lags else 0.0) * 1000, 2),
+        rss_start_mb=round(rss0, 1),
+        rss_end_mb=round(rss1, 1),
+        rss_growth_mb=round(rss1 - rss0, 1),
+        tasks_start=tasks0,
+        tasks_max=peak[0],
+        tasks_end=tasks_end,
+        commands=commands,
+        commands_per_min=round(commands / seconds * 60, 1),
+        state_writes=writes,
+        sensor_updates=updates[0],
+        limiter_depth=depth,
+    )
+
+
+def _commands(hass: FakeHass) -> int:
+    return sum(n for key, n in hass.services.calls.items() if key.startswith(("climate.", "number.")))
+
+
+async def _teardown(hass: FakeHass, unsubs: list) -> None:
+    for unsub in unsubs:
+        unsub()
+    if (hub := async_get_hub(hass)) is not None:
+        await hub.async_shutdown()
+    async_get_rate_limiter(hass).async_shutdown()
+    for task in list(hass._tasks):
+        task.cancel()
+    await asyncio.gather(*list(hass._tasks), return_exceptions=True)
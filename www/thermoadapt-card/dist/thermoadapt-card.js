@@ -36,66 +36,538 @@ const at={attribute:!0,type:String,converter:g,reflect:!1,hasChanged:v},ht=(t=at
  * @license
  * Copyright 2017 Google LLC
  * SPDX-License-Identifier: BSD-3-Clause
- */function ct(t){return lt({...t,state:!0,attribute:!1})}var dt,pt;!function(t){t.language="language",t.system="system",t.comma_decimal="comma_decimal",t.decimal_comma="decimal_comma",t.space_comma="space_comma",t.none="none"}(dt||(dt={})),function(t){t.language="language",t.system="system",t.am_pm="12",t.twenty_four="24"}(pt||(pt={}));let ut=class extends rt{constructor(){super(...arguments),this._enabled=!1,this._adaptive=!1}setConfig(t){if(!t.zone||!t.temp_in||!t.temp_out)throw new Error("ThermoAdapt-card: zone, temp_in and temp_out are required");this._config={title:`ThermoAdapt – ${t.zone.charAt(0).toUpperCase()+t.zone.slice(1)}`,...t}}getCardSize(){return 6}shouldUpdate(t){return function(t,e,s){if(e.has("config")||s)return!0;if(t.config.entity){var i=e.get("hass");return!i||i.states[t.config.entity]!==t.hass.states[t.config.entity]}return!1}(this,t,!0)}_state(t){var e,s;return null!==(s=null===(e=this.hass.states[t])||void 0===e?void 0:e.state)&&void 0!==s?s:"unavailable"}_number(t){const e=this._state(t),s=Number(e);return isNaN(s)?null:s}willUpdate(){const t=this._config.zone;this._enabled="on"===this._state(`switch.thermoadapt_${t}_enabled`),this._adaptive="on"===this._state(`input_boolean.thermoadapt_${t}_dinamico`)}render(){if(!this.hass)return I``;const t=this._config.zone,e=e=>`number.thermoadapt_${t}_${e}`,s=this._number(this._config.temp_in),i=this._number(this._config.temp_out),n=this._config.hum_in?this._number(this._config.hum_in):null,r=this._config.hum_out?this._number(this._config.hum_out):null,o=this._number(e("temp_min")),a=this._number(e("temp_max")),h=this._number(e("setpoint")),l=this._number(e("deadband")),c=this._number(e("humid_max"));return I`
+ */function ct(t){return lt({...t,state:!0,attribute:!1})}const __decorate=t,LitElement=rt,html=I,svg=(t=>(e,...s)=>({_$litType$:t,strings:e,values:s}))(2),css=(t,...e)=>{const s=1===t.length?t[0]:e.reduce(((e,s,i)=>e+(t=>{if(!0===t._$cssResult$)return t.cssText;if("number"==typeof t)return t;throw Error("Value passed to 'css' function must be a 'css' function result: "+t+". Use 'unsafeCSS' to pass non-literal values, but take care to ensure page security.")})(s)+t[i+1]),t[0]);return new r(s,t,i)},property=lt,state=ct,customElement=t=>(e,s)=>{void 0!==s?s.addInitializer((()=>{customElements.define(t,e)})):customElements.define(t,e)};
+const BUCKETS_PER_POINT = 2;
+const MODE_CAPACITY = 256;
+class BucketRing {
+    constructor(size, width){
+        this.size = size;
+        this.width = width;
+        this._index = new Float64Array(size).fill(NaN);
+        this._sum = new Float64Array(size);
+        this._count = new Uint32Array(size);
+    }
+    push(t, v) {
+        const idx = Math.floor(t / this.width);
+        const slot = idx % this.size;
+        const cur = this._index[slot];
+        if (cur === idx) {
+            this._sum[slot] += v;
+            this._count[slot] += 1;
+            return true;
+        }
+        if (!isNaN(cur) && cur > idx) return false;
+        this._index[slot] = idx;
+        this._sum[slot] = v;
+        this._count[slot] = 1;
+        return true;
+    }
+    points(now) {
+        const last = Math.floor(now / this.width);
+        const out = [];
+        for(let idx = last - this.size + 1; idx <= last; idx++){
+            const slot = (idx % this.size + this.size) % this.size;
+            if (this._index[slot] === idx) {
+                out.push({
+                    t: (idx + 0.5) * this.width,
+                    v: this._sum[slot] / this._count[slot]
+                });
+            }
+        }
+        return out;
+    }
+}
+class ChangeRing {
+    constructor(capacity){
+        this.capacity = capacity;
+        this._head = 0;
+        this._len = 0;
+        this._t = new Float64Array(capacity);
+        this._mode = new Array(capacity);
+    }
+    push(t, mode) {
+        if (this._len) {
+            const prev = (this._head - 1 + this.capacity) % this.capacity;
+            if (this._mode[prev] === mode || t < this._t[prev]) return false;
+        }
+        this._t[this._head] = t;
+        this._mode[this._head] = mode;
+        this._head = (this._head + 1) % this.capacity;
+        this._len = Math.min(this._len + 1, this.capacity);
+        return true;
+    }
+    spans(since) {
+        const out = [];
+        const start = (this._head - this._len + this.capacity) % this.capacity;
+        for(let i = 0; i < this._len; i++){
+            const k = (start + i) % this.capacity;
+            const t = this._t[k];
+            if (t < since) {
+                out.length = 0;
+                out.push({
+                    t: since,
+                    mode: this._mode[k]
+                });
+            } else {
+                out.push({
+                    t,
+                    mode: this._mode[k]
+                });
+            }
+        }
+        return out;
+    }
+}
+function lttb(data, threshold) {
+    const n = data.length;
+    if (threshold >= n || threshold < 3) return data;
+    const out = [
+        data[0]
+    ];
+    const every = (n - 2) / (threshold - 2);
+    let a = 0;
+    for(let i = 0; i < threshold - 2; i++){
+        const nextStart = Math.floor((i + 1) * every) + 1;
+        const nextEnd = Math.min(Math.floor((i + 2) * every) + 1, n);
+        let avgT = 0;
+        let avgV = 0;
+        for(let j = nextStart; j < nextEnd; j++){
+            avgT += data[j].t;
+            avgV += data[j].v;
+        }
+        const span = Math.max(nextEnd - nextStart, 1);
+        avgT /= span;
+        avgV /= span;
+        const start = Math.floor(i * every) + 1;
+        const end = Math.floor((i + 1) * every) + 1;
+        const pa = data[a];
+        let maxArea = -1;
+        let pick = start;
+        for(let j = start; j < end; j++){
+            const area = Math.abs((pa.t - avgT) * (data[j].v - pa.v) - (pa.t - data[j].t) * (avgV - pa.v));
+            if (area > maxArea) {
+                maxArea = area;
+                pick = j;
+            }
+        }
+        out.push(data[pick]);
+        a = pick;
+    }
+    out.push(data[n - 1]);
+    return out;
+}
+class HistoryFeed {
+    constructor(entityId, windowMs, points){
+        this.entityId = entityId;
+        this.windowMs = windowMs;
+        this.modes = new ChangeRing(MODE_CAPACITY);
+        this.version = 0;
+        this._users = new Set();
+        this._lastTs = 0;
+        const size = points * BUCKETS_PER_POINT;
+        this.values = new BucketRing(size, windowMs / size);
+        this.setpoint = new BucketRing(size, windowMs / size);
+    }
+    attach(hass, onChange) {
+        this._users.add(onChange);
+        if (this._unsub) return;
+        const since = Math.max(Date.now() - this.windowMs, this._lastTs);
+        const withAttributes = this.entityId.startsWith("climate.");
+        this._unsub = hass.connection.subscribeMessage((msg)=>this._ingest(msg), {
+            type: "history/stream",
+            entity_ids: [
+                this.entityId
+            ],
+            start_time: new Date(since).toISOString(),
+            minimal_response: !withAttributes,
+            no_attributes: !withAttributes,
+            significant_changes_only: false
+        });
+        this._unsub.catch(()=>{
+            this._unsub = undefined;
+        });
+    }
+    detach(onChange) {
+        this._users.delete(onChange);
+        if (this._users.size || !this._unsub) return;
+        const unsub = this._unsub;
+        this._unsub = undefined;
+        unsub.then((fn)=>fn()).catch(()=>undefined);
+    }
+    _ingest(msg) {
+        const rows = msg.states?.[this.entityId];
+        if (!rows?.length) return;
+        let changed = false;
+        for (const row of rows){
+            const t = (row.lc ?? row.lu) * 1000;
+            if (t <= this._lastTs) continue;
+            this._lastTs = t;
+            const v = Number(row.s);
+            if (row.s !== "" && !isNaN(v)) changed = this.values.push(t, v) || changed;
+            else if (row.s !== "unavailable" && row.s !== "unknown") {
+                changed = this.modes.push(t, row.s) || changed;
+            }
+            const sp = row.a?.temperature;
+            if (typeof sp === "number") changed = this.setpoint.push(t, sp) || changed;
+        }
+        if (!changed) return;
+        this.version++;
+        this._users.forEach((cb)=>cb());
+    }
+}
+const FEEDS = new Map();
+function historyFeed(entityId, hours, points) {
+    const key = `${entityId}|${hours}|${points}`;
+    let feed = FEEDS.get(key);
+    if (!feed) {
+        feed = new HistoryFeed(entityId, hours * 3600 * 1000, points);
+        FEEDS.set(key, feed);
+    }
+    return feed;
+}
+
+const UNPUBLISHED_SLIDERS = [
+    "temp_max"
+];
+const WRITE_DEBOUNCE_MS = 500;
+const DEFAULT_HISTORY_POINTS = 120;
+const SPARK_W = 1000;
+const SPARK_H = 60;
+const MODE_BAND_H = 6;
+const MODE_COLORS = {
+    cool: "var(--state-climate-cool-color, #2b9af9)",
+    heat: "var(--state-climate-heat-color, #ff8100)",
+    dry: "var(--state-climate-dry-color, #efbd07)"
+};
+let ThermoAdaptCard = class ThermoAdaptCard extends LitElement {
+    constructor(){
+        super(...arguments);
+        this._pending = {};
+        this._sent = {};
+        this._historyVersion = 0;
+        this._attached = false;
+        this._visible = false;
+        this._onHistory = ()=>{
+            this._historyVersion++;
+        };
+    }
+    setConfig(config) {
+        if (!config.zone || !config.temp_in || !config.temp_out) {
+            throw new Error("ThermoAdapt-card: zone, temp_in and temp_out are required");
+        }
+        this._config = {
+            title: `ThermoAdapt – ${config.zone.charAt(0).toUpperCase() + config.zone.slice(1)}`,
+            ...config
+        };
+        this._watched = this._computeWatched(this._config);
+        this._detachFeeds();
+        this._spark = undefined;
+        const hours = this._config.history_hours ?? 0;
+        const points = this._config.history_points ?? DEFAULT_HISTORY_POINTS;
+        this._feeds = hours > 0 ? {
+            tIn: historyFeed(this._config.temp_in, hours, points),
+            tOut: historyFeed(this._config.temp_out, hours, points),
+            climate: historyFeed(this._watched.climate, hours, points)
+        } : undefined;
+        this._syncFeeds();
+    }
+    getCardSize() {
+        return this._feeds ? 8 : 6;
+    }
+    connectedCallback() {
+        super.connectedCallback();
+        this._observer = new IntersectionObserver((entries)=>{
+            this._visible = entries.some((e)=>e.isIntersecting);
+            this._syncFeeds();
+        });
+        this._observer.observe(this);
+    }
+    disconnectedCallback() {
+        super.disconnectedCallback();
+        this._flushWrites();
+        this._observer?.disconnect();
+        this._observer = undefined;
+        this._visible = false;
+        this._syncFeeds();
+    }
+    _computeWatched(config) {
+        const z = config.zone;
+        const number = (slug)=>`number.thermoadapt_${z}_${slug}`;
+        const watched = {
+            climate: `climate.thermoadapt_${z}`,
+            enabled: `switch.thermoadapt_${z}_enabled`,
+            adaptive: `input_boolean.thermoadapt_${z}_dinamico`,
+            number
+        };
+        const primary = [
+            watched.climate,
+            watched.enabled,
+            watched.adaptive,
+            ...config.hum_out ? [
+                config.hum_out
+            ] : [],
+            ...UNPUBLISHED_SLIDERS.map(number)
+        ];
+        const fallback = [
+            config.temp_in,
+            config.temp_out,
+            ...config.hum_in ? [
+                config.hum_in
+            ] : []
+        ];
+        return {
+            ...watched,
+            primary,
+            fallback
+        };
+    }
+    shouldUpdate(changedProps) {
+        if (!this._config) return false;
+        if (changedProps.has("_config") || changedProps.has("_pending")) return true;
+        if (changedProps.has("_historyVersion")) return true;
+        const oldHass = changedProps.get("hass");
+        if (!oldHass) return changedProps.has("hass");
+        if (oldHass.themes !== this.hass.themes || oldHass.locale !== this.hass.locale) return true;
+        const oldStates = oldHass.states;
+        const newStates = this.hass.states;
+        const changed = (eid)=>oldStates[eid] !== newStates[eid];
+        const w = this._watched;
+        return w.primary.some(changed) || !this._zone() && w.fallback.some(changed);
+    }
+    willUpdate(changedProps) {
+        const oldHass = changedProps.get("hass");
+        const climate = this._watched.climate;
+        if (oldHass && oldHass.states[climate] !== this.hass.states[climate]) {
+            this._sent = {};
+        }
+    }
+    updated(changedProps) {
+        if (changedProps.has("hass") && !changedProps.get("hass")) this._syncFeeds();
+    }
+    _syncFeeds() {
+        const want = !!this._feeds && this._visible && !!this.hass;
+        if (want === this._attached) return;
+        if (want) {
+            for (const feed of Object.values(this._feeds))feed.attach(this.hass, this._onHistory);
+            this._attached = true;
+        } else {
+            this._detachFeeds();
+        }
+    }
+    _detachFeeds() {
+        if (!this._attached || !this._feeds) return;
+        for (const feed of Object.values(this._feeds))feed.detach(this._onHistory);
+        this._attached = false;
+    }
+    _state(id) {
+        return this.hass.states[id]?.state ?? "unavailable";
+    }
+    _number(id) {
+        const s = this._state(id);
+        const v = Number(s);
+        return !isNaN(v) ? v : null;
+    }
+    _zone() {
+        const st = this.hass.states[this._watched.climate];
+        return st && st.state !== "unavailable" ? st.attributes : null;
+    }
+    _param(zone, slug) {
+        const eid = this._watched.number(slug);
+        if (eid in this._pending) return this._pending[eid];
+        if (eid in this._sent) return this._sent[eid];
+        const v = zone?.params?.[slug];
+        return v !== undefined && v !== null ? v : this._number(eid);
+    }
+    render() {
+        if (!this.hass || !this._config) return html``;
+        const w = this._watched;
+        const zone = this._zone();
+        const enabled = this._state(w.enabled) === "on";
+        const adaptive = this._state(w.adaptive) === "on";
+        const tIn = zone ? zone.current_temperature ?? null : this._number(this._config.temp_in);
+        const tOut = zone ? zone.outdoor_temperature ?? null : this._number(this._config.temp_out);
+        const hIn = !this._config.hum_in ? null : zone ? zone.current_humidity ?? null : this._number(this._config.hum_in);
+        const hOut = this._config.hum_out ? this._number(this._config.hum_out) : null;
+        const p = (slug)=>this._param(zone, slug);
+        return html`
       <ha-card .header=${this._config.title}>
         <!-- ─── Enable / Adaptive toggles ──────────────────────────── -->
         <div class="row toggles">
           <ha-switch
             aria-label="Enable"
-            .checked=${this._enabled}
-            @click=${()=>this._toggle(`switch.thermoadapt_${t}_enabled`)}
+            .checked=${enabled}
+            @click=${()=>this._toggle(w.enabled)}
           ></ha-switch>
           <span>Controle</span>
 
           <ha-switch
             aria-label="Adaptive"
-            .checked=${this._adaptive}
-            @click=${()=>this._toggle(`input_boolean.thermoadapt_${t}_dinamico`)}
+            .checked=${adaptive}
+            @click=${()=>this._toggle(w.adaptive)}
           ></ha-switch>
           <span>Algoritmo</span>
         </div>
 
         <!-- ─── Parameter section (changes by mode) ────────────────── -->
-        ${this._adaptive?I`
+        ${adaptive ? html`
               <div class="row sliders">
-                ${this._slider(e("setpoint"),"Set-point Base",h,18,30,.1)}
-                ${this._slider(e("deadband"),"Dead-band",l,0,5,.1)}
-                ${this._slider(e("humid_max"),"UR Máx",c,40,80,1)}
+                ${this._slider("setpoint", "Set-point Base", p("setpoint"), 18, 30, 0.1)}
+                ${this._slider("deadband", "Dead-band", p("deadband"), 0, 5, 0.1)}
+                ${this._slider("deadband_heat", "Dead-band Aquec.", p("deadband_heat"), 0, 5, 0.1)}
+                ${this._slider("humid_max", "UR Máx", p("humid_max"), 40, 80, 1)}
               </div>
-            `:I`
+            ` : html`
               <div class="row sliders">
-                ${this._slider(e("temp_min"),"Temp Min",o,16,30,.5)}
-                ${this._slider(e("temp_max"),"Temp Máx",a,20,40,.5)}
-                ${this._slider(e("setpoint"),"Alvo",h,18,30,.1)}
+                ${this._slider("temp_min", "Temp Min", p("temp_min"), 16, 30, 0.5)}
+                ${this._slider("temp_max", "Temp Máx", p("temp_max"), 20, 40, 0.5)}
+                ${this._slider("setpoint", "Alvo", p("setpoint"), 18, 30, 0.1)}
               </div>
             `}
 
         <!-- ─── Live sensors ────────────────────────────────────────── -->
         <div class="row sensors">
-          ${this._tile("Temp Interna",s,"°C")}
-          ${this._tile("Temp Externa",i,"°C")}
-          ${null!==n?this._tile("UR Interna",n,"%"):""}
-          ${null!==r?this._tile("UR Externa",r,"%"):""}
+          ${this._tile("Temp Interna", tIn, "°C")}
+          ${this._tile("Temp Externa", tOut, "°C")}
+          ${hIn !== null ? this._tile("UR Interna", hIn, "%") : ""}
+          ${hOut !== null ? this._tile("UR Externa", hOut, "%") : ""}
         </div>
+
+        ${this._feeds ? this._sparkline(this._feeds) : ""}
       </ha-card>
-    `}_slider(t,e,s,i,n,r){return null===s?I``:I`
+    `;
+    }
+    _slider(slug, label, value, min, max, step) {
+        if (value === null) return html``;
+        const eid = this._watched.number(slug);
+        return html`
       <div class="slider-block">
-        <span class="lbl">${e}</span>
+        <span class="lbl">${label}</span>
         <ha-slider
-          .min=${i}
-          .max=${n}
-          .step=${r}
-          .value=${s}
-          @change=${e=>this.hass.callService("input_number","set_value",{entity_id:t,value:e.target.value})}
+          .min=${min}
+          .max=${max}
+          .step=${step}
+          .value=${value}
+          @change=${(ev)=>this._queueWrite(eid, Number(ev.target.value))}
         ></ha-slider>
-        <span class="val">${s}</span>
+        <span class="val">${value}</span>
       </div>
-    `}_tile(t,e,s){return I`
+    `;
+    }
+    _tile(label, val, unit) {
+        return html`
       <div class="tile">
-        <span class="tile-label">${t}</span>
-        <span class="tile-val">${null!==e?e.toFixed(1):"–"} ${s}</span>
+        <span class="tile-label">${label}</span>
+        <span class="tile-val">${val !== null ? val.toFixed(1) : "–"} ${unit}</span>
+      </div>
+    `;
+    }
+    _sparkline(feeds) {
+        const now = Date.now();
+        const win = feeds.climate.windowMs;
+        const key = [
+            feeds.tIn.version,
+            feeds.tOut.version,
+            feeds.climate.version,
+            Math.floor(now / (win / SPARK_W))
+        ].join("|");
+        if (this._spark?.key === key) return this._spark.tpl;
+        const points = this._config.history_points ?? DEFAULT_HISTORY_POINTS;
+        const start = now - win;
+        const series = {
+            t_in: lttb(feeds.tIn.values.points(now), points),
+            t_out: lttb(feeds.tOut.values.points(now), points),
+            setpoint: lttb(feeds.climate.setpoint.points(now), points)
+        };
+        const all = [
+            ...series.t_in,
+            ...series.t_out,
+            ...series.setpoint
+        ];
+        if (!all.length) {
+            this._spark = {
+                key,
+                tpl: html``
+            };
+            return this._spark.tpl;
+        }
+        let lo = Math.min(...all.map((p)=>p.v));
+        let hi = Math.max(...all.map((p)=>p.v));
+        if (hi - lo < 1) {
+            lo -= 0.5;
+            hi += 0.5;
+        }
+        const plotH = SPARK_H - MODE_BAND_H - 2;
+        const x = (t)=>(t - start) / win * SPARK_W;
+        const y = (v)=>1 + (1 - (v - lo) / (hi - lo)) * (plotH - 2);
+        const path = (pts)=>pts.map((p, i)=>`${i ? "L" : "M"}${x(p.t).toFixed(1)},${y(p.v).toFixed(1)}`).join("");
+        const spans = feeds.climate.modes.spans(start);
+        const bands = spans.map((s, i)=>{
+            const color = MODE_COLORS[s.mode];
+            if (!color) return svg``;
+            const x0 = x(s.t);
+            const x1 = i + 1 < spans.length ? x(spans[i + 1].t) : SPARK_W;
+            return svg`<rect x=${x0} y=${SPARK_H - MODE_BAND_H} width=${Math.max(x1 - x0, 0)}
+        height=${MODE_BAND_H} fill=${color}></rect>`;
+        });
+        const tpl = html`
+      <div class="spark">
+        <svg viewBox="0 0 ${SPARK_W} ${SPARK_H}" preserveAspectRatio="none">
+          ${bands}
+          <path class="t-out" d=${path(series.t_out)}></path>
+          <path class="setpoint" d=${path(series.setpoint)}></path>
+          <path class="t-in" d=${path(series.t_in)}></path>
+        </svg>
+        <div class="spark-legend">
+          <span class="t-in">Interna</span>
+          <span class="t-out">Externa</span>
+          <span class="setpoint">Set-point</span>
+          <span>${hi.toFixed(1)} / ${lo.toFixed(1)} °C</span>
+        </div>
       </div>
-    `}_toggle(t){const e=this._state(t),s=t.startsWith("switch.")?"switch":"input_boolean",i="on"===e?"turn_off":"turn_on";this.hass.callService(s,i,{entity_id:t})}};ut.styles=((t,...e)=>{const s=1===t.length?t[0]:e.reduce(((e,s,i)=>e+(t=>{if(!0===t._$cssResult$)return t.cssText;if("number"==typeof t)return t;throw Error("Value passed to 'css' function must be a 'css' function result: "+t+". Use 'unsafeCSS' to pass non-literal values, but take care to ensure page security.")})(s)+t[i+1]),t[0]);return new r(s,t,i)})`
+    `;
+        this._spark = {
+            key,
+            tpl
+        };
+        return tpl;
+    }
+    _toggle(eid) {
+        const st = this._state(eid);
+        const svc = eid.startsWith("switch.") ? "switch" : "input_boolean";
+        const action = st === "on" ? "turn_off" : "turn_on";
+        this.hass.callService(svc, action, {
+            entity_id: eid
+        });
+    }
+    _queueWrite(eid, value) {
+        if (isNaN(value)) return;
+        this._pending = {
+            ...this._pending,
+            [eid]: value
+        };
+        window.clearTimeout(this._writeTimer);
+        this._writeTimer = window.setTimeout(()=>this._flushWrites(), WRITE_DEBOUNCE_MS);
+    }
+    _flushWrites() {
+        window.clearTimeout(this._writeTimer);
+        this._writeTimer = undefined;
+        const pending = this._pending;
+        if (!Object.keys(pending).length) return;
+        this._pending = {};
+        this._sent = {
+            ...this._sent,
+            ...pending
+        };
+        for (const [eid, value] of Object.entries(pending)){
+            if (this._number(eid) === value) continue;
+            this.hass.callService("number", "set_value", {
+                entity_id: eid,
+                value
+            });
+        }
+    }
+};
+ThermoAdaptCard.styles = css`
     ha-card {
       padding: 12px 16px 16px;
       box-sizing: border-box;
@@ -145,4 +617,57 @@ const at={attribute:!0,type:String,converter:g,reflect:!1,hasChanged:v},ht=(t=at
       font-size: 16px;
       font-weight: 600;
     }
-  `,t([lt({attribute:!1})],ut.prototype,"hass",void 0),t([lt({attribute:!1})],ut.prototype,"_config",void 0),t([ct()],ut.prototype,"_enabled",void 0),t([ct()],ut.prototype,"_adaptive",void 0),ut=t([(t=>(e,s)=>{void 0!==s?s.addInitializer((()=>{customElements.define(t,e)})):customElements.define(t,e)})("thermoadapt-card")],ut);export{ut as ThermoAdaptCard};
+    .spark {
+      margin-top: 12px;
+    }
+    .spark svg {
+      width: 100%;
+      height: 60px;
+      display: block;
+    }
+    .spark path {
+      fill: none;
+      stroke-width: 2;
+      vector-effect: non-scaling-stroke;
+    }
+    .spark .t-in {
+      stroke: var(--primary-color);
+      color: var(--primary-color);
+    }
+    .spark .t-out {
+      stroke: var(--secondary-text-color);
+      color: var(--secondary-text-color);
+    }
+    .spark .setpoint {
+      stroke: var(--accent-color);
+      color: var(--accent-color);
+      stroke-dasharray: 6 4;
+    }
+    .spark-legend {
+      display: flex;
+      gap: 12px;
+      font-size: 11px;
+      color: var(--secondary-text-color);
+    }
+  `;
+__decorate([
+    property({
+        attribute: false
+    })
+], ThermoAdaptCard.prototype, "hass", void 0);
+__decorate([
+    property({
+        attribute: false
+    })
+], ThermoAdaptCard.prototype, "_config", void 0);
+__decorate([
+    state()
+], ThermoAdaptCard.prototype, "_pending", void 0);
+__decorate([
+    state()
+], ThermoAdaptCard.prototype, "_historyVersion", void 0);
+ThermoAdaptCard = __decorate([
+    customElement("thermoadapt-card")
+], ThermoAdaptCard);
+
+export { ThermoAdaptCard };
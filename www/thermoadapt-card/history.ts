@@ -0,0 +1,267 @@
+// File: www/thermoadapt-card/history.ts
+// Downsampled history for the card sparkline.
+//
+// One HistoryFeed per (entity, window, points) is shared by every card on the
+// dashboard through a module-level registry.  A feed subscribes to the
+// recorder's `history/stream` only while at least one visible card uses it,
+// and folds every sample into fixed-size time buckets as it arrives – memory
+// per series is bounded by the bucket count, whatever the sensor's update
+// rate.  When a card becomes visible again the stream is resumed from the last
+// buffered sample instead of re-reading the whole window.  Rendering reduces
+// the buckets to the requested number of points with LTTB.
+//
+// ─────────────────────────────────────────────────────────────────────────────
+
+import { HomeAssistant } from "custom-card-helpers";
+
+export interface Point {
+  t: number;                    // ms since epoch
+  v: number;
+}
+
+export interface ModeSpan {
+  t: number;                    // start, ms since epoch
+  mode: string;
+}
+
+// Compressed state rows sent by `history/stream`
+interface StreamRow {
+  s: string;                    // state
+  a?: Record<string, unknown>;  // attributes (first row / attribute domains)
+  lu: number;                   // last updated, s since epoch
+  lc?: number;                  // last changed, when different from lu
+}
+
+interface StreamMessage {
+  states: Record<string, StreamRow[]>;
+}
+
+// Raw buckets per displayed point – LTTB needs some slack to pick from
+const BUCKETS_PER_POINT = 2;
+// Mode changes kept per entity (HVAC modes change a few times per hour)
+const MODE_CAPACITY = 256;
+
+// ────────────────────────────────────────────────────────────────────
+// Ring buffers
+// ────────────────────────────────────────────────────────────────────
+
+/** Fixed number of time buckets covering the window; each keeps a mean. */
+export class BucketRing {
+  private readonly _index: Float64Array;   // absolute bucket number, NaN = empty
+  private readonly _sum: Float64Array;
+  private readonly _count: Uint32Array;
+
+  constructor(public readonly size: number, public readonly width: number) {
+    this._index = new Float64Array(size).fill(NaN);
+    this._sum = new Float64Array(size);
+    this._count = new Uint32Array(size);
+  }
+
+  push(t: number, v: number): boolean {
+    const idx = Math.floor(t / this.width);
+    const slot = idx % this.size;
+    const cur = this._index[slot];
+    if (cur === idx) {
+      this._sum[slot] += v;
+      this._count[slot] += 1;
+      return true;
+    }
+    if (!isNaN(cur) && cur > idx) return false;     // older than the ring
+    this._index[slot] = idx;
+    this._sum[slot] = v;
+    this._count[slot] = 1;
+    return true;
+  }
+
+  /** Bucket means (centre time) of the last `size` buckets up to *now*. */
+  points(now: number): Point[] {
+    const last = Math.floor(now / this.width);
+    const out: Point[] = [];
+    for (let idx = last - this.size + 1; idx <= last; idx++) {
+      const slot = ((idx % this.size) + this.size) % this.size;
+      if (this._index[slot] === idx) {
+        out.push({ t: (idx + 0.5) * this.width, v: this._sum[slot] / this._count[slot] });
+      }
+    }
+    return out;
+  }
+}
+
+/** Last `capacity` state changes (oldest overwritten). */
+export class ChangeRing {
+  private readonly _t: Float64Array;
+  private readonly _mode: string[];
+  private _head = 0;
+  private _len = 0;
+
+  constructor(private readonly capacity: number) {
+    this._t = new Float64Array(capacity);
+    this._mode = new Array<string>(capacity);
+  }
+
+  push(t: number, mode: string): boolean {
+    if (this._len) {
+      const prev = (this._head - 1 + this.capacity) % this.capacity;
+      if (this._mode[prev] === mode || t < this._t[prev]) return false;
+    }
+    this._t[this._head] = t;
+    this._mode[this._head] = mode;
+    this._head = (this._head + 1) % this.capacity;
+    this._len = Math.min(this._len + 1, this.capacity);
+    return true;
+  }
+
+  /** Spans overlapping [since, now], oldest first. */
+  spans(since: number): ModeSpan[] {
+    const out: ModeSpan[] = [];
+    const start = (this._head - this._len + this.capacity) % this.capacity;
+    for (let i = 0; i < this._len; i++) {
+      const k = (start + i) % this.capacity;
+      const t = this._t[k];
+      if (t < since) {
+        out.length = 0;           // only the latest span before the window counts
+        out.push({ t: since, mode: this._mode[k] });
+      } else {
+        out.push({ t, mode: this._mode[k] });
+      }
+    }
+    return out;
+  }
+}
+
+// ────────────────────────────────────────────────────────────────────
+// Largest-Triangle-Three-Buckets downsampling
+// ────────────────────────────────────────────────────────────────────
+
+export function lttb(data: Point[], threshold: number): Point[] {
+  const n = data.length;
+  if (threshold >= n || threshold < 3) return data;
+
+  const out: Point[] = [data[0]];
+  const every = (n - 2) / (threshold - 2);
+  let a = 0;
+
+  for (let i = 0; i < threshold - 2; i++) {
+    // average of the next bucket – the third triangle vertex
+    const nextStart = Math.floor((i + 1) * every) + 1;
+    const nextEnd = Math.min(Math.floor((i + 2) * every) + 1, n);
+    let avgT = 0;
+    let avgV = 0;
+    for (let j = nextStart; j < nextEnd; j++) {
+      avgT += data[j].t;
+      avgV += data[j].v;
+    }
+    const span = Math.max(nextEnd - nextStart, 1);
+    avgT /= span;
+    avgV /= span;
+
+    // point of this bucket forming the largest triangle with a and the average
+    const start = Math.floor(i * every) + 1;
+    const end = Math.floor((i + 1) * every) + 1;
+    const pa = data[a];
+    let maxArea = -1;
+    let pick = start;
+    for (let j = start; j < end; j++) {
+      const area = Math.abs(
+        (pa.t - avgT) * (data[j].v - pa.v) - (pa.t - data[j].t) * (avgV - pa.v)
+      );
+      if (area > maxArea) {
+        maxArea = area;
+        pick = j;
+      }
+    }
+    out.push(data[pick]);
+    a = pick;
+  }
+
+  out.push(data[n - 1]);
+  return out;
+}
+
+// ────────────────────────────────────────────────────────────────────
+// Shared feeds
+// ────────────────────────────────────────────────────────────────────
+
+export class HistoryFeed {
+  readonly values: BucketRing;          // numeric state
+  readonly setpoint: BucketRing;        // `temperature` attribute (climate)
+  readonly modes = new ChangeRing(MODE_CAPACITY);
+  version = 0;                          // bumped on every accepted sample
+
+  private _users = new Set<() => void>();
+  private _unsub?: Promise<() => Promise<void>>;
+  private _lastTs = 0;
+
+  constructor(
+    readonly entityId: string,
+    readonly windowMs: number,
+    points: number,
+  ) {
+    const size = points * BUCKETS_PER_POINT;
+    this.values = new BucketRing(size, windowMs / size);
+    this.setpoint = new BucketRing(size, windowMs / size);
+  }
+
+  attach(hass: HomeAssistant, onChange: () => void): void {
+    this._users.add(onChange);
+    if (this._unsub) return;
+    const since = Math.max(Date.now() - this.windowMs, this._lastTs);
+    const withAttributes = this.entityId.startsWith("climate.");
+    this._unsub = hass.connection.subscribeMessage<StreamMessage>(
+      (msg) => this._ingest(msg),
+      {
+        type: "history/stream",
+        entity_ids: [this.entityId],
+        start_time: new Date(since).toISOString(),
+        minimal_response: !withAttributes,
+        no_attributes: !withAttributes,
+        significant_changes_only: false,
+      },
+    );
+    this._unsub.catch(() => {
+      this._unsub = undefined;          // recorder missing – the card shows no sparkline
+    });
+  }
+
+  detach(onChange: () => void): void {
+    this._users.delete(onChange);
+    if (this._users.size || !this._unsub) return;
+    const unsub = this._unsub;
+    this._unsub = undefined;
+    unsub.then((fn) => fn()).catch(() => undefined);
+  }
+
+  private _ingest(msg: StreamMessage): void {
+    const rows = msg.states?.[this.entityId];
+    if (!rows?.length) return;
+    let changed = false;
+    for (const row of rows) {
+      const t = (row.lc ?? row.lu) * 1000;
+      if (t <= this._lastTs) continue;    // replayed on resume / resubscribe
+      this._lastTs = t;
+      const v = Number(row.s);
+      if (row.s !== "" && !isNaN(v)) changed = this.values.push(t, v) || changed;
+      else if (row.s !== "unavailable" && row.s !== "unknown") {
+        changed = this.modes.push(t, row.s) || changed;
+      }
+      const sp = row.a?.temperature;
+      if (typeof sp === "number") changed = this.setpoint.push(t, sp) || changed;
+    }
+    if (!changed) return;
+    this.version++;
+    this._users.forEach((cb) => cb());
+  }
+}
+
+const FEEDS = new Map<string, HistoryFeed>();
+
+/** Shared feed of *entityId* for the given window (hours) and resolution. */
+export function historyFeed(entityId: string, hours: number, points: number): HistoryFeed {
+  const key = `${entityId}|${hours}|${points}`;
+  let feed = FEEDS.get(key);
+  if (!feed) {
+    feed = new HistoryFeed(entityId, hours * 3600 * 1000, points);
+    FEEDS.set(key, feed);
+  }
+  return feed;
+}
@@ -4,20 +4,27 @@
 // parameters and read-only tiles for temperatures / humidity).
 //
 // Works with the entity naming convention used by the ThermoAdapt integration:
+//   climate.thermoadapt_<zone>        (zone data – see ZoneAttributes)
 //   switch.thermoadapt_<zone>_enabled
 //   input_boolean.thermoadapt_<zone>_dinamico
 //   number.thermoadapt_<zone>_temp_min / _temp_max / _setpoint …
 //   sensor.<your_sensors>
 //
+// Rendering is driven by a fixed set of watched entity ids (computed once per
+// config): the card only re-renders when one of *their* state objects changes,
+// not on every `hass` push.  Slider writes are debounced and coalesced per
+// entity before `number.set_value` is called.
+//
+// With `history_hours` set, a sparkline of indoor / outdoor temperature,
+// adaptive set-point and HVAC mode is drawn from shared, downsampled history
+// feeds (history.ts) that stream only while the card is on screen.
+//
 // ─────────────────────────────────────────────────────────────────────────────
 
-import { css, html, LitElement, TemplateResult } from "lit";
+import { css, html, LitElement, PropertyValues, svg, TemplateResult } from "lit";
 import { customElement, property, state } from "lit/decorators.js";
-import {
-  HomeAssistant,
-  hasConfigOrEntityChanged,
-  LovelaceCard,
-} from "custom-card-helpers";
+import { HomeAssistant, LovelaceCard } from "custom-card-helpers";
+import { historyFeed, HistoryFeed, lttb, Point } from "./history";
 
 interface ThermoAdaptCardConfig {
   zone: string;                 // "sala", "quarto", …
@@ -26,6 +33,49 @@ interface ThermoAdaptCardConfig {
   temp_out: string;             // sensor entity-id
   hum_in?: string;              // optional sensor entity-id
   hum_out?: string;             // optional sensor entity-id
+  history_hours?: number;       // sparkline window (off when unset / 0)
+  history_points?: number;      // points per sparkline series (120)
+}
+
+// Attributes published by climate.thermoadapt_<zone> (extra_state_attributes)
+interface ZoneAttributes {
+  current_temperature?: number | null;
+  current_humidity?: number | null;
+  outdoor_temperature?: number | null;
+  params?: Record<string, number>;
+}
+
+// Entity ids of one card, derived once per config
+interface WatchedEntities {
+  climate: string;
+  enabled: string;
+  adaptive: string;
+  number: (slug: string) => string;
+  primary: string[];            // what the rendering depends on
+  fallback: string[];           // raw sensors, used while the climate entity is missing
+}
+
+// Sliders whose value is not part of the climate entity's `params`
+const UNPUBLISHED_SLIDERS = ["temp_max"];
+
+// Quiet time before a slider value is written (ms)
+const WRITE_DEBOUNCE_MS = 500;
+
+const DEFAULT_HISTORY_POINTS = 120;
+const SPARK_W = 1000;           // viewBox units
+const SPARK_H = 60;
+const MODE_BAND_H = 6;
+const MODE_COLORS: Record<string, string> = {
+  cool: "var(--state-climate-cool-color, #2b9af9)",
+  heat: "var(--state-climate-heat-color, #ff8100)",
+  dry: "var(--state-climate-dry-color, #efbd07)",
+};
+
+// Sparkline feeds of one card
+interface CardFeeds {
+  tIn: HistoryFeed;
+  tOut: HistoryFeed;
+  climate: HistoryFeed;         // set-point (attribute) and HVAC mode (state)
 }
 
 @customElement("thermoadapt-card")
@@ -33,9 +83,25 @@ export class ThermoAdaptCard extends LitElement {
   @property({ attribute: false }) public hass!: HomeAssistant;
   @property({ attribute: false }) private _config!: ThermoAdaptCardConfig;
 
-  // Internal cache (avoid recomputation on tiny hass updates)
-  @state() private _enabled = false;
-  @state() private _adaptive = false;
+  // Values dragged but not written yet (entity_id → value), shown instead of
+  // the stale state so the slider does not jump back
+  @state() private _pending: Record<string, number> = {};
+  // Values written but not yet published back by the climate entity
+  private _sent: Record<string, number> = {};
+
+  private _watched!: WatchedEntities;
+  private _writeTimer?: number;
+
+  // Sparkline – feeds are attached only while the card is visible
+  @state() private _historyVersion = 0;
+  private _feeds?: CardFeeds;
+  private _attached = false;
+  private _visible = false;
+  private _observer?: IntersectionObserver;
+  private _spark?: { key: string; tpl: TemplateResult };
+  private readonly _onHistory = () => {
+    this._historyVersion++;
+  };
 
   // ────────────────────────────────────────────────────────────────────
   // Card API
@@ -48,14 +114,116 @@ export class ThermoAdaptCard extends LitElement {
       title: `ThermoAdapt – ${config.zone.charAt(0).toUpperCase() + config.zone.slice(1)}`,
       ...config,
     } as ThermoAdaptCardConfig;
+    this._watched = this._computeWatched(this._config);
+
+    this._detachFeeds();
+    this._spark = undefined;
+    const hours = this._config.history_hours ?? 0;
+    const points = this._config.history_points ?? DEFAULT_HISTORY_POINTS;
+    this._feeds = hours > 0
+      ? {
+          tIn: historyFeed(this._config.temp_in, hours, points),
+          tOut: historyFeed(this._config.temp_out, hours, points),
+          climate: historyFeed(this._watched.climate, hours, points),
+        }
+      : undefined;
+    this._syncFeeds();
   }
 
   public getCardSize(): number {
-    return 6;
+    return this._feeds ? 8 : 6;
+  }
+
+  public connectedCallback(): void {
+    super.connectedCallback();
+    this._observer = new IntersectionObserver((entries) => {
+      this._visible = entries.some((e) => e.isIntersecting);
+      this._syncFeeds();
+    });
+    this._observer.observe(this);
+  }
+
+  public disconnectedCallback(): void {
+    super.disconnectedCallback();
+    this._flushWrites();            // do not lose a drag made right before leaving
+    this._observer?.disconnect();
+    this._observer = undefined;
+    this._visible = false;
+    this._syncFeeds();
+  }
+
+  private _computeWatched(config: ThermoAdaptCardConfig): WatchedEntities {
+    const z = config.zone;
+    const number = (slug: string) => `number.thermoadapt_${z}_${slug}`;
+    const watched = {
+      climate: `climate.thermoadapt_${z}`,
+      enabled: `switch.thermoadapt_${z}_enabled`,
+      adaptive: `input_boolean.thermoadapt_${z}_dinamico`,
+      number,
+    };
+    // The climate entity covers sensors and sliders; the raw ids only matter
+    // while it is missing (integration not loaded yet).
+    const primary = [
+      watched.climate,
+      watched.enabled,
+      watched.adaptive,
+      ...(config.hum_out ? [config.hum_out] : []),
+      ...UNPUBLISHED_SLIDERS.map(number),
+    ];
+    const fallback = [config.temp_in, config.temp_out, ...(config.hum_in ? [config.hum_in] : [])];
+    return { ...watched, primary, fallback };
+  }
+
+  // ────────────────────────────────────────────────────────────────────
+  // Lifecycle
+  // ────────────────────────────────────────────────────────────────────
+  protected shouldUpdate(changedProps: PropertyValues): boolean {
+    if (!this._config) return false;
+    if (changedProps.has("_config") || changedProps.has("_pending")) return true;
+    if (changedProps.has("_historyVersion")) return true;
+
+    const oldHass = changedProps.get("hass") as HomeAssistant | undefined;
+    if (!oldHass) return changedProps.has("hass");
+    if (oldHass.themes !== this.hass.themes || oldHass.locale !== this.hass.locale) return true;
+
+    // HA replaces the state object of an entity only when it changed
+    const oldStates = oldHass.states;
+    const newStates = this.hass.states;
+    const changed = (eid: string) => oldStates[eid] !== newStates[eid];
+    const w = this._watched;
+    return w.primary.some(changed) || (!this._zone() && w.fallback.some(changed));
   }
 
-  protected shouldUpdate(changedProps: Map<string, unknown>): boolean {
-    return hasConfigOrEntityChanged(this, changedProps, true);
+  protected willUpdate(changedProps: PropertyValues): void {
+    const oldHass = changedProps.get("hass") as HomeAssistant | undefined;
+    const climate = this._watched.climate;
+    if (oldHass && oldHass.states[climate] !== this.hass.states[climate]) {
+      this._sent = {};              // the zone re-published its parameters
+    }
+  }
+
+  protected updated(changedProps: PropertyValues): void {
+    if (changedProps.has("hass") && !changedProps.get("hass")) this._syncFeeds();
+  }
+
+  // ────────────────────────────────────────────────────────────────────
+  // History feeds – streamed only while visible
+  // ────────────────────────────────────────────────────────────────────
+  private _syncFeeds(): void {
+    const want = !!this._feeds && this._visible && !!this.hass;
+    if (want === this._attached) return;
+    if (want) {
+      for (const feed of Object.values(this._feeds!)) feed.attach(this.hass, this._onHistory);
+      this._attached = true;
+    } else {
+      this._detachFeeds();
+    }
+  }
+
+  private _detachFeeds(): void {
+    if (!this._attached || !this._feeds) return;
+    for (const feed of Object.values(this._feeds)) feed.detach(this._onHistory);
+    this._attached = false;
   }
 
   // ────────────────────────────────────────────────────────────────────
@@ -71,36 +239,38 @@ export class ThermoAdaptCard extends LitElement {
     return !isNaN(v) ? v : null;
   }
 
-  // ────────────────────────────────────────────────────────────────────
-  // Lifecycle
-  // ────────────────────────────────────────────────────────────────────
-  protected willUpdate(): void {
-    const z = this._config.zone;
-    this._enabled = this._state(`switch.thermoadapt_${z}_enabled`) === "on";
-    this._adaptive = this._state(`input_boolean.thermoadapt_${z}_dinamico`) === "on";
+  private _zone(): ZoneAttributes | null {
+    const st = this.hass.states[this._watched.climate];
+    return st && st.state !== "unavailable" ? (st.attributes as ZoneAttributes) : null;
+  }
+
+  private _param(zone: ZoneAttributes | null, slug: string): number | null {
+    const eid = this._watched.number(slug);
+    if (eid in this._pending) return this._pending[eid];
+    if (eid in this._sent) return this._sent[eid];
+    const v = zone?.params?.[slug];
+    return v !== undefined && v !== null ? v : this._number(eid);
   }
 
   // ────────────────────────────────────────────────────────────────────
   // Render
   // ────────────────────────────────────────────────────────────────────
   protected render(): TemplateResult {
-    if (!this.hass) return html``;
+    if (!this.hass || !this._config) return html``;
 
-    const z = this._config.zone;
-    const n = (suf: string) => `number.thermoadapt_${z}_${suf}`;
+    const w = this._watched;
+    const zone = this._zone();
+    const enabled = this._state(w.enabled) === "on";
+    const adaptive = this._state(w.adaptive) === "on";
 
-    // Sensors / current values
-    const tIn  = this._number(this._config.temp_in);
-    const tOut = this._number(this._config.temp_out);
-    const hIn  = this._config.hum_in  ? this._number(this._config.hum_in)  : null;
+    // Sensors – from the climate entity, raw sensors as a fallback
+    const tIn  = zone ? zone.current_temperature ?? null : this._number(this._config.temp_in);
+    const tOut = zone ? zone.outdoor_temperature ?? null : this._number(this._config.temp_out);
+    const hIn  = !this._config.hum_in ? null
+      : zone ? zone.current_humidity ?? null : this._number(this._config.hum_in);
     const hOut = this._config.hum_out ? this._number(this._config.hum_out) : null;
 
-    // Slider states
-    const tempMin   = this._number(n("temp_min"));
-    const tempMax   = this._number(n("temp_max"));
-    const setpoint  = this._number(n("setpoint"));
-    const deadband  = this._number(n("deadband"));
-    const humidMax  = this._number(n("humid_max"));
+    const p = (slug: string) => this._param(zone, slug);
 
     return html`
       <ha-card .header=${this._config.title}>
@@ -108,33 +278,34 @@ export class ThermoAdaptCard extends LitElement {
         <div class="row toggles">
           <ha-switch
             aria-label="Enable"
-            .checked=${this._enabled}
-            @click=${() => this._toggle(`switch.thermoadapt_${z}_enabled`)}
+            .checked=${enabled}
+            @click=${() => this._toggle(w.enabled)}
           ></ha-switch>
           <span>Controle</span>
 
           <ha-switch
             aria-label="Adaptive"
-            .checked=${this._adaptive}
-            @click=${() => this._toggle(`input_boolean.thermoadapt_${z}_dinamico`)}
+            .checked=${adaptive}
+            @click=${() => this._toggle(w.adaptive)}
           ></ha-switch>
           <span>Algoritmo</span>
         </div>
 
         <!-- ─── Parameter section (changes by mode) ────────────────── -->
-        ${this._adaptive
+        ${adaptive
           ? html`
               <div class="row sliders">
-                ${this._slider(n("setpoint"), "Set-point Base", setpoint, 18, 30, 0.1)}
-                ${this._slider(n("deadband"), "Dead-band", deadband, 0, 5, 0.1)}
-                ${this._slider(n("humid_max"), "UR Máx", humidMax, 40, 80, 1)}
+                ${this._slider("setpoint", "Set-point Base", p("setpoint"), 18, 30, 0.1)}
+                ${this._slider("deadband", "Dead-band", p("deadband"), 0, 5, 0.1)}
+                ${this._slider("deadband_heat", "Dead-band Aquec.", p("deadband_heat"), 0, 5, 0.1)}
+                ${this._slider("humid_max", "UR Máx", p("humid_max"), 40, 80, 1)}
               </div>
             `
           : html`
               <div class="row sliders">
-                ${this._slider(n("temp_min"), "Temp Min", tempMin, 16, 30, 0.5)}
-                ${this._slider(n("temp_max"), "Temp Máx", tempMax, 20, 40, 0.5)}
-                ${this._slider(n("setpoint"), "Alvo", setpoint, 18, 30, 0.1)}
+                ${this._slider("temp_min", "Temp Min", p("temp_min"), 16, 30, 0.5)}
+                ${this._slider("temp_max", "Temp Máx", p("temp_max"), 20, 40, 0.5)}
+                ${this._slider("setpoint", "Alvo", p("setpoint"), 18, 30, 0.1)}
               </div>
             `}
 
@@ -145,6 +316,8 @@ export class ThermoAdaptCard extends LitElement {
           ${hIn !== null ? this._tile("UR Interna", hIn, "%") : ""}
           ${hOut !== null ? this._tile("UR Externa", hOut, "%") : ""}
         </div>
+
+        ${this._feeds ? this._sparkline(this._feeds) : ""}
       </ha-card>
     `;
   }
@@ -152,8 +325,9 @@ export class ThermoAdaptCard extends LitElement {
   // ────────────────────────────────────────────────────────────────────
   // Helpers – UI widgets
   // ────────────────────────────────────────────────────────────────────
-  private _slider(eid: string, label: string, value: number | null, min: number, max: number, step: number) {
+  private _slider(slug: string, label: string, value: number | null, min: number, max: number, step: number) {
     if (value === null) return html``;
+    const eid = this._watched.number(slug);
     return html`
       <div class="slider-block">
         <span class="lbl">${label}</span>
@@ -162,11 +336,7 @@ export class ThermoAdaptCard extends LitElement {
           .max=${max}
           .step=${step}
           .value=${value}
-          @change=${(ev: Event) =>
-            this.hass.callService("input_number", "set_value", {
-              entity_id: eid,
-              value: (ev.target as HTMLInputElement).value,
-            })}
+          @change=${(ev: Event) => this._queueWrite(eid, Number((ev.target as HTMLInputElement).value))}
         ></ha-slider>
         <span class="val">${value}</span>
       </div>
@@ -182,6 +352,70 @@ export class ThermoAdaptCard extends LitElement {
     `;
   }
 
+  private _sparkline(feeds: CardFeeds): TemplateResult {
+    // rebuilt only on new samples or when the window moved by one pixel
+    const now = Date.now();
+    const win = feeds.climate.windowMs;
+    const key = [
+      feeds.tIn.version, feeds.tOut.version, feeds.climate.version, Math.floor(now / (win / SPARK_W)),
+    ].join("|");
+    if (this._spark?.key === key) return this._spark.tpl;
+
+    const points = this._config.history_points ?? DEFAULT_HISTORY_POINTS;
+    const start = now - win;
+    const series = {
+      t_in: lttb(feeds.tIn.values.points(now), points),
+      t_out: lttb(feeds.tOut.values.points(now), points),
+      setpoint: lttb(feeds.climate.setpoint.points(now), points),
+    };
+    const all = [...series.t_in, ...series.t_out, ...series.setpoint];
+    if (!all.length) {
+      this._spark = { key, tpl: html`` };
+      return this._spark.tpl;
+    }
+
+    let lo = Math.min(...all.map((p) => p.v));
+    let hi = Math.max(...all.map((p) => p.v));
+    if (hi - lo < 1) {
+      lo -= 0.5;
+      hi += 0.5;
+    }
+    const plotH = SPARK_H - MODE_BAND_H - 2;
+    const x = (t: number) => ((t - start) / win) * SPARK_W;
+    const y = (v: number) => 1 + (1 - (v - lo) / (hi - lo)) * (plotH - 2);
+    const path = (pts: Point[]) =>
+      pts.map((p, i) => `${i ? "L" : "M"}${x(p.t).toFixed(1)},${y(p.v).toFixed(1)}`).join("");
+
+    const spans = feeds.climate.modes.spans(start);
+    const bands = spans.map((s, i) => {
+      const color = MODE_COLORS[s.mode];
+      if (!color) return svg``;
+      const x0 = x(s.t);
+      const x1 = i + 1 < spans.length ? x(spans[i + 1].t) : SPARK_W;
+      return svg`<rect x=${x0} y=${SPARK_H - MODE_BAND_H} width=${Math.max(x1 - x0, 0)}
+        height=${MODE_BAND_H} fill=${color}></rect>`;
+    });
+
+    const tpl = html`
+      <div class="spark">
+        <svg viewBox="0 0 ${SPARK_W} ${SPARK_H}" preserveAspectRatio="none">
+          ${bands}
+          <path class="t-out" d=${path(series.t_out)}></path>
+          <path class="setpoint" d=${path(series.setpoint)}></path>
+          <path class="t-in" d=${path(series.t_in)}></path>
+        </svg>
+        <div class="spark-legend">
+          <span class="t-in">Interna</span>
+          <span class="t-out">Externa</span>
+          <span class="setpoint">Set-point</span>
+          <span>${hi.toFixed(1)} / ${lo.toFixed(1)} °C</span>
+        </div>
+      </div>
+    `;
+    this._spark = { key, tpl };
+    return tpl;
+  }
+
   private _toggle(eid: string) {
     const st = this._state(eid);
     const svc = eid.startsWith("switch.") ? "switch" : "input_boolean";
@@ -189,6 +423,29 @@ export class ThermoAdaptCard extends LitElement {
     this.hass.callService(svc, action, { entity_id: eid });
   }
 
+  // ────────────────────────────────────────────────────────────────────
+  // Slider writes – debounced, latest value per entity wins
+  // ────────────────────────────────────────────────────────────────────
+  private _queueWrite(eid: string, value: number): void {
+    if (isNaN(value)) return;
+    this._pending = { ...this._pending, [eid]: value };
+    window.clearTimeout(this._writeTimer);
+    this._writeTimer = window.setTimeout(() => this._flushWrites(), WRITE_DEBOUNCE_MS);
+  }
+
+  private _flushWrites(): void {
+    window.clearTimeout(this._writeTimer);
+    this._writeTimer = undefined;
+    const pending = this._pending;
+    if (!Object.keys(pending).length) return;
+    this._pending = {};
+    this._sent = { ...this._sent, ...pending };
+    for (const [eid, value] of Object.entries(pending)) {
+      if (this._number(eid) === value) continue;   // already there
+      this.hass.callService("number", "set_value", { entity_id: eid, value });
+    }
+  }
+
   // ────────────────────────────────────────────────────────────────────
   // Styles
   // ────────────────────────────────────────────────────────────────────
@@ -242,6 +499,38 @@ export class ThermoAdaptCard extends LitElement {
       font-size: 16px;
       font-weight: 600;
     }
+    .spark {
+      margin-top: 12px;
+    }
+    .spark svg {
+      width: 100%;
+      height: 60px;
+      display: block;
+    }
+    .spark path {
+      fill: none;
+      stroke-width: 2;
+      vector-effect: non-scaling-stroke;
+    }
+    .spark .t-in {
+      stroke: var(--primary-color);
+      color: var(--primary-color);
+    }
+    .spark .t-out {
+      stroke: var(--secondary-text-color);
+      color: var(--secondary-text-color);
+    }
+    .spark .setpoint {
+      stroke: var(--accent-color);
+      color: var(--accent-color);
+      stroke-dasharray: 6 4;
+    }
+    .spark-legend {
+      display: flex;
+      gap: 12px;
+      font-size: 11px;
+      color: var(--secondary-text-color);
+    }
   `;
 }
 